@@ -4,7 +4,7 @@ Fake AI Adapter for Testing
 Returns deterministic placeholder data without external API calls.
 Enables fast testing and demo without API keys.
 """
-from typing import Dict, List
+from typing import BinaryIO, Dict, List, Optional
 
 
 class FakeAIAdapter:
@@ -45,6 +45,15 @@ class FakeAIAdapter:
         # In real implementation, would use PIL or OpenAI API
         return image  # Fake: just return image as-is
 
+    def overlay_text_to(
+        self, image: bytes, text: str, aspect_ratio: str, out: BinaryIO, thumbnail: Optional[BinaryIO] = None
+    ) -> None:
+        """Simulate text overlay into a stream (writes image unchanged, also as the thumbnail; no text box)."""
+        overlaid = self.overlay_text(image, text, aspect_ratio)
+        out.write(overlaid)
+        if thumbnail is not None:
+            thumbnail.write(overlaid)  # Placeholder is already 1x1
+
     def understand_brand(self, brand_assets: List[str]) -> Dict[str, any]:
         """Return hardcoded brand guidelines."""
         self.call_count += 1
@@ -5,12 +5,13 @@ Implements IAIAdapter protocol for real image generation via OpenAI API.
 Uses gpt-image-1 model (GPT Image Generation).
 """
 import base64
-from typing import Dict, List
+from typing import BinaryIO, Dict, List, Optional, Tuple
 from openai import OpenAI
 from PIL import Image, ImageDraw, ImageFont
 from io import BytesIO
 
 from app.infrastructure.config import settings
+from app.infrastructure.repositories.asset.thumbnail import write_thumbnail
 
 
 class OpenAIImageAdapter:
@@ -91,6 +92,38 @@ class OpenAIImageAdapter:
         Returns:
             Image with text overlay (PNG format)
         """
+        output = BytesIO()
+        self.overlay_text_to(image, text, aspect_ratio, output)
+        return output.getvalue()
+
+    def overlay_text_to(
+        self, image: bytes, text: str, aspect_ratio: str, out: BinaryIO, thumbnail: Optional[BinaryIO] = None
+    ) -> Tuple[int, int, int, int]:
+        """
+        Add campaign message text overlay and encode the PNG directly into `out`.
+
+        Writing into a storage stream avoids the BytesIO buffer + bytes copy
+        that overlay_text() needs, so print-size renditions do not double RSS.
+
+        Args:
+            image: Base image bytes
+            text: Localized campaign slogan
+            aspect_ratio: Image dimensions
+            out: Writable binary stream
+            thumbnail: Optional stream for a vectorization thumbnail, built from
+                the decoded pixels instead of re-reading the encoded PNG
+
+        Returns:
+            Text bounding box (left, top, right, bottom) in image pixels, outline included
+        """
+        img, text_bbox = self._draw_overlay(image, text)
+        img.save(out, format="PNG")
+        if thumbnail is not None:
+            write_thumbnail(img, thumbnail, size=settings.WEAVIATE_THUMBNAIL_SIZE)
+        return text_bbox
+
+    def _draw_overlay(self, image: bytes, text: str) -> Tuple[Image.Image, Tuple[int, int, int, int]]:
+        """Decode image and draw slogan text (bottom center); returns the image and the text box."""
         # Load image
         img = Image.open(BytesIO(image))
         draw = ImageDraw.Draw(img)
@@ -125,10 +158,10 @@ class OpenAIImageAdapter:
         # Main text
         draw.text((x, y), text, font=font, fill=text_color)
 
-        # Convert back to bytes
-        output = BytesIO()
-        img.save(output, format="PNG")
-        return output.getvalue()
+        # Drawn area (glyph box + outline), clamped to the image
+        left, top, right, bottom = draw.textbbox((x, y), text, font=font)
+        text_bbox = (max(0, left - 2), max(0, top - 2), min(width, right + 2), min(height, bottom + 2))
+        return img, text_bbox
 
     def understand_brand(self, brand_assets: List[str]) -> Dict[str, any]:
         """
@@ -7,7 +7,7 @@ Defines contract for AI services:
 - Brand understanding (Claude Vision)
 - Localization (Claude Multilingual)
 """
-from typing import Protocol, Dict, List
+from typing import Protocol, Dict, List, BinaryIO, Optional, Tuple
 
 
 class IAIAdapter(Protocol):
@@ -41,6 +41,25 @@ class IAIAdapter(Protocol):
         """
         ...
 
+    def overlay_text_to(
+        self, image: bytes, text: str, aspect_ratio: str, out: BinaryIO, thumbnail: Optional[BinaryIO] = None
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Add text overlay and encode the result straight into a writable stream.
+
+        Args:
+            image: Base image bytes
+            text: Localized campaign slogan
+            aspect_ratio: Image dimensions
+            out: Writable binary stream (e.g., IStorageAdapter.open_write)
+            thumbnail: Optional stream that also receives a vectorization thumbnail
+                of the overlaid image (JPEG, WEAVIATE_THUMBNAIL_SIZE px)
+
+        Returns:
+            Text bounding box (left, top, right, bottom) in image pixels, or None if no text was drawn
+        """
+        ...
+
     def understand_brand(self, brand_assets: List[str]) -> Dict[str, any]:
         """
         Analyze brand assets to extract brand guidelines.
@@ -0,0 +1,134 @@
+"""
+Cached Embedding Adapter
+
+Content-hash embedding cache over any IEmbeddingAdapter:
+- Each text/image is keyed by SHA-256 of (embedder namespace, kind, content)
+- Cached vectors are stored as float32 blobs in a small SQLite table, so they
+  survive restarts: re-indexing never re-embeds unchanged images
+- Only cache misses reach the inner embedder, in one batch per call;
+  duplicates within a batch are embedded once
+"""
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from app.adapters.embedding.protocol import IEmbeddingAdapter
+
+
+class CachedEmbeddingAdapter:
+    """Embedding adapter decorator caching vectors by content hash."""
+
+    def __init__(
+        self,
+        inner: IEmbeddingAdapter,
+        db_path: Optional[Path] = None,
+        namespace: Optional[str] = None,
+    ):
+        """
+        Args:
+            inner: Embedder to delegate cache misses to
+            db_path: SQLite cache file (default: in-memory, per process)
+            namespace: Model identity mixed into keys, so switching models never
+                serves stale vectors (default: inner class name and dimensions)
+        """
+        self.inner = inner
+        self.dimensions = inner.dimensions
+        self.namespace = namespace or f"{type(inner).__name__}:{inner.dimensions}"
+
+        if db_path is not None:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(db_path) if db_path else ":memory:", check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                " digest TEXT PRIMARY KEY,"
+                " vector BLOB NOT NULL)"
+            )
+        self._hits = 0
+        self._misses = 0
+
+    def embed_texts(self, texts: List[str]) -> np.ndarray:
+        """Embed texts, calling the inner embedder only for unseen texts."""
+        return self._embed("text", [t.encode("utf-8") for t in texts], texts, self.inner.embed_texts)
+
+    def embed_images(self, images: List[bytes]) -> np.ndarray:
+        """Embed images, calling the inner embedder only for unseen content."""
+        return self._embed("image", images, images, self.inner.embed_images)
+
+    def stats(self) -> Dict[str, float]:
+        """Hit-rate metrics and number of cached vectors."""
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total if total else 0.0,
+                "entries": entries,
+            }
+
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._db.close()
+
+    def _embed(self, kind: str, payloads: List[bytes], inputs: list, embed) -> np.ndarray:
+        """Look up every input by digest, embed the distinct misses in one batch, store them."""
+        vectors = np.zeros((len(payloads), self.dimensions), dtype=np.float32)
+        if not payloads:
+            return vectors
+        digests = [self._digest(kind, payload) for payload in payloads]
+
+        found = self._load(set(digests))
+        missing: Dict[str, int] = {}  # digest -> first row needing it
+        for row, digest in enumerate(digests):
+            if digest in found:
+                vectors[row] = found[digest]
+            elif digest not in missing:
+                missing[digest] = row
+
+        if missing:
+            fresh = np.asarray(embed([inputs[row] for row in missing.values()]), dtype=np.float32)
+            computed = dict(zip(missing, fresh))
+            self._store(computed)
+            for row, digest in enumerate(digests):
+                if digest in computed:
+                    vectors[row] = computed[digest]
+
+        with self._lock:
+            self._hits += len(payloads) - len(missing)
+            self._misses += len(missing)
+        return vectors
+
+    def _digest(self, kind: str, payload: bytes) -> str:
+        h = hashlib.sha256(f"{self.namespace}\0{kind}\0".encode("utf-8"))
+        h.update(payload)
+        return h.hexdigest()
+
+    def _load(self, digests: set) -> Dict[str, np.ndarray]:
+        keys = list(digests)
+        found = {}
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                for digest, blob in self._db.execute(
+                    f"SELECT digest, vector FROM embeddings WHERE digest IN ({placeholders})", chunk
+                ):
+                    vector = np.frombuffer(blob, dtype=np.float32)
+                    if len(vector) == self.dimensions:
+                        found[digest] = vector
+        return found
+
+    def _store(self, vectors: Dict[str, np.ndarray]) -> None:
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO embeddings (digest, vector) VALUES (?, ?)",
+                [(digest, np.ascontiguousarray(v, dtype=np.float32).tobytes()) for digest, v in vectors.items()],
+            )
@@ -0,0 +1,78 @@
+"""
+CLIP Inference Embedding Adapter
+
+Implements IEmbeddingAdapter against the multi2vec-clip inference container
+(the same model Weaviate's vectorizer module calls), but from the application:
+- Many images/texts per request (POST /vectorize), chunked by batch_size
+- Vectors are supplied to Weaviate on insert, so writes no longer wait on
+  server-side vectorization one object at a time
+- Images are downscaled to CLIP's input size before upload
+"""
+import base64
+import json
+import urllib.request
+from typing import List, Optional
+
+import numpy as np
+
+from app.infrastructure.config import settings
+from app.infrastructure.repositories.asset.thumbnail import make_thumbnail
+
+
+CLIP_DIMENSIONS = 512  # ViT-B/32
+
+
+class ClipInferenceEmbeddingAdapter:
+    """Real embedder using the multi2vec-clip inference API."""
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        timeout: float = 60.0,
+        dimensions: int = CLIP_DIMENSIONS,
+    ):
+        """
+        Args:
+            url: Inference API base URL (default: settings.CLIP_INFERENCE_URL)
+            batch_size: Inputs per request (default: settings.EMBEDDING_BATCH_SIZE)
+            timeout: Per-request timeout in seconds
+            dimensions: Model output size
+        """
+        self.url = (url or settings.CLIP_INFERENCE_URL).rstrip("/")
+        self.batch_size = batch_size or settings.EMBEDDING_BATCH_SIZE
+        self.timeout = timeout
+        self.dimensions = dimensions
+
+    def embed_texts(self, texts: List[str]) -> np.ndarray:
+        """Embed texts with the CLIP text tower, batch_size per request."""
+        return self._vectorize("texts", "textVectors", list(texts))
+
+    def embed_images(self, images: List[bytes]) -> np.ndarray:
+        """Embed images with the CLIP image tower, batch_size per request."""
+        encoded = [
+            base64.b64encode(make_thumbnail(data, size=settings.WEAVIATE_THUMBNAIL_SIZE)).decode("ascii")
+            for data in images
+        ]
+        return self._vectorize("images", "imageVectors", encoded)
+
+    def _vectorize(self, field: str, result_field: str, inputs: List[str]) -> np.ndarray:
+        vectors = np.zeros((len(inputs), self.dimensions), dtype=np.float32)
+        for start in range(0, len(inputs), self.batch_size):
+            chunk = inputs[start:start + self.batch_size]
+            payload = {"texts": [], "images": []}
+            payload[field] = chunk
+            response = self._post("/vectorize", payload)
+            vectors[start:start + len(chunk)] = np.asarray(response[result_field], dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms > 0, norms, 1.0)
+
+    def _post(self, path: str, payload: dict) -> dict:
+        request = urllib.request.Request(
+            self.url + path,
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.loads(response.read())
@@ -0,0 +1,69 @@
+"""
+Hashing Embedding Adapter
+
+Deterministic, dependency-free stand-in for a CLIP embedder:
+- Texts: feature hashing of lower-cased tokens (same words -> same vector)
+- Images: 16x16 grayscale thumbnail projected with a fixed random matrix
+  (visually similar images -> nearby vectors)
+
+No model weights, no network; identical inputs always give identical vectors.
+"""
+import hashlib
+import re
+from io import BytesIO
+from typing import List
+
+import numpy as np
+from PIL import Image
+
+
+TOKEN_RE = re.compile(r"[\w:]+")
+IMAGE_SIDE = 16
+PROJECTION_SEED = 1337
+
+
+class HashingEmbeddingAdapter:
+    """Deterministic embedder implementing IEmbeddingAdapter protocol."""
+
+    def __init__(self, dimensions: int = 512):
+        self.dimensions = dimensions
+        rng = np.random.default_rng(PROJECTION_SEED)
+        self._projection = rng.standard_normal(
+            (IMAGE_SIDE * IMAGE_SIDE, dimensions)
+        ).astype(np.float32)
+
+    def embed_texts(self, texts: List[str]) -> np.ndarray:
+        """Hash each token into a signed bucket; one row per text."""
+        vectors = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in TOKEN_RE.findall(text.lower()):
+                digest = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "big")
+                sign = 1.0 if digest & 1 else -1.0
+                vectors[row, (digest >> 1) % self.dimensions] += sign
+        return _normalize(vectors)
+
+    def embed_images(self, images: List[bytes]) -> np.ndarray:
+        """Project centered grayscale thumbnails (whole batch in one matmul)."""
+        pixels = np.zeros((len(images), IMAGE_SIDE * IMAGE_SIDE), dtype=np.float32)
+        for row, data in enumerate(images):
+            pixels[row] = self._pixels(data)
+        pixels -= pixels.mean(axis=1, keepdims=True)
+        return _normalize(pixels @ self._projection)
+
+    @staticmethod
+    def _pixels(data: bytes) -> np.ndarray:
+        """Grayscale thumbnail in [0, 1]; undecodable bytes fall back to a byte hash."""
+        try:
+            with Image.open(BytesIO(data)) as img:
+                thumb = img.convert("L").resize((IMAGE_SIDE, IMAGE_SIDE), Image.BILINEAR)
+                return np.asarray(thumb, dtype=np.float32).ravel() / 255.0
+        except Exception:
+            seed = int.from_bytes(hashlib.sha256(data).digest()[:8], "big")
+            return np.random.default_rng(seed).random(IMAGE_SIDE * IMAGE_SIDE, dtype=np.float32)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize rows (zero rows stay zero)."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.divide(vectors, norms, out=vectors, where=norms > 0)
+    return vectors
@@ -0,0 +1,40 @@
+"""
+Embedding Adapter Protocol (Interface)
+
+Defines contract for turning assets into vectors for similarity search:
+- Deterministic hashing embedder (local stand-in for tests and fake mode)
+- CLIP-style image/text models (real)
+"""
+from typing import List, Protocol
+
+import numpy as np
+
+
+class IEmbeddingAdapter(Protocol):
+    """Interface for batch text/image embedders (rows are L2-normalized float32)."""
+
+    dimensions: int
+
+    def embed_texts(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed a batch of texts.
+
+        Args:
+            texts: Input strings
+
+        Returns:
+            float32 array of shape (len(texts), dimensions)
+        """
+        ...
+
+    def embed_images(self, images: List[bytes]) -> np.ndarray:
+        """
+        Embed a batch of encoded images (PNG/JPEG bytes).
+
+        Args:
+            images: Encoded image bytes
+
+        Returns:
+            float32 array of shape (len(images), dimensions)
+        """
+        ...
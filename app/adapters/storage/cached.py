@@ -0,0 +1,329 @@
+"""
+Cached Storage Adapter
+
+Read-through tiered cache wrapping any IStorageAdapter:
+- Memory tier: LRU with a byte budget
+- Disk tier: LRU with a byte budget (entries demoted from memory land here);
+  files are named by key hash and re-indexed on start, so the tier survives
+  restarts and can be shared by processes (CLI + Streamlit) on the same dir;
+  disk hits are copied into memory (the file stays), and objects larger than
+  the memory budget are served from disk without promotion
+
+Entries are served without touching the inner store for `revalidate_after`
+seconds. After that they are revalidated with a conditional GET (ETag) when the
+inner adapter supports `load_conditional`, so unchanged objects are never
+re-downloaded. `save` invalidates the path in both tiers.
+
+`url_for` results are memoized for half their TTL so browsers see stable URLs
+across Streamlit reruns and can reuse their own HTTP cache.
+"""
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from io import BytesIO
+from typing import BinaryIO, Dict, List, Optional
+
+from app.adapters.storage.protocol import IStorageAdapter
+from app.adapters.storage.streams import StorageWriter
+
+
+@dataclass
+class _CacheEntry:
+    """Bookkeeping for a cached object."""
+    size: int
+    etag: Optional[str]
+    validated_at: float
+
+
+class CachedStorageAdapter:
+    """Storage adapter decorator with memory + disk read-through caching."""
+
+    def __init__(
+        self,
+        inner: IStorageAdapter,
+        memory_budget_bytes: int = 64 * 1024 * 1024,
+        disk_dir: Optional[Path] = None,
+        disk_budget_bytes: int = 512 * 1024 * 1024,
+        revalidate_after: float = 60.0,
+    ):
+        self.inner = inner
+        self.memory_budget_bytes = memory_budget_bytes
+        self.disk_budget_bytes = disk_budget_bytes if disk_dir else 0
+        self.revalidate_after = revalidate_after
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_meta: Dict[str, _CacheEntry] = {}
+        self._memory_bytes = 0
+        self._disk: "OrderedDict[str, _CacheEntry]" = OrderedDict()  # key hash -> entry
+        self._disk_bytes = 0
+        self._urls: Dict[tuple, tuple] = {}
+        self._lock = threading.RLock()
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "revalidated": 0,
+            "not_modified": 0,
+        }
+
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            self._load_disk_index()
+
+    # ------------------------------------------------------------------
+    # IStorageAdapter
+    # ------------------------------------------------------------------
+
+    def save(self, path: str, content: bytes) -> str:
+        """Write through to the inner store and invalidate cached copies."""
+        self.invalidate(path)
+        return self.inner.save(path, content)
+
+    def load(self, path: str) -> bytes:
+        """Load from memory, then disk, then the inner store."""
+        cached, entry = self._lookup(path)
+        if cached is not None:
+            if self._is_fresh(entry):
+                return cached
+            return self._revalidate(path, cached, entry)
+
+        with self._lock:
+            self._stats["misses"] += 1
+        content, etag = self._fetch(path, None)
+        self._store(path, content, etag)
+        return content
+
+    def open_write(self, path: str) -> StorageWriter:
+        """Stream through to the inner store, invalidating cached copies."""
+        self.invalidate(path)
+
+        def commit(inner_writer: StorageWriter) -> str:
+            inner_writer.close()
+            self.invalidate(path)  # Drop anything cached while the write was open
+            return inner_writer.uri
+
+        return StorageWriter(
+            self.inner.open_write(path),
+            commit=commit,
+            abort=lambda inner_writer: inner_writer.abort(),
+        )
+
+    def open_read(self, path: str) -> BinaryIO:
+        """Serve from the memory tier when present; otherwise stream from the inner store."""
+        with self._lock:
+            if path in self._memory and self._is_fresh(self._memory_meta[path]):
+                self._memory.move_to_end(path)
+                self._stats["memory_hits"] += 1
+                return BytesIO(self._memory[path])
+        return self.inner.open_read(path)
+
+    def exists(self, path: str) -> bool:
+        """Check existence (cached objects answer without a round trip)."""
+        with self._lock:
+            disk_entry = self._disk.get(self._key(path))
+            if path in self._memory or (disk_entry is not None and self._is_fresh(disk_entry)):
+                return True
+        return self.inner.exists(path)
+
+    def list(self, prefix: str) -> List[str]:
+        """List is always delegated (listings are not cached)."""
+        return self.inner.list(prefix)
+
+    def url_for(self, path: str, ttl: int = 3600) -> str:
+        """Delegate URL signing, reusing a URL until half its TTL has elapsed."""
+        now = time.monotonic()
+        with self._lock:
+            memo = self._urls.get((path, ttl))
+            if memo and memo[1] > now:
+                return memo[0]
+
+        url = self.inner.url_for(path, ttl)
+        with self._lock:
+            self._urls[(path, ttl)] = (url, now + ttl / 2)
+        return url
+
+    # ------------------------------------------------------------------
+    # Cache management
+    # ------------------------------------------------------------------
+
+    def invalidate(self, path: str) -> None:
+        """Drop a path from both tiers."""
+        with self._lock:
+            self._drop_memory(path)
+            self._drop_disk(path)
+            for key in [k for k in self._urls if k[0] == path]:
+                del self._urls[key]
+
+    def stats(self) -> Dict[str, float]:
+        """Hit-rate metrics and tier occupancy."""
+        with self._lock:
+            stats = dict(self._stats)
+            hits = stats["memory_hits"] + stats["disk_hits"]
+            lookups = hits + stats["misses"]
+            stats["hit_rate"] = hits / lookups if lookups else 0.0
+            stats["memory_bytes"] = self._memory_bytes
+            stats["memory_entries"] = len(self._memory)
+            stats["disk_bytes"] = self._disk_bytes
+            stats["disk_entries"] = len(self._disk)
+            return stats
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _lookup(self, path: str):
+        """Return (content, entry) from the fastest tier holding the path."""
+        with self._lock:
+            if path in self._memory:
+                self._memory.move_to_end(path)
+                self._stats["memory_hits"] += 1
+                return self._memory[path], self._memory_meta[path]
+
+            key = self._key(path)
+            if key not in self._disk:
+                self._adopt_disk_file(key)  # Written by another process sharing the dir
+            if key in self._disk:
+                entry = self._disk[key]
+                try:
+                    content = self._disk_path(path).read_bytes()
+                except FileNotFoundError:
+                    self._drop_disk(path)
+                    return None, None
+                self._stats["disk_hits"] += 1
+                self._disk.move_to_end(key)
+                if entry.size <= self.memory_budget_bytes:
+                    self._put_memory(path, content, entry)
+                return content, entry
+
+        return None, None
+
+    def _is_fresh(self, entry: _CacheEntry) -> bool:
+        return time.monotonic() - entry.validated_at < self.revalidate_after
+
+    def _revalidate(self, path: str, cached: bytes, entry: _CacheEntry) -> bytes:
+        """Conditional GET against the inner store; reuse bytes if unchanged."""
+        if not hasattr(self.inner, "load_conditional"):
+            # No way to revalidate cheaply - rely on save() invalidation
+            entry.validated_at = time.monotonic()
+            return cached
+
+        with self._lock:
+            self._stats["revalidated"] += 1
+        content, etag = self._fetch(path, entry.etag)
+        if content is None:
+            with self._lock:
+                self._stats["not_modified"] += 1
+                entry.validated_at = time.monotonic()
+            return cached
+
+        self._store(path, content, etag)
+        return content
+
+    def _fetch(self, path: str, etag: Optional[str]):
+        """Load from the inner store, conditionally when supported."""
+        if hasattr(self.inner, "load_conditional"):
+            return self.inner.load_conditional(path, etag)
+        return self.inner.load(path), None
+
+    def _store(self, path: str, content: bytes, etag: Optional[str]) -> None:
+        entry = _CacheEntry(size=len(content), etag=etag, validated_at=time.monotonic())
+        with self._lock:
+            self._drop_memory(path)
+            self._drop_disk(path)
+            if entry.size <= self.memory_budget_bytes:
+                self._put_memory(path, content, entry)
+            else:
+                self._put_disk(path, content, entry)
+
+    def _put_memory(self, path: str, content: bytes, entry: _CacheEntry) -> None:
+        self._memory[path] = content
+        self._memory_meta[path] = entry
+        self._memory_bytes += entry.size
+
+        # Demote least recently used entries to disk
+        while self._memory_bytes > self.memory_budget_bytes and self._memory:
+            old_path, old_content = self._memory.popitem(last=False)
+            old_entry = self._memory_meta.pop(old_path)
+            self._memory_bytes -= old_entry.size
+            self._put_disk(old_path, old_content, old_entry)
+
+    def _put_disk(self, path: str, content: bytes, entry: _CacheEntry) -> None:
+        if self.disk_dir is None or entry.size > self.disk_budget_bytes:
+            return
+
+        key = self._key(path)
+        known = self._disk.pop(key, None)
+        if known is not None:
+            self._disk_bytes -= known.size
+            if known.etag and known.etag == entry.etag:
+                # Demoted copy of a file that is still on disk: no rewrite
+                self._disk[key] = entry
+                self._disk_bytes += entry.size
+                self._evict_disk()
+                return
+
+        target = self._disk_path(path)
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(content)
+        os.replace(tmp, target)
+        etag_file = target.with_suffix(".etag")
+        if entry.etag:
+            etag_file.write_text(entry.etag)
+        else:
+            etag_file.unlink(missing_ok=True)
+        self._disk[key] = entry
+        self._disk_bytes += entry.size
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        while self._disk_bytes > self.disk_budget_bytes and self._disk:
+            self._drop_disk_key(next(iter(self._disk)))
+
+    def _load_disk_index(self) -> None:
+        """Index files left by earlier runs (oldest first); they are revalidated before use."""
+        files = sorted(self.disk_dir.glob("*.bin"), key=lambda f: f.stat().st_mtime)
+        for file in files:
+            self._adopt_disk_file(file.stem)
+        self._evict_disk()
+
+    def _adopt_disk_file(self, key: str) -> None:
+        """Index an existing cache file by key hash (unknown freshness: revalidate on first hit)."""
+        if self.disk_dir is None:
+            return
+        file = self.disk_dir / f"{key}.bin"
+        try:
+            size = file.stat().st_size
+        except FileNotFoundError:
+            return
+        etag_file = file.with_suffix(".etag")
+        etag = etag_file.read_text() if etag_file.exists() else None
+        self._disk[key] = _CacheEntry(size=size, etag=etag, validated_at=float("-inf"))
+        self._disk_bytes += size
+
+    def _drop_memory(self, path: str) -> None:
+        if path in self._memory:
+            del self._memory[path]
+            self._memory_bytes -= self._memory_meta.pop(path).size
+
+    def _drop_disk(self, path: str) -> None:
+        self._drop_disk_key(self._key(path))
+
+    def _drop_disk_key(self, key: str) -> None:
+        entry = self._disk.pop(key, None)
+        if entry is not None:
+            self._disk_bytes -= entry.size
+            file = self.disk_dir / f"{key}.bin"
+            file.unlink(missing_ok=True)
+            file.with_suffix(".etag").unlink(missing_ok=True)
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return hashlib.sha1(path.encode()).hexdigest()
+
+    def _disk_path(self, path: str) -> Path:
+        return self.disk_dir / f"{self._key(path)}.bin"
@@ -0,0 +1,253 @@
+"""
+Content-Addressed Storage Adapter
+
+Deduplicating layer over any IStorageAdapter:
+- Blobs are stored once under their SHA-256 ("blobs/ab/abcdef...")
+- Logical paths map to digests through a small SQLite reference table
+- Each blob carries a refcount; saving bytes the table already knows skips the
+  upload without a store round trip (the store is only asked about unknown
+  digests, e.g. blobs that outlived a deleted table)
+- The reference table lives with the store: inside the root of a local store,
+  and tied to any other store by a marker object, so wiping the store (make
+  clean, dropped MinIO volumes) also invalidates the table
+
+Reused images, seeds uploaded twice under different filenames, and unchanged
+reruns therefore cost no storage bytes and no upload time.
+"""
+import hashlib
+import shutil
+import sqlite3
+import tempfile
+import threading
+import uuid
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+from app.adapters.storage.protocol import IStorageAdapter
+from app.adapters.storage.streams import StorageWriter
+from app.infrastructure.config import settings
+
+
+BLOB_PREFIX = "blobs"
+REF_DB_NAME = "storage-refs.sqlite3"
+HASH_CHUNK_BYTES = 1024 * 1024
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+
+class ContentAddressedStorageAdapter:
+    """Storage adapter decorator that stores each distinct content once."""
+
+    def __init__(self, inner: IStorageAdapter, ref_db_path: Optional[Path] = None):
+        """
+        Args:
+            inner: Store holding the blobs
+            ref_db_path: Reference table (default: settings.STORAGE_REF_DB, else
+                inside a local store's root, else under CACHE_DIR)
+        """
+        self.inner = inner
+        db_path = Path(ref_db_path or settings.STORAGE_REF_DB or self._default_ref_db(inner))
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(db_path), check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS blobs ("
+                " digest TEXT PRIMARY KEY,"
+                " refcount INTEGER NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " uri TEXT NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS refs ("
+                " path TEXT PRIMARY KEY,"
+                " digest TEXT NOT NULL REFERENCES blobs(digest))"
+            )
+            self._db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._bind_to_store()
+
+    # ------------------------------------------------------------------
+    # IStorageAdapter
+    # ------------------------------------------------------------------
+
+    def save(self, path: str, content: bytes) -> str:
+        """
+        Save content under `path`, uploading only if the digest is new.
+
+        Returns:
+            The logical path as a bare key (blob locations stay internal; see IStorageAdapter.save)
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        uri = self._blob_uri(digest)
+        if uri is None:
+            uri = self.inner.save(self._blob_key(digest), content)
+        self._link(path, digest, len(content), uri)
+        return path
+
+    def load(self, path: str) -> bytes:
+        """Resolve path to its digest and load the blob."""
+        return self.inner.load(self._blob_key(self._resolve(path)))
+
+    def load_conditional(self, path: str, etag: Optional[str] = None) -> Tuple[Optional[bytes], str]:
+        """Blobs are immutable, so the digest is the ETag (no round trip when unchanged)."""
+        digest = self._resolve(path)
+        if etag == digest:
+            return None, digest
+        return self.inner.load(self._blob_key(digest)), digest
+
+    def open_write(self, path: str) -> StorageWriter:
+        """Spool and hash the stream; upload on close only if the digest is new."""
+
+        def commit(spool: BinaryIO) -> str:
+            try:
+                spool.seek(0)
+                hasher = hashlib.sha256()
+                size = 0
+                for chunk in iter(lambda: spool.read(HASH_CHUNK_BYTES), b""):
+                    hasher.update(chunk)
+                    size += len(chunk)
+                digest = hasher.hexdigest()
+
+                uri = self._blob_uri(digest)
+                if uri is None:
+                    spool.seek(0)
+                    with self.inner.open_write(self._blob_key(digest)) as out:
+                        shutil.copyfileobj(spool, out)
+                    uri = out.uri
+            finally:
+                spool.close()
+
+            self._link(path, digest, size, uri)
+            return path
+
+        return StorageWriter(tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES), commit=commit)
+
+    def open_read(self, path: str) -> BinaryIO:
+        """Stream the blob behind `path`."""
+        return self.inner.open_read(self._blob_key(self._resolve(path)))
+
+    def exists(self, path: str) -> bool:
+        """Check the reference table, then that its blob is still in the store."""
+        with self._lock:
+            row = self._db.execute("SELECT digest FROM refs WHERE path = ?", (path,)).fetchone()
+        return row is not None and self.inner.exists(self._blob_key(row[0]))
+
+    def list(self, prefix: str) -> List[str]:
+        """List logical paths with given prefix (range scan on the primary key)."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT path FROM refs WHERE path >= ? AND path < ? ORDER BY path",
+                (prefix, prefix + "\U0010ffff"),
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def url_for(self, path: str, ttl: int = 3600) -> str:
+        """URL of the underlying blob."""
+        return self.inner.url_for(self._blob_key(self._resolve(path)), ttl)
+
+    # ------------------------------------------------------------------
+    # Reference table
+    # ------------------------------------------------------------------
+
+    def orphans(self) -> List[str]:
+        """Digests no longer referenced by any path (candidates for cleanup)."""
+        with self._lock:
+            rows = self._db.execute("SELECT digest FROM blobs WHERE refcount <= 0").fetchall()
+        return [r[0] for r in rows]
+
+    def stats(self) -> Dict[str, int]:
+        """Logical vs stored bytes (their difference is what dedup saved)."""
+        with self._lock:
+            paths, logical = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(b.size), 0)"
+                " FROM refs r JOIN blobs b ON b.digest = r.digest"
+            ).fetchone()
+            blobs, stored = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs WHERE refcount > 0"
+            ).fetchone()
+        return {
+            "paths": paths,
+            "blobs": blobs,
+            "logical_bytes": logical,
+            "stored_bytes": stored,
+        }
+
+    def _resolve(self, path: str) -> str:
+        with self._lock:
+            row = self._db.execute("SELECT digest FROM refs WHERE path = ?", (path,)).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"File not found: {path}")
+        return row[0]
+
+    def _blob_uri(self, digest: str) -> Optional[str]:
+        """
+        Where a blob is stored, or None if it must be uploaded.
+
+        Known digests are trusted without a store round trip (a wiped store
+        resets the table, see _bind_to_store); only unknown ones are looked up.
+        """
+        with self._lock:
+            row = self._db.execute("SELECT uri FROM blobs WHERE digest = ?", (digest,)).fetchone()
+        if row is not None:
+            return row[0]
+        key = self._blob_key(digest)
+        return key if self.inner.exists(key) else None
+
+    def _bind_to_store(self) -> None:
+        """
+        Reset the table if the store it describes was wiped.
+
+        A marker object written next to the blobs identifies the store; when the
+        recorded marker is gone, every row points at missing blobs.
+        """
+        with self._lock:
+            row = self._db.execute("SELECT value FROM meta WHERE key = 'store_id'").fetchone()
+        if row is not None and self.inner.exists(self._marker_key(row[0])):
+            return
+
+        store_id = uuid.uuid4().hex
+        self.inner.save(self._marker_key(store_id), b"")
+        with self._lock, self._db:
+            if row is not None:
+                self._db.execute("DELETE FROM refs")
+                self._db.execute("DELETE FROM blobs")
+            self._db.execute(
+                "INSERT INTO meta (key, value) VALUES ('store_id', ?)"
+                " ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (store_id,),
+            )
+
+    def _link(self, path: str, digest: str, size: int, uri: str) -> None:
+        """Point `path` at `digest`, adjusting refcounts of old and new blobs."""
+        with self._lock, self._db:
+            row = self._db.execute("SELECT digest FROM refs WHERE path = ?", (path,)).fetchone()
+            if row and row[0] == digest:
+                return
+            if row:
+                self._db.execute(
+                    "UPDATE blobs SET refcount = refcount - 1 WHERE digest = ?", (row[0],)
+                )
+
+            self._db.execute(
+                "INSERT INTO blobs (digest, refcount, size, uri) VALUES (?, 1, ?, ?)"
+                " ON CONFLICT(digest) DO UPDATE SET refcount = refcount + 1",
+                (digest, size, uri),
+            )
+            self._db.execute(
+                "INSERT INTO refs (path, digest) VALUES (?, ?)"
+                " ON CONFLICT(path) DO UPDATE SET digest = excluded.digest",
+                (path, digest),
+            )
+
+    @staticmethod
+    def _blob_key(digest: str) -> str:
+        return f"{BLOB_PREFIX}/{digest[:2]}/{digest}"
+
+    @staticmethod
+    def _marker_key(store_id: str) -> str:
+        return f"{BLOB_PREFIX}/store-{store_id}"
+
+    @staticmethod
+    def _default_ref_db(inner: IStorageAdapter) -> Path:
+        root = getattr(inner, "root", None)  # Local store: keep the table inside it
+        return Path(root) / REF_DB_NAME if root else settings.CACHE_DIR / REF_DB_NAME
@@ -1,32 +1,165 @@
 """
 Fake Storage Adapter for Testing
 
-In-memory storage for fast tests.
+In-memory storage engine for fast tests and large fake-mode load tests:
+- Sorted key index (bisect) so prefix listing is O(log n + k), not a full scan
+- Optional memory budget; least recently used objects spill to disk when set,
+  into a per-instance temporary directory removed by close(), garbage
+  collection or interpreter exit
+- Occupancy stats for simulations
 """
-from typing import Dict, List
+import bisect
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional
+
+from app.adapters.storage.streams import StorageWriter
 
 
 class FakeStorageAdapter:
     """In-memory storage adapter implementing IStorageAdapter protocol."""
 
-    def __init__(self):
-        self.storage: Dict[str, bytes] = {}
+    def __init__(
+        self,
+        memory_budget_bytes: Optional[int] = None,
+        spill_dir: Optional[Path] = None,
+    ):
+        """
+        Args:
+            memory_budget_bytes: Max bytes held in memory (None = unbounded)
+            spill_dir: Parent directory for objects evicted from memory (each
+                instance spills into its own temporary subdirectory). Without it,
+                exceeding the budget raises MemoryError.
+        """
+        self.memory_budget_bytes = memory_budget_bytes
+        self._spill_tmp: Optional[tempfile.TemporaryDirectory] = None
+        self.spill_dir: Optional[Path] = None
+        if spill_dir:
+            Path(spill_dir).mkdir(parents=True, exist_ok=True)
+            self._spill_tmp = tempfile.TemporaryDirectory(dir=spill_dir, prefix="spill-")
+            self.spill_dir = Path(self._spill_tmp.name)
+
+        self.storage: "OrderedDict[str, bytes]" = OrderedDict()  # LRU order
+        self._spilled: Dict[str, int] = {}  # path -> size
+        self._keys: List[str] = []  # Sorted index over all paths
+        self._memory_bytes = 0
+        self._spilled_bytes = 0
+        self._lock = threading.RLock()
 
     def save(self, path: str, content: bytes) -> str:
-        """Save to in-memory dict."""
-        self.storage[path] = content
+        """Save to memory (spilling older objects if over budget)."""
+        with self._lock:
+            is_new = not self._contains(path)
+            budget = self.memory_budget_bytes
+            if budget is not None and not self.spill_dir:
+                current = len(self.storage.get(path, b""))
+                if self._memory_bytes - current + len(content) > budget:
+                    raise MemoryError(
+                        f"Memory budget of {budget} bytes exceeded (no spill_dir configured)"
+                    )
+
+            self._forget(path)
+            if budget is not None and len(content) > budget:
+                self._write_spill(path, content)
+            else:
+                self.storage[path] = content
+                self._memory_bytes += len(content)
+                self._enforce_budget()
+
+            if is_new:
+                bisect.insort(self._keys, path)
         return path
 
     def load(self, path: str) -> bytes:
-        """Load from in-memory dict."""
-        if path not in self.storage:
-            raise FileNotFoundError(f"File not found: {path}")
-        return self.storage[path]
+        """Load from memory, or from the spill directory."""
+        with self._lock:
+            if path in self.storage:
+                self.storage.move_to_end(path)
+                return self.storage[path]
+            if path in self._spilled:
+                return self._spill_path(path).read_bytes()
+        raise FileNotFoundError(f"File not found: {path}")
+
+    def open_write(self, path: str) -> StorageWriter:
+        """Buffer writes in memory; store on close."""
+        return StorageWriter(BytesIO(), commit=lambda buf: self.save(path, buf.getvalue()))
+
+    def open_read(self, path: str) -> BinaryIO:
+        """Stream over the stored bytes."""
+        return BytesIO(self.load(path))
 
     def exists(self, path: str) -> bool:
-        """Check existence in dict."""
-        return path in self.storage
+        """Check existence (memory or spilled)."""
+        with self._lock:
+            return self._contains(path)
 
     def list(self, prefix: str) -> List[str]:
-        """List files with prefix."""
-        return [k for k in self.storage.keys() if k.startswith(prefix)]
+        """List files with prefix via the sorted key index."""
+        with self._lock:
+            i = bisect.bisect_left(self._keys, prefix)
+            results = []
+            while i < len(self._keys) and self._keys[i].startswith(prefix):
+                results.append(self._keys[i])
+                i += 1
+            return results
+
+    def url_for(self, path: str, ttl: int = 3600) -> str:
+        """Pseudo-URL (in-memory content is not browser-addressable)."""
+        if not self.exists(path):
+            raise FileNotFoundError(f"File not found: {path}")
+        return f"memory://{path}"
+
+    def stats(self) -> Dict[str, Optional[int]]:
+        """Occupancy stats."""
+        with self._lock:
+            return {
+                "objects": len(self._keys),
+                "memory_objects": len(self.storage),
+                "memory_bytes": self._memory_bytes,
+                "memory_budget_bytes": self.memory_budget_bytes,
+                "spilled_objects": len(self._spilled),
+                "spilled_bytes": self._spilled_bytes,
+            }
+
+    def close(self) -> None:
+        """Drop everything and delete the spill directory (the adapter is empty afterwards)."""
+        with self._lock:
+            self.storage.clear()
+            self._spilled.clear()
+            self._keys.clear()
+            self._memory_bytes = 0
+            self._spilled_bytes = 0
+            if self._spill_tmp is not None:
+                self._spill_tmp.cleanup()
+
+    def _contains(self, path: str) -> bool:
+        return path in self.storage or path in self._spilled
+
+    def _forget(self, path: str) -> None:
+        """Drop current content for path (index entry is kept)."""
+        if path in self.storage:
+            self._memory_bytes -= len(self.storage.pop(path))
+        if path in self._spilled:
+            self._spilled_bytes -= self._spilled.pop(path)
+            self._spill_path(path).unlink(missing_ok=True)
+
+    def _enforce_budget(self) -> None:
+        """Spill least recently used objects until memory fits the budget."""
+        if self.memory_budget_bytes is None:
+            return
+        while self._memory_bytes > self.memory_budget_bytes:
+            old_path, old_content = self.storage.popitem(last=False)
+            self._memory_bytes -= len(old_content)
+            self._write_spill(old_path, old_content)
+
+    def _write_spill(self, path: str, content: bytes) -> None:
+        self._spill_path(path).write_bytes(content)
+        self._spilled[path] = len(content)
+        self._spilled_bytes += len(content)
+
+    def _spill_path(self, path: str) -> Path:
+        return self.spill_dir / hashlib.sha1(path.encode()).hexdigest()
@@ -0,0 +1,24 @@
+"""
+Storage Keys
+
+Recover a storage key from the URI a storage adapter returned on save, for
+records indexed before the key itself was stored (storage_path).
+"""
+
+
+def key_from_uri(uri: str) -> str:
+    """
+    Storage key behind a saved object's URI.
+
+    Args:
+        uri: URI returned by IStorageAdapter.save() ("s3://bucket/key", or a bare key)
+
+    Returns:
+        The key, or "" if it cannot be recovered (e.g., http:// or file:// URLs)
+    """
+    if uri.startswith("s3://"):
+        parts = uri.split("/", 3)
+        return parts[3] if len(parts) == 4 else ""
+    if "://" in uri:
+        return ""
+    return uri
@@ -0,0 +1,162 @@
+"""
+Local Filesystem Storage Adapter
+
+Implements IStorageAdapter protocol on the local disk (settings.OUTPUT_DIR).
+Single-node deployments and benchmarks avoid S3 overhead entirely.
+
+- Writes are atomic: temp file in the target directory, fsync, rename.
+- Files are sharded by a short hash of their name so no directory grows flat:
+  "lavender-soap/en-US/1x1/asset-123.png" -> "<root>/lavender-soap/en-US/1x1/4f/asset-123.png"
+- Reads are served from memory-mapped files; streams use real file handles.
+"""
+import hashlib
+import mmap
+import os
+import tempfile
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, List, Optional
+
+from app.adapters.storage.streams import StorageWriter
+from app.infrastructure.config import settings
+
+
+TEMP_PREFIX = ".tmp-"
+
+
+class LocalFSStorageAdapter:
+    """Filesystem storage adapter with atomic writes and mmap reads."""
+
+    def __init__(self, root: Optional[Path] = None, shard_chars: int = 2):
+        self.root = Path(root or settings.LOCAL_STORAGE_DIR).resolve()
+        self.shard_chars = shard_chars
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _resolve(self, path: str) -> Path:
+        """Map a logical path to its sharded location on disk."""
+        logical = PurePosixPath(path)
+        if logical.is_absolute() or ".." in logical.parts or not logical.name:
+            raise ValueError(f"Invalid storage path: {path}")
+
+        shard = hashlib.sha1(logical.name.encode()).hexdigest()[: self.shard_chars]
+        return self.root.joinpath(*logical.parent.parts, shard, logical.name)
+
+    def save(self, path: str, content: bytes) -> str:
+        """
+        Save content atomically (temp file + fsync + rename).
+
+        Args:
+            path: Relative path (e.g., "lavender-soap/en-US/1x1/asset-123.png")
+            content: File content (bytes)
+
+        Returns:
+            File URI (file:///.../asset-123.png)
+        """
+        target = self._resolve(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=TEMP_PREFIX)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_name, target)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+        self._fsync_dir(target.parent)
+        return target.as_uri()
+
+    def load(self, path: str) -> bytes:
+        """Load content via a memory-mapped read."""
+        target = self._resolve(path)
+        try:
+            with open(target, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    return b""  # mmap cannot map empty files
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return mm[:]
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"File not found: {path}") from e
+
+    def open_write(self, path: str) -> StorageWriter:
+        """Stream into a temp file; fsync and rename into place on close."""
+        target = self._resolve(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=TEMP_PREFIX)
+        handle = os.fdopen(fd, "wb")
+
+        def commit(f: BinaryIO) -> str:
+            try:
+                f.flush()
+                os.fsync(f.fileno())
+                f.close()
+                os.replace(tmp_name, target)
+            except BaseException:
+                abort(f)
+                raise
+            self._fsync_dir(target.parent)
+            return target.as_uri()
+
+        def abort(f: BinaryIO) -> None:
+            f.close()
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+
+        return StorageWriter(handle, commit=commit, abort=abort)
+
+    def open_read(self, path: str) -> BinaryIO:
+        """Open the underlying file for streaming reads."""
+        try:
+            return open(self._resolve(path), "rb")
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"File not found: {path}") from e
+
+    def exists(self, path: str) -> bool:
+        """Check if file exists on disk."""
+        return self._resolve(path).is_file()
+
+    def list(self, prefix: str) -> List[str]:
+        """List logical paths with given prefix (shard directories are hidden)."""
+        # Only walk the deepest directory fully covered by the prefix
+        base_parts = PurePosixPath(prefix).parts if "/" in prefix else ()
+        if prefix and not prefix.endswith("/"):
+            base_parts = base_parts[:-1]
+        base = self.root.joinpath(*base_parts)
+        if not base.is_dir():
+            return []
+
+        results = []
+        for dirpath, _, filenames in os.walk(base):
+            shard_dir = Path(dirpath)
+            if not filenames or shard_dir == self.root:
+                continue
+            logical_dir = shard_dir.parent.relative_to(self.root).as_posix()
+            for name in filenames:
+                if name.startswith(TEMP_PREFIX):
+                    continue
+                logical = name if logical_dir == "." else f"{logical_dir}/{name}"
+                if logical.startswith(prefix):
+                    results.append(logical)
+        return sorted(results)
+
+    def url_for(self, path: str, ttl: int = 3600) -> str:
+        """File URI for direct access (local files never expire)."""
+        target = self._resolve(path)
+        if not target.is_file():
+            raise FileNotFoundError(f"File not found: {path}")
+        return target.as_uri()
+
+    @staticmethod
+    def _fsync_dir(directory: Path) -> None:
+        """Persist the rename by syncing the parent directory (POSIX only)."""
+        if os.name != "posix":
+            return
+        fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
@@ -4,12 +4,19 @@ MinIO Storage Adapter
 Implements IStorageAdapter protocol for S3-compatible blob storage.
 """
 import boto3
-from typing import List
+import mimetypes
+import tempfile
+from typing import BinaryIO, List, Optional, Tuple
 from botocore.exceptions import ClientError
 
+from app.adapters.storage.streams import StorageWriter
 from app.infrastructure.config import settings
 
 
+# Writers keep up to this many bytes in memory before spilling to a temp file
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+
 class MinIOStorageAdapter:
     """S3-compatible storage adapter using MinIO."""
 
@@ -23,6 +30,18 @@ class MinIOStorageAdapter:
         self.bucket = settings.MINIO_BUCKET
         self._ensure_bucket()
 
+        # Presigned URLs embed the host in their signature, so sign with the
+        # endpoint browsers can reach when it differs from the internal one
+        if settings.MINIO_PUBLIC_ENDPOINT != settings.MINIO_ENDPOINT:
+            self.presign_client = boto3.client(
+                "s3",
+                endpoint_url=settings.MINIO_PUBLIC_ENDPOINT,
+                aws_access_key_id=settings.MINIO_ACCESS_KEY,
+                aws_secret_access_key=settings.MINIO_SECRET_KEY,
+            )
+        else:
+            self.presign_client = self.client
+
     def _ensure_bucket(self) -> None:
         """Create bucket if it doesn't exist."""
         try:
@@ -57,6 +76,64 @@ class MinIOStorageAdapter:
         except ClientError as e:
             raise FileNotFoundError(f"File not found: {path}") from e
 
+    def open_write(self, path: str) -> StorageWriter:
+        """
+        Streaming writer backed by a spooled temp file.
+
+        On close the spool is handed to upload_fileobj, which streams it
+        (multipart for large objects) instead of materializing one bytes blob.
+        """
+        content_type = mimetypes.guess_type(path)[0] or "image/png"
+
+        def commit(spool: BinaryIO) -> str:
+            try:
+                spool.seek(0)
+                self.client.upload_fileobj(
+                    spool,
+                    self.bucket,
+                    path,
+                    ExtraArgs={"ContentType": content_type},
+                )
+            finally:
+                spool.close()
+            return f"s3://{self.bucket}/{path}"
+
+        return StorageWriter(
+            tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES),
+            commit=commit,
+        )
+
+    def open_read(self, path: str) -> BinaryIO:
+        """Return the botocore StreamingBody as-is (bytes are pulled on read)."""
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=path)
+            return response["Body"]
+        except ClientError as e:
+            raise FileNotFoundError(f"File not found: {path}") from e
+
+    def load_conditional(self, path: str, etag: Optional[str] = None) -> Tuple[Optional[bytes], str]:
+        """
+        Conditional GET (If-None-Match) used by caches to revalidate.
+
+        Args:
+            path: Object key
+            etag: ETag of the cached copy (None for an unconditional GET)
+
+        Returns:
+            (content, etag) - content is None when the cached copy is still current
+        """
+        params = {"Bucket": self.bucket, "Key": path}
+        if etag:
+            params["IfNoneMatch"] = etag
+        try:
+            response = self.client.get_object(**params)
+            return response["Body"].read(), response["ETag"]
+        except ClientError as e:
+            status = e.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+            if etag and (status == 304 or e.response.get("Error", {}).get("Code") == "304"):
+                return None, etag
+            raise FileNotFoundError(f"File not found: {path}") from e
+
     def exists(self, path: str) -> bool:
         """Check if file exists in MinIO."""
         try:
@@ -77,3 +154,20 @@ class MinIOStorageAdapter:
             return [obj["Key"] for obj in response["Contents"]]
         except ClientError:
             return []
+
+    def url_for(self, path: str, ttl: int = 3600) -> str:
+        """
+        Presigned GET URL so clients fetch bytes straight from MinIO.
+
+        Args:
+            path: Object key
+            ttl: Seconds until the signature expires
+
+        Returns:
+            Presigned HTTP URL
+        """
+        return self.presign_client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket, "Key": path},
+            ExpiresIn=ttl,
+        )
@@ -2,10 +2,13 @@
 Storage Adapter Protocol
 
 Defines contract for storage services:
-- Local filesystem (default)
+- In-memory fake (testing)
+- Local filesystem (single node)
 - MinIO/S3 (production)
 """
-from typing import Protocol, List
+from typing import Protocol, List, BinaryIO
+
+from app.adapters.storage.streams import StorageWriter
 
 
 class IStorageAdapter(Protocol):
@@ -20,7 +23,11 @@ class IStorageAdapter(Protocol):
             content: File content (bytes)
 
         Returns:
-            Full storage path or URL
+            Where the content landed: a URI ("s3://bucket/key" for MinIO,
+            "file://..." for local disk), or the bare `path` (the fake, and
+            content-addressed storage, which keeps blob locations internal).
+            Keep `path` itself as the storage key; key_from_uri() recovers it
+            from either form where possible.
         """
         ...
 
@@ -28,6 +35,20 @@ class IStorageAdapter(Protocol):
         """Load content from storage."""
         ...
 
+    def open_write(self, path: str) -> StorageWriter:
+        """
+        Open a streaming writer; content is committed when it is closed.
+
+        Lets encoders (e.g., PIL) write straight into the store without an
+        intermediate bytes copy. Use as a context manager; `writer.uri` holds
+        the value save() would return.
+        """
+        ...
+
+    def open_read(self, path: str) -> BinaryIO:
+        """Open a readable binary stream (caller closes it)."""
+        ...
+
     def exists(self, path: str) -> bool:
         """Check if file exists."""
         ...
@@ -35,3 +56,16 @@ class IStorageAdapter(Protocol):
     def list(self, prefix: str) -> List[str]:
         """List files with given prefix."""
         ...
+
+    def url_for(self, path: str, ttl: int = 3600) -> str:
+        """
+        URL a client can fetch the content from directly.
+
+        Args:
+            path: Relative path
+            ttl: Seconds the URL stays valid (ignored where URLs do not expire)
+
+        Returns:
+            Presigned HTTP URL (MinIO), file:// URI (local disk), or memory:// (fake)
+        """
+        ...
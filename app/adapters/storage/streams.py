@@ -0,0 +1,80 @@
+"""
+Storage Streams
+
+File-like writer returned by IStorageAdapter.open_write(). Content is written
+to an adapter-specific buffer (real file, spooled temp file, BytesIO) and only
+committed to the store on close(), so a failed encode never leaves a partial
+object behind.
+"""
+from typing import Any, BinaryIO, Callable, Optional
+
+
+class StorageWriter:
+    """
+    Writable binary stream that commits to storage on close().
+
+    Used as a context manager: a clean exit commits, an exception aborts.
+    After commit, `uri` holds what save() would have returned.
+    """
+
+    def __init__(
+        self,
+        buffer: BinaryIO,
+        commit: Callable[[BinaryIO], str],
+        abort: Optional[Callable[[BinaryIO], None]] = None,
+    ):
+        self._buffer = buffer
+        self._commit = commit
+        self._abort = abort
+        self.uri: Optional[str] = None
+        self.closed = False
+
+    def write(self, data: Any) -> int:
+        return self._buffer.write(data)
+
+    def writable(self) -> bool:
+        return True
+
+    def readable(self) -> bool:
+        return False
+
+    def seekable(self) -> bool:
+        return self._buffer.seekable()
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self._buffer.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._buffer.tell()
+
+    def flush(self) -> None:
+        self._buffer.flush()
+
+    def fileno(self) -> int:
+        return self._buffer.fileno()
+
+    def close(self) -> None:
+        """Commit buffered content to the store."""
+        if self.closed:
+            return
+        self.closed = True
+        self.uri = self._commit(self._buffer)
+
+    def abort(self) -> None:
+        """Discard buffered content without committing."""
+        if self.closed:
+            return
+        self.closed = True
+        if self._abort:
+            self._abort(self._buffer)
+        else:
+            self._buffer.close()
+
+    def __enter__(self) -> "StorageWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
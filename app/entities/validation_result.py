@@ -35,7 +35,7 @@ class ValidationResult:
     """
     asset_id: str
     status: ValidationStatus
-    checks_run: List[str]  # ["prohibited_words", "brand_colors", "logo_presence"]
+    checks_run: List[str]  # ["prohibited_words", "brand_colors", "text_contrast"]
     issues: List[ValidationIssue]
     passed_count: int
     failed_count: int
@@ -0,0 +1,145 @@
+"""
+TTL + LRU Cache
+
+Thread-safe in-process cache for repository query results:
+- Entries expire `ttl_seconds` after they were stored
+- At most `max_entries` are kept; the least recently used is evicted first
+- Entries can carry tags, so a write invalidates exactly the queries it affects
+  (e.g., every cached limit for one product/aspect/locale)
+
+Not shared across processes; the TTL bounds how stale another process's
+writes can appear.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Set, Tuple
+
+
+_MISSING = object()
+
+
+class TTLCache:
+    """LRU cache with per-entry expiry, tag invalidation and hit-rate stats."""
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        ttl_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_entries: Max cached entries (LRU eviction beyond this)
+            ttl_seconds: Entry lifetime
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, Tuple[Hashable, ...]]]" = OrderedDict()
+        self._tags: Dict[Hashable, Set[Hashable]] = {}
+        self._lock = threading.Lock()
+        self._generation = 0  # Bumped on invalidation; guards get_or_load races
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "evicted": 0, "invalidated": 0}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or `default` if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return default
+            expires_at, value, _ = entry
+            if expires_at <= self._clock():
+                self._remove(key)
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return default
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, tags: Iterable[Hashable] = ()) -> None:
+        """Store a value, labelled with invalidation tags."""
+        with self._lock:
+            self._store(key, value, tuple(tags))
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], tags: Iterable[Hashable] = ()) -> Any:
+        """
+        Return the cached value, calling `loader` (outside the lock) on a miss.
+
+        A result loaded while an invalidation happened is returned but not
+        cached, since it may predate the write that caused the invalidation.
+        """
+        generation = self._generation
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = loader()
+            with self._lock:
+                if generation == self._generation:
+                    self._store(key, value, tuple(tags))
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop one entry."""
+        with self._lock:
+            self._generation += 1
+            if key in self._entries:
+                self._remove(key)
+                self._stats["invalidated"] += 1
+
+    def invalidate_tag(self, tag: Hashable) -> int:
+        """
+        Drop every entry labelled with `tag`.
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            self._generation += 1
+            keys = list(self._tags.get(tag, ()))
+            for key in keys:
+                self._remove(key)
+            self._stats["invalidated"] += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries (stats are kept)."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._tags.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """Hit-rate metrics and occupancy."""
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats["hits"] + stats["misses"]
+            stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+            stats["entries"] = len(self._entries)
+            return stats
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, key: Hashable, value: Any, tags: Tuple[Hashable, ...]) -> None:
+        """Insert an entry and evict beyond max_entries (caller holds the lock)."""
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (self._clock() + self.ttl_seconds, value, tags)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+            self._stats["evicted"] += 1
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove an entry and its tag postings (caller holds the lock)."""
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
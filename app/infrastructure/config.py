@@ -5,6 +5,7 @@ Loads settings from environment variables with sensible defaults.
 """
 import os
 from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 
 # Load .env file if present
@@ -21,16 +22,107 @@ class Settings:
     WEAVIATE_HOST: str = os.getenv("WEAVIATE_HOST", "127.0.0.1")
     WEAVIATE_HTTP_PORT: int = int(os.getenv("WEAVIATE_HTTP_PORT", "8080"))
     WEAVIATE_GRPC_PORT: int = int(os.getenv("WEAVIATE_GRPC_PORT", "50051"))
+    WEAVIATE_POOL_CONNECTIONS: int = int(os.getenv("WEAVIATE_POOL_CONNECTIONS", "20"))  # Shared client HTTP pool
+    WEAVIATE_POOL_MAXSIZE: int = int(os.getenv("WEAVIATE_POOL_MAXSIZE", "100"))
+    WEAVIATE_BATCH_SIZE: int = int(os.getenv("WEAVIATE_BATCH_SIZE", "0"))  # 0 = dynamic batching
+    WEAVIATE_BATCH_CONCURRENCY: int = int(os.getenv("WEAVIATE_BATCH_CONCURRENCY", "2"))
+    WEAVIATE_THUMBNAIL_SIZE: int = int(os.getenv("WEAVIATE_THUMBNAIL_SIZE", "224"))  # CLIP input size
+
+    # Per-brand multi-tenancy for BrandAsset (separate BrandAssetByBrand collection)
+    WEAVIATE_MULTI_TENANCY: bool = os.getenv("WEAVIATE_MULTI_TENANCY", "false").lower() == "true"
+    WEAVIATE_TENANT_IDLE_SECONDS: float = float(os.getenv("WEAVIATE_TENANT_IDLE_SECONDS", "3600"))
+    WEAVIATE_TENANT_OFFLOAD: str = os.getenv("WEAVIATE_TENANT_OFFLOAD", "inactive").lower()  # inactive | offloaded
+
+    # BrandAsset vector index (0 = Weaviate default); quantizer: none, pq, bq or sq
+    WEAVIATE_HNSW_EF: int = int(os.getenv("WEAVIATE_HNSW_EF", "0"))
+    WEAVIATE_HNSW_EF_CONSTRUCTION: int = int(os.getenv("WEAVIATE_HNSW_EF_CONSTRUCTION", "0"))
+    WEAVIATE_HNSW_MAX_CONNECTIONS: int = int(os.getenv("WEAVIATE_HNSW_MAX_CONNECTIONS", "0"))
+    WEAVIATE_VECTOR_CACHE_MAX_OBJECTS: int = int(os.getenv("WEAVIATE_VECTOR_CACHE_MAX_OBJECTS", "0"))
+    WEAVIATE_QUANTIZER: str = os.getenv("WEAVIATE_QUANTIZER", "none").lower()
+    WEAVIATE_PQ_SEGMENTS: int = int(os.getenv("WEAVIATE_PQ_SEGMENTS", "0"))
+    WEAVIATE_QUANTIZER_TRAINING_LIMIT: int = int(os.getenv("WEAVIATE_QUANTIZER_TRAINING_LIMIT", "0"))
+    WEAVIATE_QUANTIZER_RESCORE_LIMIT: int = int(os.getenv("WEAVIATE_QUANTIZER_RESCORE_LIMIT", "0"))
+
+    # Reuse/seed lookup cache in front of the asset repository (real mode)
+    ASSET_QUERY_CACHE_ENABLED: bool = os.getenv("ASSET_QUERY_CACHE_ENABLED", "true").lower() == "true"
+    ASSET_QUERY_CACHE_TTL_SECONDS: float = float(os.getenv("ASSET_QUERY_CACHE_TTL_SECONDS", "300"))
+    ASSET_QUERY_CACHE_MAX_ENTRIES: int = int(os.getenv("ASSET_QUERY_CACHE_MAX_ENTRIES", "4096"))
+
+    # Brand repository: "" = Weaviate in real mode / built-in example in fake mode,
+    # "file" = YAML/JSON catalog in BRAND_DIR (both modes)
+    BRAND_BACKEND: str = os.getenv("BRAND_BACKEND", "").lower()
+    BRAND_RELOAD_SECONDS: float = float(os.getenv("BRAND_RELOAD_SECONDS", "2"))
+
+    # Brand lookup cache in front of the brand repository (real mode)
+    BRAND_CACHE_ENABLED: bool = os.getenv("BRAND_CACHE_ENABLED", "true").lower() == "true"
+    BRAND_CACHE_TTL_SECONDS: float = float(os.getenv("BRAND_CACHE_TTL_SECONDS", "600"))
+    BRAND_CACHE_MAX_ENTRIES: int = int(os.getenv("BRAND_CACHE_MAX_ENTRIES", "1024"))
+
+    # Tiered asset reuse: exact key -> local index -> vector search
+    REUSE_TIERS: str = os.getenv("REUSE_TIERS", "exact,local,vector")
+    REUSE_MIN_SCORES: str = os.getenv("REUSE_MIN_SCORES", "vector=0.6")  # Per-tier cut-offs; empty disables them
+    REUSE_VECTOR_CANDIDATES: int = int(os.getenv("REUSE_VECTOR_CANDIDATES", "3"))
+    REUSE_LOCAL_MAX_ENTRIES: int = int(os.getenv("REUSE_LOCAL_MAX_ENTRIES", "10000"))
+
+    # Prohibited-word policy file (YAML/JSON {"words": {"*": [...], "es": [...]}}); empty = built-in lists
+    CONTENT_POLICY_FILE: str = os.getenv("CONTENT_POLICY_FILE", "")
+
+    # Brand color check: max CIEDE2000 distance to a brand color, and min share of on-brand pixels
+    BRAND_COLOR_DELTA_E: float = float(os.getenv("BRAND_COLOR_DELTA_E", "12"))
+    BRAND_COLOR_MIN_COVERAGE: float = float(os.getenv("BRAND_COLOR_MIN_COVERAGE", "0.05"))
+
+    # Text legibility check: min WCAG contrast under the slogan (3 = AA large text), max background luminance std
+    TEXT_MIN_CONTRAST: float = float(os.getenv("TEXT_MIN_CONTRAST", "3.0"))
+    TEXT_MAX_BACKGROUND_STD: float = float(os.getenv("TEXT_MAX_BACKGROUND_STD", "0.15"))
+
+    # Validation engine: processes for image checks (1 = in-process, 0 = one per core), stop at first error
+    VALIDATION_WORKERS: int = int(os.getenv("VALIDATION_WORKERS", "1"))
+    VALIDATION_FAIL_FAST: bool = os.getenv("VALIDATION_FAIL_FAST", "false").lower() == "true"
+
+    # Perceptual-hash near-duplicate detection (bits out of 64 that may differ)
+    DEDUP_HAMMING_THRESHOLD: int = int(os.getenv("DEDUP_HAMMING_THRESHOLD", "6"))
+
+    # In-process embeddings (fake-mode asset search, and bring-your-own-vector ingestion)
+    # Backend for real mode: "weaviate" (server-side multi2vec-clip), "clip" (inference API) or "hashing"
+    EMBEDDING_BACKEND: str = os.getenv("EMBEDDING_BACKEND", "weaviate").lower()
+    EMBEDDING_DIMENSIONS: int = int(os.getenv("EMBEDDING_DIMENSIONS", "512"))
+    EMBEDDING_BATCH_SIZE: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "32"))
+    CLIP_INFERENCE_URL: str = os.getenv("CLIP_INFERENCE_URL", "http://localhost:8085")
 
     # MinIO (local S3-compatible storage)
     MINIO_ENDPOINT: str = os.getenv("MINIO_ENDPOINT", "http://localhost:9000")
     MINIO_ACCESS_KEY: str = os.getenv("MINIO_ROOT_USER", "minio")
     MINIO_SECRET_KEY: str = os.getenv("MINIO_ROOT_PASSWORD", "minio123")
     MINIO_BUCKET: str = os.getenv("MINIO_BUCKET", "assets")
+    MINIO_PUBLIC_ENDPOINT: str = os.getenv("MINIO_PUBLIC_ENDPOINT", MINIO_ENDPOINT)
+    STORAGE_URL_TTL_SECONDS: int = int(os.getenv("STORAGE_URL_TTL_SECONDS", "3600"))
+
+    # Storage backend for real mode: "minio" (default) or "local"
+    STORAGE_BACKEND: str = os.getenv("STORAGE_BACKEND", "minio")
+
+    # Fake (in-memory) storage engine: 0 = unbounded
+    FAKE_STORAGE_MEMORY_MB: int = int(os.getenv("FAKE_STORAGE_MEMORY_MB", "0"))
+
+    # Content-addressed (deduplicating) storage layer
+    STORAGE_CONTENT_ADDRESSED: bool = os.getenv("STORAGE_CONTENT_ADDRESSED", "false").lower() == "true"
+
+    # Read-through storage cache (real mode)
+    STORAGE_CACHE_ENABLED: bool = os.getenv("STORAGE_CACHE_ENABLED", "true").lower() == "true"
+    STORAGE_CACHE_MEMORY_MB: int = int(os.getenv("STORAGE_CACHE_MEMORY_MB", "64"))
+    STORAGE_CACHE_DISK_MB: int = int(os.getenv("STORAGE_CACHE_DISK_MB", "512"))
+    STORAGE_CACHE_REVALIDATE_SECONDS: float = float(os.getenv("STORAGE_CACHE_REVALIDATE_SECONDS", "60"))
 
     # Project paths
     PROJECT_ROOT: Path = Path(__file__).parent.parent.parent
     OUTPUT_DIR: Path = PROJECT_ROOT / "out"
+    CACHE_DIR: Path = OUTPUT_DIR / "cache"
+    FAKE_STORAGE_SPILL_DIR: Path = CACHE_DIR / "fake-storage"
+    # Content-addressed reference table (default: inside a local store's root, else under CACHE_DIR)
+    STORAGE_REF_DB: Optional[Path] = Path(os.environ["STORAGE_REF_DB"]) if os.getenv("STORAGE_REF_DB") else None
+    EMBEDDING_CACHE_DB: Path = Path(os.getenv("EMBEDDING_CACHE_DB", str(CACHE_DIR / "embeddings.sqlite3")))
+    BRAND_DIR: Path = Path(os.getenv("BRAND_DIR", str(PROJECT_ROOT / "examples" / "brands")))
+    BRAND_SNAPSHOT: Path = Path(os.getenv("BRAND_SNAPSHOT", str(CACHE_DIR / "brands.pickle")))
+    LOCAL_STORAGE_DIR: Path = Path(os.getenv("LOCAL_STORAGE_DIR", str(OUTPUT_DIR / "assets")))
 
 
 settings = Settings()
@@ -0,0 +1 @@
+"""Perceptual near-duplicate detection."""
@@ -0,0 +1,73 @@
+"""
+BK-Tree
+
+Metric tree over integer hashes keyed by Hamming distance. A radius query
+only descends into children whose edge distance is within `radius` of the
+query's distance to the node (triangle inequality), so near-duplicate lookups
+touch a small fraction of the stored hashes.
+"""
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from app.infrastructure.dedup.perceptual_hash import hamming
+
+
+class _Node:
+    __slots__ = ("phash", "ids", "children")
+
+    def __init__(self, phash: int, item_id: str):
+        self.phash = phash
+        self.ids: List[str] = [item_id]  # Exact-hash collisions share a node
+        self.children: Dict[int, "_Node"] = {}
+
+
+class BKTree:
+    """BK-tree of (hash, id) pairs supporting Hamming radius search."""
+
+    def __init__(self):
+        self._root: Optional[_Node] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, phash: int, item_id: str) -> None:
+        """Insert a hash with its id."""
+        self._size += 1
+        if self._root is None:
+            self._root = _Node(phash, item_id)
+            return
+
+        node = self._root
+        while True:
+            distance = hamming(phash, node.phash)
+            if distance == 0:
+                node.ids.append(item_id)
+                return
+            child = node.children.get(distance)
+            if child is None:
+                node.children[distance] = _Node(phash, item_id)
+                return
+            node = child
+
+    def search(self, phash: int, radius: int) -> List[Tuple[int, str]]:
+        """
+        Find all ids within `radius` bits of `phash`.
+
+        Returns:
+            (distance, id) pairs sorted by distance
+        """
+        return sorted(self._iter_within(phash, radius))
+
+    def _iter_within(self, phash: int, radius: int) -> Iterator[Tuple[int, str]]:
+        if self._root is None:
+            return
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            distance = hamming(phash, node.phash)
+            if distance <= radius:
+                for item_id in node.ids:
+                    yield distance, item_id
+            for edge, child in node.children.items():
+                if distance - radius <= edge <= distance + radius:
+                    stack.append(child)
@@ -0,0 +1,41 @@
+"""
+Perceptual Hash
+
+Difference hash (dHash): shrink to (N+1)xN grayscale and record whether each
+pixel is brighter than its right neighbour. Re-exports, re-compression and
+small resizes of the same photo land within a few bits of each other, so the
+Hamming distance between hashes measures visual similarity.
+"""
+from io import BytesIO
+
+import numpy as np
+from PIL import Image
+
+
+def dhash(image_bytes: bytes, hash_size: int = 8) -> int:
+    """
+    Compute the difference hash of an encoded image.
+
+    Args:
+        image_bytes: PNG/JPEG bytes
+        hash_size: Grid edge; the hash has hash_size**2 bits (64 by default)
+
+    Returns:
+        Hash as an unsigned integer
+    """
+    with Image.open(BytesIO(image_bytes)) as img:
+        img.draft("L", (hash_size * 8, hash_size * 8))  # JPEG: decode at reduced scale
+        small = img.convert("L").resize((hash_size + 1, hash_size), Image.LANCZOS)
+    pixels = np.asarray(small, dtype=np.int16)
+    bits = (pixels[:, 1:] > pixels[:, :-1]).ravel()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def hamming(a: int, b: int) -> int:
+    """Number of differing bits between two hashes."""
+    return (a ^ b).bit_count()
+
+
+def to_hex(phash: int, hash_size: int = 8) -> str:
+    """Fixed-width hex form for storage (e.g., Weaviate `phash` property)."""
+    return f"{phash:0{hash_size * hash_size // 4}x}"
@@ -0,0 +1,122 @@
+"""
+Near-Duplicate Detection Service
+
+Reusable dedup check for seed uploads and generated assets:
+- dHash computed at ingest (cheap: one downscaled decode, no CLIP call)
+- One BK-tree per scope (e.g., brand_id, or brand/product/aspect), so a
+  lookup only compares against hashes that could be duplicates
+- Hashes within `threshold` bits of an indexed asset are reported as a match;
+  callers skip the duplicate or link it to the existing asset
+
+The index is in-process; it is warmed from hashes stored with the assets
+(Weaviate `phash` property / asset meta) via `load`.
+"""
+import threading
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, Optional, Set, Tuple
+
+from app.infrastructure.dedup.bk_tree import BKTree
+from app.infrastructure.dedup.perceptual_hash import dhash
+
+
+@dataclass(frozen=True)
+class DuplicateMatch:
+    """Closest indexed asset within the Hamming threshold."""
+    asset_id: str
+    distance: int
+
+
+class DedupService:
+    """Perceptual-hash near-duplicate index (thread-safe)."""
+
+    def __init__(self, threshold: int = 6, hash_size: int = 8):
+        """
+        Args:
+            threshold: Max Hamming distance (bits out of hash_size**2) counted as a duplicate
+            hash_size: dHash grid edge
+        """
+        self.threshold = threshold
+        self.hash_size = hash_size
+        self._trees: Dict[Hashable, BKTree] = {}
+        self._removed: Set[Tuple[Hashable, str]] = set()  # BK-trees do not support deletion
+        self._lock = threading.Lock()
+
+    def hash(self, image_bytes: bytes) -> int:
+        """Perceptual hash of an encoded image."""
+        return dhash(image_bytes, hash_size=self.hash_size)
+
+    def find(self, scope: Hashable, phash: int) -> Optional[DuplicateMatch]:
+        """
+        Closest indexed asset in `scope` within the threshold.
+
+        Args:
+            scope: Partition key (e.g., brand_id)
+            phash: Hash from `hash()`
+
+        Returns:
+            DuplicateMatch, or None if the image is new
+        """
+        with self._lock:
+            return self._find(scope, phash)
+
+    def add(self, scope: Hashable, phash: int, asset_id: str) -> None:
+        """Index an asset's hash in `scope`."""
+        with self._lock:
+            self._add(scope, phash, asset_id)
+
+    def check_and_add(self, scope: Hashable, image_bytes: bytes, asset_id: str) -> Tuple[int, Optional[DuplicateMatch]]:
+        """
+        Hash an image, look for a near-duplicate, and index it if it is new.
+
+        Returns:
+            (phash, match) - match is None when the image was indexed
+        """
+        phash = self.hash(image_bytes)
+        with self._lock:
+            match = self._find(scope, phash)
+            if match is None:
+                self._add(scope, phash, asset_id)
+        return phash, match
+
+    def remove(self, scope: Hashable, asset_id: str) -> None:
+        """Stop matching against an asset (e.g., its indexing failed)."""
+        with self._lock:
+            self._removed.add((scope, asset_id))
+
+    def load(self, entries: Iterable[Tuple[Hashable, str, int]]) -> int:
+        """
+        Warm the index from stored hashes.
+
+        Args:
+            entries: (scope, asset_id, phash) triples
+
+        Returns:
+            Number of hashes indexed
+        """
+        count = 0
+        for scope, asset_id, phash in entries:
+            self.add(scope, phash, asset_id)
+            count += 1
+        return count
+
+    def stats(self) -> Dict[str, int]:
+        """Index occupancy."""
+        with self._lock:
+            return {
+                "scopes": len(self._trees),
+                "hashes": sum(len(tree) for tree in self._trees.values()),
+                "removed": len(self._removed),
+            }
+
+    def _find(self, scope: Hashable, phash: int) -> Optional[DuplicateMatch]:
+        tree = self._trees.get(scope)
+        if tree is None:
+            return None
+        for distance, asset_id in tree.search(phash, self.threshold):
+            if (scope, asset_id) not in self._removed:
+                return DuplicateMatch(asset_id=asset_id, distance=distance)
+        return None
+
+    def _add(self, scope: Hashable, phash: int, asset_id: str) -> None:
+        self._removed.discard((scope, asset_id))
+        self._trees.setdefault(scope, BKTree()).add(phash, asset_id)
@@ -11,13 +11,33 @@ from app.adapters.ai.openai_image import OpenAIImageAdapter
 from app.adapters.storage.protocol import IStorageAdapter
 from app.adapters.storage.fake import FakeStorageAdapter
 from app.adapters.storage.minio import MinIOStorageAdapter
+from app.adapters.storage.local_fs import LocalFSStorageAdapter
+from app.adapters.storage.cached import CachedStorageAdapter
+from app.adapters.storage.content_addressed import ContentAddressedStorageAdapter
+
+from app.adapters.embedding.protocol import IEmbeddingAdapter
+from app.adapters.embedding.fake import HashingEmbeddingAdapter
+from app.adapters.embedding.clip_inference import ClipInferenceEmbeddingAdapter
+from app.adapters.embedding.cached import CachedEmbeddingAdapter
 
 from app.infrastructure.repositories.brand.protocol import IBrandRepository
 from app.infrastructure.repositories.brand.in_memory import InMemoryBrandRepository
 from app.infrastructure.repositories.brand.weaviate import WeaviateBrandRepository
+from app.infrastructure.repositories.brand.cached import CachedBrandRepository
+from app.infrastructure.repositories.brand.file import FileBrandRepository
+from app.infrastructure.config import settings
 
 from typing import Optional
+from app.infrastructure.repositories.asset.protocol import IAssetRepository
+from app.infrastructure.repositories.asset.in_memory import InMemoryAssetRepository
+from app.infrastructure.repositories.asset.cached import CachedAssetRepository
+from app.infrastructure.dedup.service import DedupService
 from app.infrastructure.repositories.asset.weaviate import WeaviateAssetRepository
+from app.use_cases.reuse_engine import ReuseEngine
+from app.use_cases.validation.prohibited_words import ContentPolicy
+from app.use_cases.validation.brand_colors import BrandColorsCheck
+from app.use_cases.validation.contrast import TextContrastCheck
+from app.use_cases.validate_campaign_uc import ValidateCampaignUC
 
 
 def create_ai_adapter(use_real: bool = False) -> IAIAdapter:
@@ -35,46 +55,227 @@ def create_ai_adapter(use_real: bool = False) -> IAIAdapter:
     return FakeAIAdapter()
 
 
-def create_storage_adapter(use_real: bool = False) -> IStorageAdapter:
+def create_storage_adapter(
+    use_real: bool = False,
+    backend: Optional[str] = None,
+    cached: Optional[bool] = None,
+    content_addressed: Optional[bool] = None,
+) -> IStorageAdapter:
     """
-    Create storage adapter (fake or real MinIO).
+    Create storage adapter (fake, local filesystem, or real MinIO).
 
     Args:
-        use_real: If True, use MinIOStorageAdapter; else use FakeStorageAdapter
+        use_real: If True, use settings.STORAGE_BACKEND; else use FakeStorageAdapter
+        backend: Explicit backend override ("fake", "local", or "minio")
+        cached: Wrap MinIO in CachedStorageAdapter (default: settings.STORAGE_CACHE_ENABLED)
+        content_addressed: Deduplicate blobs by SHA-256 (default: settings.STORAGE_CONTENT_ADDRESSED)
 
     Returns:
         IStorageAdapter implementation
     """
-    if use_real:
-        return MinIOStorageAdapter()
-    return FakeStorageAdapter()
+    if backend is None:
+        backend = settings.STORAGE_BACKEND if use_real else "fake"
+
+    if backend == "minio":
+        storage = MinIOStorageAdapter()
+    elif backend == "local":
+        storage = LocalFSStorageAdapter()
+    elif backend == "fake":
+        if not settings.FAKE_STORAGE_MEMORY_MB:
+            return FakeStorageAdapter()
+        return FakeStorageAdapter(
+            memory_budget_bytes=settings.FAKE_STORAGE_MEMORY_MB * 1024 * 1024,
+            spill_dir=settings.FAKE_STORAGE_SPILL_DIR,
+        )
+    else:
+        raise ValueError(f"Unknown storage backend: {backend}")
+
+    if content_addressed is None:
+        content_addressed = settings.STORAGE_CONTENT_ADDRESSED
+    if content_addressed:
+        storage = ContentAddressedStorageAdapter(storage)
 
+    if cached is None:
+        cached = settings.STORAGE_CACHE_ENABLED and backend == "minio"
+    if cached:
+        storage = CachedStorageAdapter(
+            storage,
+            memory_budget_bytes=settings.STORAGE_CACHE_MEMORY_MB * 1024 * 1024,
+            disk_dir=settings.CACHE_DIR / "storage",
+            disk_budget_bytes=settings.STORAGE_CACHE_DISK_MB * 1024 * 1024,
+            revalidate_after=settings.STORAGE_CACHE_REVALIDATE_SECONDS,
+        )
+    return storage
 
-def create_brand_repository(use_real: bool = False) -> IBrandRepository:
+
+def create_brand_repository(
+    use_real: bool = False,
+    cached: Optional[bool] = None,
+    backend: Optional[str] = None,
+) -> IBrandRepository:
     """
-    Create brand repository (fake or real Weaviate).
+    Create brand repository (fake, file catalog, or real Weaviate).
 
     Args:
         use_real: If True, use WeaviateBrandRepository; else use InMemoryBrandRepository
+        cached: Wrap Weaviate in CachedBrandRepository (default: settings.BRAND_CACHE_ENABLED)
+        backend: Explicit backend override ("memory", "file", or "weaviate";
+            default: settings.BRAND_BACKEND, else chosen by use_real)
 
     Returns:
         IBrandRepository implementation
     """
-    if use_real:
-        return WeaviateBrandRepository()
-    return InMemoryBrandRepository()
+    if backend is None:
+        backend = settings.BRAND_BACKEND or ("weaviate" if use_real else "memory")
+
+    if backend == "memory":
+        return InMemoryBrandRepository()
+    if backend == "file":
+        return FileBrandRepository()  # Already in-process; no cache layer needed
+    if backend != "weaviate":
+        raise ValueError(f"Unknown brand backend: {backend}")
 
+    repo = WeaviateBrandRepository()
+    if cached is None:
+        cached = settings.BRAND_CACHE_ENABLED
+    if cached:
+        return CachedBrandRepository(
+            repo,
+            ttl_seconds=settings.BRAND_CACHE_TTL_SECONDS,
+            max_entries=settings.BRAND_CACHE_MAX_ENTRIES,
+        )
+    return repo
 
-def create_asset_repository(use_real: bool = False) -> Optional[WeaviateAssetRepository]:
+
+def create_embedding_adapter(backend: str = "hashing", cached: Optional[bool] = None) -> IEmbeddingAdapter:
     """
-    Create asset repository (only real Weaviate - no fake needed for testing).
+    Create embedding adapter for in-process vectors.
 
     Args:
-        use_real: If True, use WeaviateAssetRepository; else return None
+        backend: "hashing" (deterministic stand-in) or "clip" (multi2vec-clip inference API)
+        cached: Cache vectors by content hash in settings.EMBEDDING_CACHE_DB
+            (default: on for every backend except hashing)
 
     Returns:
-        WeaviateAssetRepository or None
+        IEmbeddingAdapter implementation
     """
-    if use_real:
-        return WeaviateAssetRepository()
-    return None  # Fake mode doesn't need asset search/reuse
+    if backend == "hashing":
+        embedder = HashingEmbeddingAdapter(dimensions=settings.EMBEDDING_DIMENSIONS)
+    elif backend == "clip":
+        embedder = ClipInferenceEmbeddingAdapter()
+    else:
+        raise ValueError(f"Unknown embedding backend: {backend}")
+
+    if cached is None:
+        cached = backend != "hashing"
+    if cached:
+        return CachedEmbeddingAdapter(embedder, db_path=settings.EMBEDDING_CACHE_DB)
+    return embedder
+
+
+def create_asset_repository(use_real: bool = False, cached: Optional[bool] = None) -> IAssetRepository:
+    """
+    Create asset repository (in-memory or real Weaviate).
+
+    Args:
+        use_real: If True, use WeaviateAssetRepository; else use InMemoryAssetRepository
+        cached: Wrap Weaviate in CachedAssetRepository (default: settings.ASSET_QUERY_CACHE_ENABLED)
+
+    Returns:
+        IAssetRepository implementation
+    """
+    if not use_real:
+        return InMemoryAssetRepository(embedder=create_embedding_adapter())
+
+    # "weaviate": server-side vectorization; anything else: vectors supplied on insert
+    embedder = None
+    if settings.EMBEDDING_BACKEND != "weaviate":
+        embedder = create_embedding_adapter(settings.EMBEDDING_BACKEND)
+
+    repo = WeaviateAssetRepository(embedder=embedder)
+    if cached is None:
+        cached = settings.ASSET_QUERY_CACHE_ENABLED
+    if cached:
+        return CachedAssetRepository(
+            repo,
+            ttl_seconds=settings.ASSET_QUERY_CACHE_TTL_SECONDS,
+            max_entries=settings.ASSET_QUERY_CACHE_MAX_ENTRIES,
+        )
+    return repo
+
+
+def create_reuse_engine(asset_repository: Optional[IAssetRepository] = None) -> ReuseEngine:
+    """
+    Create tiered reuse engine configured from settings (REUSE_*).
+
+    Args:
+        asset_repository: Repository backing the exact and vector tiers
+
+    Returns:
+        ReuseEngine (keep one per process so its local index stays warm)
+    """
+    return ReuseEngine(
+        asset_repository,
+        tiers=[tier.strip() for tier in settings.REUSE_TIERS.split(",") if tier.strip()],
+        min_scores={
+            tier.strip(): float(value)
+            for tier, _, value in (entry.partition("=") for entry in settings.REUSE_MIN_SCORES.split(","))
+            if tier.strip()
+        },
+        vector_candidates=settings.REUSE_VECTOR_CANDIDATES,
+        local_max_entries=settings.REUSE_LOCAL_MAX_ENTRIES,
+    )
+
+
+def create_content_policy() -> ContentPolicy:
+    """
+    Create prohibited-word policy (settings.CONTENT_POLICY_FILE, else built-in lists).
+
+    Returns:
+        ContentPolicy
+    """
+    if settings.CONTENT_POLICY_FILE:
+        return ContentPolicy.from_file(settings.CONTENT_POLICY_FILE)
+    return ContentPolicy()
+
+
+def create_validate_campaign_uc(storage_adapter: Optional[IStorageAdapter] = None) -> ValidateCampaignUC:
+    """
+    Create validation use case configured from settings (CONTENT_POLICY_FILE, BRAND_COLOR_*, TEXT_*, VALIDATION_*).
+
+    Args:
+        storage_adapter: Where final images are read from (image checks are skipped without it)
+
+    Returns:
+        ValidateCampaignUC (keep one per process so its result cache and worker pool are reused)
+    """
+    return ValidateCampaignUC(
+        policy=create_content_policy(),
+        storage_adapter=storage_adapter,
+        color_check=BrandColorsCheck(
+            delta_e=settings.BRAND_COLOR_DELTA_E,
+            min_coverage=settings.BRAND_COLOR_MIN_COVERAGE,
+        ),
+        contrast_check=TextContrastCheck(
+            min_ratio=settings.TEXT_MIN_CONTRAST,
+            max_background_std=settings.TEXT_MAX_BACKGROUND_STD,
+        ),
+        workers=settings.VALIDATION_WORKERS,
+        fail_fast=settings.VALIDATION_FAIL_FAST,
+    )
+
+
+def create_dedup_service(asset_repository: Optional[IAssetRepository] = None) -> DedupService:
+    """
+    Create near-duplicate detection service, warmed from stored hashes.
+
+    Args:
+        asset_repository: Repository to load existing perceptual hashes from (optional)
+
+    Returns:
+        DedupService scoped by brand_id
+    """
+    service = DedupService(threshold=settings.DEDUP_HAMMING_THRESHOLD)
+    if asset_repository is not None and hasattr(asset_repository, "iter_phashes"):
+        service.load(asset_repository.iter_phashes())
+    return service
@@ -0,0 +1,123 @@
+"""
+Cached Asset Repository
+
+Query result cache in front of any IAssetRepository (typically Weaviate):
+- find_existing results cached per (product, aspect, locale, limit)
+- find_seeds results cached per (brand, product, limit)
+- get_by_id results (including misses) cached per asset_id
+- TTL + LRU bounded, shared across threads (one instance per process)
+
+Writes invalidate precisely: upserting an asset drops only the cached
+find_existing results for its product/aspect/locale, and (for seed uploads)
+the find_seeds results for its brand and product. Everything else stays warm.
+"""
+import dataclasses
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.entities.creative_asset import CreativeAsset
+from app.infrastructure.cache import TTLCache
+from app.infrastructure.repositories.asset.dto import AssetWithImage, BatchFailure, SeedAsset
+from app.infrastructure.repositories.asset.protocol import IAssetRepository
+
+
+SEED_TAGS = {"seed", "uploaded"}
+
+
+class CachedAssetRepository:
+    """Asset repository decorator caching reuse and seed lookups."""
+
+    def __init__(
+        self,
+        inner: IAssetRepository,
+        ttl_seconds: float = 300.0,
+        max_entries: int = 4096,
+    ):
+        """
+        Args:
+            inner: Repository to delegate to
+            ttl_seconds: How long a lookup result is served without a query
+            max_entries: Max cached lookup results (LRU eviction beyond this)
+        """
+        self.inner = inner
+        self.cache = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+    def upsert(
+        self,
+        asset: CreativeAsset,
+        image_bytes: Optional[bytes] = None,
+        tags: Optional[List[str]] = None,
+        palette: Optional[List[str]] = None,
+    ) -> None:
+        """Write through, then invalidate lookups this asset can appear in."""
+        self.inner.upsert(asset, image_bytes=image_bytes, tags=tags, palette=palette)
+        self._invalidate(asset, tags)
+
+    def upsert_many(self, items: Iterable[AssetWithImage]) -> List[BatchFailure]:
+        """Write through in one batch, then invalidate per written asset."""
+        items = list(items)
+        failures = self.inner.upsert_many(items)
+        # Failed objects may still have been partially written; invalidate all
+        for item in items:
+            self._invalidate(item.asset, item.tags)
+        return failures
+
+    def get_by_id(self, asset_id: str, brand_id: Optional[str] = None) -> Optional[CreativeAsset]:
+        """Cached exact lookup (a miss is cached too, until that asset_id is written)."""
+        asset = self.cache.get_or_load(
+            ("id", asset_id, brand_id),
+            lambda: self.inner.get_by_id(asset_id, brand_id=brand_id),
+            tags=[("id", asset_id)],
+        )
+        if asset is None:
+            return None
+        return dataclasses.replace(asset, meta=dict(asset.meta or {}))
+
+    def find_existing(
+        self,
+        product_name: str,
+        aspect_ratio: str,
+        locale: str = "en-US",
+        limit: int = 3,
+        brand_id: Optional[str] = None,
+    ) -> List[CreativeAsset]:
+        """Cached find_existing (returns fresh copies; callers mutate results)."""
+        assets = self.cache.get_or_load(
+            ("existing", product_name, aspect_ratio, locale, limit, brand_id),
+            lambda: self.inner.find_existing(
+                product_name, aspect_ratio, locale=locale, limit=limit, brand_id=brand_id
+            ),
+            tags=[("existing", product_name, aspect_ratio, locale)],
+        )
+        return [dataclasses.replace(a, meta=dict(a.meta or {})) for a in assets]
+
+    def find_seeds(
+        self, brand_id: str, product_name: Optional[str] = None, limit: int = 5
+    ) -> List[SeedAsset]:
+        """Cached find_seeds (SeedAsset is immutable, so results are shared)."""
+        seeds = self.cache.get_or_load(
+            ("seeds", brand_id, product_name, limit),
+            lambda: self.inner.find_seeds(brand_id, product_name=product_name, limit=limit),
+            tags=[("seeds", brand_id, product_name)],
+        )
+        return list(seeds)
+
+    def stats(self) -> Dict[str, float]:
+        """Hit-rate metrics and occupancy of the query cache."""
+        return self.cache.stats()
+
+    def invalidate(self) -> None:
+        """Drop all cached lookups (e.g., after out-of-band writes)."""
+        self.cache.clear()
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate repository-specific operations (e.g., compact) to the inner repository."""
+        if name == "inner":
+            raise AttributeError(name)
+        return getattr(self.inner, name)
+
+    def _invalidate(self, asset: CreativeAsset, tags: Optional[List[str]]) -> None:
+        self.cache.invalidate_tag(("id", asset.asset_id))
+        self.cache.invalidate_tag(("existing", asset.product_name, asset.aspect_ratio, asset.locale))
+        if SEED_TAGS.intersection(tags or []):
+            self.cache.invalidate_tag(("seeds", asset.brand_id, asset.product_name))
+            self.cache.invalidate_tag(("seeds", asset.brand_id, None))
@@ -0,0 +1,37 @@
+"""
+Asset Repository DTOs
+
+Lightweight, typed inputs and results for asset repository operations.
+"""
+from dataclasses import dataclass
+from typing import List, Optional
+
+from app.entities.creative_asset import CreativeAsset
+
+
+@dataclass
+class AssetWithImage:
+    """Asset plus the data needed to index it (input to upsert_many)."""
+    asset: CreativeAsset
+    image_bytes: Optional[bytes] = None
+    tags: Optional[List[str]] = None
+    palette: Optional[List[str]] = None
+
+
+@dataclass
+class BatchFailure:
+    """Per-object failure reported by a batch write."""
+    asset_id: str
+    message: str
+
+
+@dataclass(frozen=True)
+class SeedAsset:
+    """Seed image reference returned by find_seeds (no image bytes, no vector)."""
+    asset_id: str
+    brand_id: str
+    product_name: str
+    image_url: str
+    storage_path: str
+    palette: List[str]
+    score: Optional[float] = None
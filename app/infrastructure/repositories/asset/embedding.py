@@ -0,0 +1,43 @@
+"""
+Asset Embedding
+
+How an asset becomes one vector when the application embeds (in-memory
+repository, or Weaviate with bring-your-own-vector ingestion): the text
+fields multi2vec-clip vectorizes, averaged with the image vector if any.
+"""
+from typing import List
+
+import numpy as np
+
+from app.adapters.embedding.protocol import IEmbeddingAdapter
+from app.infrastructure.repositories.asset.dto import AssetWithImage
+
+
+def asset_text(item: AssetWithImage) -> str:
+    """Same text fields Weaviate's multi2vec-clip vectorizes."""
+    asset = item.asset
+    tags = " ".join(item.tags or ["generated"])
+    return f"{asset.message} {tags} {asset.product_name} {asset.locale} {asset.aspect_ratio}"
+
+
+def embed_assets(embedder: IEmbeddingAdapter, items: List[AssetWithImage]) -> np.ndarray:
+    """
+    Embed a batch of assets: one text batch and one image batch.
+
+    Args:
+        embedder: Text/image embedder
+        items: Assets with optional image bytes
+
+    Returns:
+        float32 array (len(items), dimensions): text vectors, averaged with
+        image vectors where present, L2-normalized
+    """
+    vectors = embedder.embed_texts([asset_text(item) for item in items])
+
+    with_images = [i for i, item in enumerate(items) if item.image_bytes]
+    if with_images:
+        image_vectors = embedder.embed_images([items[i].image_bytes for i in with_images])
+        vectors[with_images] += image_vectors
+        norms = np.linalg.norm(vectors[with_images], axis=1, keepdims=True)
+        vectors[with_images] /= np.where(norms > 0, norms, 1.0)
+    return vectors
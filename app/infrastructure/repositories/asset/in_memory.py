@@ -0,0 +1,281 @@
+"""
+In-Memory Asset Repository
+
+In-process stand-in for WeaviateAssetRepository (fake mode, tests, reuse benchmarks):
+- Hash indexes on brand_id, product_name, aspect_ratio, locale and tags, so
+  filtered lookups touch only matching rows
+- Vectors live in one contiguous float32 matrix; candidates are ranked with a
+  single NumPy matrix-vector product (cosine on L2-normalized rows)
+- Embeddings come from a pluggable IEmbeddingAdapter (deterministic hashing by default)
+"""
+import dataclasses
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+from app.adapters.embedding.fake import HashingEmbeddingAdapter
+from app.adapters.embedding.protocol import IEmbeddingAdapter
+from app.entities.creative_asset import CreativeAsset
+from app.infrastructure.repositories.asset.dto import AssetWithImage, BatchFailure, SeedAsset
+from app.infrastructure.repositories.asset.embedding import embed_assets
+
+
+INDEXED_FIELDS = ("brand_id", "product_name", "aspect_ratio", "locale")
+SEED_TAGS = ("seed", "uploaded")
+INITIAL_CAPACITY = 1024
+QUERY_CACHE_SIZE = 1024
+
+
+@dataclass
+class _Record:
+    """Row payload (the vector lives in the shared matrix at the same row)."""
+    asset: CreativeAsset
+    tags: List[str]
+    palette: List[str]
+
+
+class InMemoryAssetRepository:
+    """In-memory asset repository implementing IAssetRepository protocol."""
+
+    def __init__(self, embedder: Optional[IEmbeddingAdapter] = None):
+        """
+        Args:
+            embedder: Text/image embedder (default: deterministic HashingEmbeddingAdapter)
+        """
+        self.embedder = embedder or HashingEmbeddingAdapter()
+        self._records: List[_Record] = []
+        self._row_by_id: Dict[str, int] = {}
+        self._index: Dict[Tuple[str, str], Set[int]] = {}
+        self._vectors = np.zeros((INITIAL_CAPACITY, self.embedder.dimensions), dtype=np.float32)
+        self._lock = threading.RLock()
+        # Reuse queries repeat per product/aspect; embed each query text once
+        self._embed_query = lru_cache(maxsize=QUERY_CACHE_SIZE)(self._embed_query_uncached)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def upsert(
+        self,
+        asset: CreativeAsset,
+        image_bytes: Optional[bytes] = None,
+        tags: Optional[List[str]] = None,
+        palette: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Insert or replace an asset (keyed by asset_id).
+
+        Args:
+            asset: CreativeAsset entity
+            image_bytes: Image data (embedded together with the asset's text fields)
+            tags: Tags for filtering (e.g., ["seed", "uploaded"] or ["generated"])
+            palette: Hex color palette
+        """
+        self.upsert_many([AssetWithImage(asset=asset, image_bytes=image_bytes, tags=tags, palette=palette)])
+
+    def upsert_many(self, items: Iterable[AssetWithImage]) -> List[BatchFailure]:
+        """
+        Index many assets, embedding texts and images in one batch each.
+
+        Args:
+            items: Assets with image bytes, tags and palette
+
+        Returns:
+            Always empty (in-process writes cannot partially fail)
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        vectors = embed_assets(self.embedder, items)
+        with self._lock:
+            for item, vector in zip(items, vectors):
+                self._write(item, vector)
+        return []
+
+    def get_by_id(self, asset_id: str, brand_id: Optional[str] = None) -> Optional[CreativeAsset]:
+        """
+        Exact lookup by asset_id.
+
+        Args:
+            asset_id: Asset identifier
+            brand_id: Only return the asset if it belongs to this brand
+
+        Returns:
+            CreativeAsset copy (reused=True, meta has storage_path and text_bbox), or None
+        """
+        with self._lock:
+            row = self._row_by_id.get(asset_id)
+            if row is None:
+                return None
+            asset = self._records[row].asset
+            if brand_id and asset.brand_id != brand_id:
+                return None
+            return dataclasses.replace(asset, reused=True, meta=_reused_meta(asset))
+
+    def find_existing(
+        self,
+        product_name: str,
+        aspect_ratio: str,
+        locale: str = "en-US",
+        limit: int = 3,
+        brand_id: Optional[str] = None,
+    ) -> List[CreativeAsset]:
+        """
+        Find reusable assets: exact filter via hash indexes, ranked by cosine similarity.
+
+        Args:
+            product_name: Product to search for
+            aspect_ratio: Aspect ratio filter
+            locale: Locale filter
+            limit: Max results
+            brand_id: Optional brand filter
+
+        Returns:
+            List of matching CreativeAsset copies (reused=True, meta has storage_path, text_bbox and score)
+        """
+        with self._lock:
+            filters = [
+                self._index.get(("product_name", product_name), set()),
+                self._index.get(("aspect_ratio", aspect_ratio), set()),
+                self._index.get(("locale", locale), set()),
+            ]
+            if brand_id:
+                filters.append(self._index.get(("brand_id", brand_id), set()))
+            rows = self._intersect(*filters)
+            ranked = self._rank(rows, f"{product_name} hero {aspect_ratio}", limit)
+            return [
+                dataclasses.replace(
+                    self._records[row].asset,
+                    reused=True,
+                    meta=_reused_meta(self._records[row].asset, score=score),
+                )
+                for row, score in ranked
+            ]
+
+    def find_seeds(
+        self, brand_id: str, product_name: Optional[str] = None, limit: int = 5
+    ) -> List[SeedAsset]:
+        """
+        Find seed assets (uploaded by user) for a brand.
+
+        Args:
+            brand_id: Brand identifier
+            product_name: Optional product filter
+            limit: Max results
+
+        Returns:
+            List of SeedAsset references (load image bytes via storage_path)
+        """
+        with self._lock:
+            seed_rows = set().union(*(self._index.get(("tags", tag), set()) for tag in SEED_TAGS))
+            filters = [self._index.get(("brand_id", brand_id), set()), seed_rows]
+            if product_name:
+                filters.append(self._index.get(("product_name", product_name), set()))
+            ranked = self._rank(self._intersect(*filters), f"{brand_id} seed", limit)
+
+            seeds = []
+            for row, score in ranked:
+                record = self._records[row]
+                seeds.append(
+                    SeedAsset(
+                        asset_id=record.asset.asset_id,
+                        brand_id=record.asset.brand_id,
+                        product_name=record.asset.product_name,
+                        image_url=record.asset.image_url,
+                        storage_path=(record.asset.meta or {}).get("storage_path") or "",
+                        palette=list(record.palette),
+                        score=score,
+                    )
+                )
+            return seeds
+
+    def iter_phashes(self) -> Iterator[Tuple[str, str, int]]:
+        """
+        Stored perceptual hashes (to warm the dedup index).
+
+        Yields:
+            (brand_id, asset_id, phash) for every asset with meta["phash"]
+        """
+        with self._lock:
+            records = list(self._records)
+        for record in records:
+            phash = (record.asset.meta or {}).get("phash")
+            if phash:
+                yield record.asset.brand_id, record.asset.asset_id, int(phash, 16)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _embed_query_uncached(self, text: str) -> np.ndarray:
+        return self.embedder.embed_texts([text])[0]
+
+    def _write(self, item: AssetWithImage, vector: np.ndarray) -> None:
+        """Store one record and vector, replacing an existing row for the same asset_id."""
+        record = _Record(asset=item.asset, tags=list(item.tags or ["generated"]), palette=list(item.palette or []))
+
+        row = self._row_by_id.get(item.asset.asset_id)
+        if row is None:
+            row = len(self._records)
+            self._records.append(record)
+            self._row_by_id[item.asset.asset_id] = row
+            self._grow(row + 1)
+        else:
+            for key in self._keys_of(self._records[row]):
+                self._index[key].discard(row)
+            self._records[row] = record
+
+        self._vectors[row] = vector
+        for key in self._keys_of(record):
+            self._index.setdefault(key, set()).add(row)
+
+    @staticmethod
+    def _keys_of(record: _Record) -> List[Tuple[str, str]]:
+        keys = [(field, getattr(record.asset, field)) for field in INDEXED_FIELDS]
+        keys.extend(("tags", tag) for tag in record.tags)
+        return keys
+
+    def _grow(self, rows: int) -> None:
+        """Double matrix capacity when full (amortized O(1) appends)."""
+        capacity = self._vectors.shape[0]
+        if rows <= capacity:
+            return
+        while capacity < rows:
+            capacity *= 2
+        grown = np.zeros((capacity, self._vectors.shape[1]), dtype=np.float32)
+        grown[:len(self._records) - 1] = self._vectors[:len(self._records) - 1]
+        self._vectors = grown
+
+    @staticmethod
+    def _intersect(*sets: Set[int]) -> Set[int]:
+        """Intersect index postings, smallest first."""
+        ordered = sorted(sets, key=len)
+        if not ordered or not ordered[0]:
+            return set()
+        return ordered[0].intersection(*ordered[1:])
+
+    def _rank(self, rows: Set[int], query: str, limit: int) -> List[Tuple[int, float]]:
+        """Top-`limit` candidate rows by cosine similarity to the query text."""
+        if not rows or limit <= 0:
+            return []
+        candidates = np.fromiter(rows, dtype=np.intp, count=len(rows))
+        scores = self._vectors[candidates] @ self._embed_query(query)
+
+        if len(candidates) > limit:
+            top = np.argpartition(-scores, limit - 1)[:limit]
+        else:
+            top = np.arange(len(candidates))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(candidates[i]), float(scores[i])) for i in top]
+
+
+def _reused_meta(asset: CreativeAsset, **extra) -> dict:
+    """Meta handed out with a reused asset: storage key, overlay text box, and `extra`."""
+    meta = {"storage_path": (asset.meta or {}).get("storage_path", "")}
+    if (asset.meta or {}).get("text_bbox"):
+        meta["text_bbox"] = list(asset.meta["text_bbox"])
+    meta.update(extra)
+    return meta
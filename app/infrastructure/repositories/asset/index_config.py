@@ -0,0 +1,113 @@
+"""
+BrandAsset Vector Index Configuration
+
+HNSW and quantization settings for the BrandAsset collection, read from config:
+- ef / dynamic ef: query-time recall vs latency (mutable on a live collection)
+- efConstruction / maxConnections: graph quality vs build time and memory
+  (fixed when the collection is created)
+- Quantization: "pq" (product), "bq" (binary), "sq" (scalar) or "none";
+  compressed vectors stay in memory, full vectors are read from disk for rescoring
+
+Rough memory per vector (d dimensions, m = maxConnections):
+  none: 4*d + 16*m bytes   pq: segments + 16*m   bq: d/8 + 16*m   sq: d + 16*m
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+from weaviate.classes.config import Configure, Reconfigure
+
+from app.infrastructure.config import settings
+
+
+QUANTIZERS = ("none", "pq", "bq", "sq")
+
+
+@dataclass(frozen=True)
+class VectorIndexSettings:
+    """HNSW + quantizer parameters (None = Weaviate default)."""
+    ef: Optional[int] = None
+    ef_construction: Optional[int] = None
+    max_connections: Optional[int] = None
+    vector_cache_max_objects: Optional[int] = None
+    quantizer: str = "none"
+    pq_segments: Optional[int] = None
+    training_limit: Optional[int] = None
+    rescore_limit: Optional[int] = None
+
+    def __post_init__(self):
+        if self.quantizer not in QUANTIZERS:
+            raise ValueError(f"Unknown quantizer: {self.quantizer} (expected one of {QUANTIZERS})")
+
+    @classmethod
+    def from_settings(cls) -> "VectorIndexSettings":
+        """Build from WEAVIATE_HNSW_* / WEAVIATE_QUANTIZER* settings (0 = default)."""
+        return cls(
+            ef=settings.WEAVIATE_HNSW_EF or None,
+            ef_construction=settings.WEAVIATE_HNSW_EF_CONSTRUCTION or None,
+            max_connections=settings.WEAVIATE_HNSW_MAX_CONNECTIONS or None,
+            vector_cache_max_objects=settings.WEAVIATE_VECTOR_CACHE_MAX_OBJECTS or None,
+            quantizer=settings.WEAVIATE_QUANTIZER,
+            pq_segments=settings.WEAVIATE_PQ_SEGMENTS or None,
+            training_limit=settings.WEAVIATE_QUANTIZER_TRAINING_LIMIT or None,
+            rescore_limit=settings.WEAVIATE_QUANTIZER_RESCORE_LIMIT or None,
+        )
+
+
+def hnsw_config(index: VectorIndexSettings):
+    """Vector index config for collection creation."""
+    return Configure.VectorIndex.hnsw(
+        ef=index.ef,
+        ef_construction=index.ef_construction,
+        max_connections=index.max_connections,
+        vector_cache_max_objects=index.vector_cache_max_objects,
+        quantizer=_quantizer_create(index),
+    )
+
+
+def hnsw_update(index: VectorIndexSettings):
+    """Vector index update for an existing collection (mutable parameters only)."""
+    return Reconfigure.VectorIndex.hnsw(
+        ef=index.ef,
+        vector_cache_max_objects=index.vector_cache_max_objects,
+        quantizer=_quantizer_update(index),
+    )
+
+
+def needs_update(index: VectorIndexSettings, current) -> bool:
+    """
+    Whether a live collection's index config lags the configured one.
+
+    Args:
+        index: Configured settings
+        current: `collection.config.get().vector_index_config`
+    """
+    if current is None:
+        return False
+    if index.ef is not None and current.ef != index.ef:
+        return True
+    if index.vector_cache_max_objects is not None and current.vector_cache_max_objects != index.vector_cache_max_objects:
+        return True
+    # Quantization can be enabled on a live collection, but not switched or disabled
+    return index.quantizer != "none" and current.quantizer is None
+
+
+def _quantizer_create(index: VectorIndexSettings):
+    q = Configure.VectorIndex.Quantizer
+    if index.quantizer == "pq":
+        return q.pq(segments=index.pq_segments, training_limit=index.training_limit)
+    if index.quantizer == "bq":
+        return q.bq(rescore_limit=index.rescore_limit)
+    if index.quantizer == "sq":
+        return q.sq(rescore_limit=index.rescore_limit, training_limit=index.training_limit)
+    return None
+
+
+def _quantizer_update(index: VectorIndexSettings):
+    q = Reconfigure.VectorIndex.Quantizer
+    if index.quantizer == "pq":
+        return q.pq(segments=index.pq_segments, training_limit=index.training_limit)
+    if index.quantizer == "bq":
+        return q.bq(rescore_limit=index.rescore_limit)
+    if index.quantizer == "sq":
+        return q.sq(rescore_limit=index.rescore_limit, training_limit=index.training_limit)
+    return None
@@ -0,0 +1,50 @@
+"""
+Asset Repository Protocol
+
+Defines contract for asset indexing and reuse/seed lookups:
+- In-memory index with NumPy vector search (fake mode, benchmarks)
+- Weaviate vector store (real)
+"""
+from typing import Iterable, List, Optional, Protocol
+
+from app.entities.creative_asset import CreativeAsset
+from app.infrastructure.repositories.asset.dto import AssetWithImage, BatchFailure, SeedAsset
+
+
+class IAssetRepository(Protocol):
+    """Interface for asset repositories."""
+
+    def upsert(
+        self,
+        asset: CreativeAsset,
+        image_bytes: Optional[bytes] = None,
+        tags: Optional[List[str]] = None,
+        palette: Optional[List[str]] = None,
+    ) -> None:
+        """Insert or replace one asset (keyed by asset_id)."""
+        ...
+
+    def upsert_many(self, items: Iterable[AssetWithImage]) -> List[BatchFailure]:
+        """Insert or replace many assets; returns per-object failures."""
+        ...
+
+    def get_by_id(self, asset_id: str, brand_id: Optional[str] = None) -> Optional[CreativeAsset]:
+        """Exact lookup by asset_id (optionally only within one brand)."""
+        ...
+
+    def find_existing(
+        self,
+        product_name: str,
+        aspect_ratio: str,
+        locale: str = "en-US",
+        limit: int = 3,
+        brand_id: Optional[str] = None,
+    ) -> List[CreativeAsset]:
+        """Find reusable assets for a product/aspect/locale (optionally within one brand)."""
+        ...
+
+    def find_seeds(
+        self, brand_id: str, product_name: Optional[str] = None, limit: int = 5
+    ) -> List[SeedAsset]:
+        """Find uploaded seed images for a brand."""
+        ...
@@ -0,0 +1,51 @@
+"""
+Vectorization Thumbnails
+
+CLIP resizes every image to 224 px and center-crops it before embedding, so
+sending the full-resolution PNG to Weaviate only inflates the BLOB property,
+vectorizer payloads and gRPC transfer. The canonical image stays in object
+storage (image_url / storage_path); Weaviate gets this thumbnail.
+"""
+from io import BytesIO
+from typing import BinaryIO
+
+from PIL import Image, ImageOps
+
+
+def make_thumbnail(image_bytes: bytes, size: int = 224, quality: int = 90) -> bytes:
+    """
+    Build a small normalized thumbnail for vectorization.
+
+    Mirrors CLIP preprocessing: resize the short side to `size`, center-crop
+    to a square, RGB, JPEG-encoded.
+
+    Args:
+        image_bytes: Source image (any Pillow-readable format)
+        size: Output edge length in pixels
+        quality: JPEG quality
+
+    Returns:
+        JPEG bytes (typically a few KB)
+    """
+    output = BytesIO()
+    with Image.open(BytesIO(image_bytes)) as img:
+        img.draft("RGB", (size, size))  # Let JPEG decoders downscale while decoding
+        write_thumbnail(img, output, size=size, quality=quality)
+    return output.getvalue()
+
+
+def write_thumbnail(img: Image.Image, out: BinaryIO, size: int = 224, quality: int = 90) -> None:
+    """
+    Encode the thumbnail of an already-decoded image into a stream.
+
+    Lets callers that hold the pixels (e.g. the text overlay) skip an
+    encode/decode round trip through the full-size PNG.
+
+    Args:
+        img: Decoded source image (left unchanged)
+        out: Writable binary stream
+        size: Output edge length in pixels
+        quality: JPEG quality
+    """
+    thumb = ImageOps.fit(img.convert("RGB"), (size, size), Image.Resampling.BICUBIC)
+    thumb.save(out, format="JPEG", quality=quality)
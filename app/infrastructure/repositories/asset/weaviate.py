@@ -3,50 +3,165 @@ Weaviate Asset Repository
 
 Stores and searches brand assets (seed images, generated creatives) using Weaviate vector database.
 Uses multi2vec-clip for image vectorization and similarity search.
+
+Optional bring-your-own-vector ingestion (EMBEDDING_BACKEND): with an embedder,
+vectors are computed in the application in batches (cached by content hash)
+and supplied on insert; queries pass their own query vector. New collections
+are then created without a server-side vectorizer.
+
+Optional multi-tenancy (WEAVIATE_MULTI_TENANCY): each brand_id is a tenant of
+the BrandAssetByBrand collection, so a brand's queries only touch its own
+shard. Tenants are created on first write, activated on first use, and
+deactivated/offloaded after WEAVIATE_TENANT_IDLE_SECONDS without use.
 """
 import base64
-from typing import Optional, List
+import functools
+import json
+import re
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, Optional, List, Tuple
 from datetime import datetime
 import weaviate
 from weaviate.classes.config import Property, DataType, Configure
-from weaviate.classes.query import Filter
+from weaviate.classes.query import Filter, MetadataQuery
+from weaviate.classes.tenants import Tenant, TenantActivityStatus
+from weaviate.exceptions import UnexpectedStatusCodeError
+from weaviate.util import generate_uuid5
 
+from app.adapters.embedding.protocol import IEmbeddingAdapter
+from app.adapters.storage.keys import key_from_uri
 from app.entities.creative_asset import CreativeAsset
 from app.infrastructure.config import settings
+from app.infrastructure.weaviate_connection import WeaviateConnectionManager
+from app.infrastructure.repositories.asset.dto import AssetWithImage, BatchFailure, SeedAsset
+from app.infrastructure.repositories.asset.embedding import embed_assets
+from app.infrastructure.repositories.asset.index_config import (
+    VectorIndexSettings,
+    hnsw_config,
+    hnsw_update,
+    needs_update,
+)
+from app.infrastructure.repositories.asset.thumbnail import make_thumbnail
 
 
 COLLECTION_NAME = "BrandAsset"
+TENANT_COLLECTION_NAME = "BrandAssetByBrand"  # Multi-tenancy cannot be enabled on an existing collection
+DELETE_CHUNK_SIZE = 1000
+ADDED_TEXT_PROPERTIES = ["storage_path", "phash", "text_bbox"]
+
+# Query projections: never return the image BLOB or vectors from lookups
+EXISTING_ASSET_PROPERTIES = [
+    "asset_id",
+    "brand_id",
+    "product_name",
+    "locale",
+    "aspect_ratio",
+    "message",
+    "image_url",
+    "storage_path",
+    "text_bbox",
+]
+SEED_ASSET_PROPERTIES = [
+    "asset_id",
+    "brand_id",
+    "product_name",
+    "image_url",
+    "storage_path",
+    "palette",
+]
 
 
 class WeaviateAssetRepository:
     """Asset repository using Weaviate with multi2vec-clip for image search."""
 
-    def __init__(self):
-        self.client = weaviate.connect_to_local(
-            host=settings.WEAVIATE_HOST,
-            port=settings.WEAVIATE_HTTP_PORT,
-            grpc_port=settings.WEAVIATE_GRPC_PORT,
+    def __init__(
+        self,
+        connection: Optional[WeaviateConnectionManager] = None,
+        multi_tenancy: Optional[bool] = None,
+        embedder: Optional[IEmbeddingAdapter] = None,
+    ):
+        """
+        Args:
+            connection: Connection manager to borrow the client from (default: process-wide)
+            multi_tenancy: One tenant per brand_id (default: settings.WEAVIATE_MULTI_TENANCY)
+            embedder: Compute vectors in-process and supply them on insert
+                (default: None, Weaviate's multi2vec-clip module vectorizes)
+        """
+        self.multi_tenancy = settings.WEAVIATE_MULTI_TENANCY if multi_tenancy is None else multi_tenancy
+        self.collection_name = TENANT_COLLECTION_NAME if self.multi_tenancy else COLLECTION_NAME
+        self.embedder = embedder
+        self.embedding_batch_size = settings.EMBEDDING_BATCH_SIZE
+        self.connection = connection or WeaviateConnectionManager.instance()
+        self.collection = self.connection.ensure_collection(
+            self.collection_name,
+            functools.partial(
+                self._ensure_schema,
+                name=self.collection_name,
+                multi_tenancy=self.multi_tenancy,
+                vectorize=embedder is None,
+            ),
         )
-        self._ensure_schema()
-        self.collection = self.client.collections.get(COLLECTION_NAME)
+        self.client = self.connection.client
+
+        self.tenant_idle_seconds = settings.WEAVIATE_TENANT_IDLE_SECONDS
+        self._active_tenants: set = set()
+        self._last_used: Dict[str, float] = {}
+        self._last_sweep = time.monotonic()
+        self._tenant_lock = threading.Lock()
+
+    @staticmethod
+    def _ensure_schema(
+        client: weaviate.WeaviateClient,
+        name: str = COLLECTION_NAME,
+        multi_tenancy: bool = False,
+        vectorize: bool = True,
+    ) -> None:
+        """
+        Create BrandAsset collection schema if it doesn't exist.
+
+        With `vectorize=False` (vectors supplied by the application) new
+        collections get no vectorizer. Existing multi2vec-clip collections keep
+        theirs; supplied vectors simply skip server-side vectorization.
+        """
+        if client.collections.exists(name):
+            # Collections created before these properties existed get them added in place
+            collection = client.collections.get(name)
+            config = collection.config.get()
+            existing = {p.name for p in config.properties}
+            for prop_name in ADDED_TEXT_PROPERTIES:
+                if prop_name not in existing:
+                    collection.config.add_property(Property(name=prop_name, data_type=DataType.TEXT))
 
-    def _ensure_schema(self) -> None:
-        """Create BrandAsset collection schema if it doesn't exist."""
-        if COLLECTION_NAME in self.client.collections.list_all():
+            # Apply mutable index settings (ef, cache size, enabling quantization)
+            index = VectorIndexSettings.from_settings()
+            if needs_update(index, config.vector_index_config):
+                collection.config.update(vector_index_config=hnsw_update(index))
             return
 
-        self.client.collections.create(
-            name=COLLECTION_NAME,
+        client.collections.create(
+            name=name,
             description="Seed assets and generated campaign creatives",
-            vectorizer_config=Configure.Vectorizer.multi2vec_clip(
-                image_fields=["image"],
-                text_fields=[
-                    "message",
-                    "tags",
-                    "product_name",
-                    "locale",
-                    "aspect_ratio",
-                ],
+            vector_index_config=hnsw_config(VectorIndexSettings.from_settings()),
+            multi_tenancy_config=(
+                Configure.multi_tenancy(enabled=True, auto_tenant_creation=True, auto_tenant_activation=True)
+                if multi_tenancy
+                else None
+            ),
+            vectorizer_config=(
+                Configure.Vectorizer.multi2vec_clip(
+                    image_fields=["image"],
+                    text_fields=[
+                        "message",
+                        "tags",
+                        "product_name",
+                        "locale",
+                        "aspect_ratio",
+                    ],
+                )
+                if vectorize
+                else Configure.Vectorizer.none()
             ),
             properties=[
                 Property(name="asset_id", data_type=DataType.TEXT),
@@ -57,8 +172,11 @@ class WeaviateAssetRepository:
                 Property(name="message", data_type=DataType.TEXT),
                 Property(name="tags", data_type=DataType.TEXT_ARRAY),
                 Property(name="image_url", data_type=DataType.TEXT),
+                Property(name="storage_path", data_type=DataType.TEXT),  # Key of canonical image
                 Property(name="palette", data_type=DataType.TEXT_ARRAY),  # Hex colors
-                Property(name="image", data_type=DataType.BLOB),  # For vectorization
+                Property(name="phash", data_type=DataType.TEXT),  # Perceptual hash (hex) for dedup
+                Property(name="text_bbox", data_type=DataType.TEXT),  # Overlay text box, JSON [l, t, r, b]
+                Property(name="image", data_type=DataType.BLOB),  # Thumbnail for vectorization
             ],
         )
 
@@ -72,12 +190,334 @@ class WeaviateAssetRepository:
         """
         Insert or update asset in Weaviate.
 
+        The object UUID is derived from asset_id, so re-indexing the same
+        asset replaces it instead of adding a duplicate.
+
         Args:
             asset: CreativeAsset entity
-            image_bytes: Image data for vectorization
+            image_bytes: Image data (downscaled to a thumbnail for vectorization)
             tags: Tags for filtering (e.g., ["seed", "uploaded"] or ["generated"])
             palette: Hex color palette (e.g., ["#FF5733", "#C70039"])
         """
+        uuid = self.object_uuid(asset.asset_id)
+        properties = self._to_properties(asset, image_bytes, tags, palette, include_image=self.embedder is None)
+        vector = None
+        if self.embedder is not None:
+            item = AssetWithImage(asset=asset, image_bytes=image_bytes, tags=tags, palette=palette)
+            vector = embed_assets(self.embedder, [item])[0].tolist()
+        collection = self._scoped(asset.brand_id)
+        try:
+            collection.data.insert(properties, uuid=uuid, vector=vector)
+        except UnexpectedStatusCodeError as e:
+            if e.status_code != 422:  # 422: object with this UUID already exists
+                raise
+            collection.data.replace(uuid=uuid, properties=properties, vector=vector)
+
+    def upsert_many(
+        self,
+        items: Iterable[AssetWithImage],
+        batch_size: Optional[int] = None,
+        concurrent_requests: Optional[int] = None,
+    ) -> List[BatchFailure]:
+        """
+        Index many assets with Weaviate's batch API.
+
+        Uses dynamic batching (server-load adaptive) unless a fixed batch size
+        is configured, in which case `concurrent_requests` batches are in flight.
+        With an embedder, items are embedded EMBEDDING_BATCH_SIZE at a time
+        and their vectors sent along with the objects.
+
+        Args:
+            items: Assets with image bytes, tags and palette
+            batch_size: Fixed batch size (default: settings.WEAVIATE_BATCH_SIZE; 0 = dynamic)
+            concurrent_requests: Parallel batch requests for fixed-size mode
+
+        Returns:
+            One BatchFailure per object that could not be written (empty on success)
+        """
+        batch_size = settings.WEAVIATE_BATCH_SIZE if batch_size is None else batch_size
+        concurrent_requests = concurrent_requests or settings.WEAVIATE_BATCH_CONCURRENCY
+
+        # Client-level batch: one stream even when items span several brand tenants
+        if batch_size:
+            batcher = self.client.batch.fixed_size(
+                batch_size=batch_size,
+                concurrent_requests=concurrent_requests,
+            )
+        else:
+            batcher = self.client.batch.dynamic()
+
+        include_image = self.embedder is None
+        with batcher as batch:
+            for chunk, vectors in self._with_vectors(items):
+                for item, vector in zip(chunk, vectors):
+                    # Deterministic UUID: batch writes replace existing objects
+                    batch.add_object(
+                        collection=self.collection_name,
+                        properties=self._to_properties(
+                            item.asset, item.image_bytes, item.tags, item.palette, include_image=include_image
+                        ),
+                        uuid=self.object_uuid(item.asset.asset_id),
+                        vector=vector,
+                        tenant=self._tenant_for(item.asset.brand_id),
+                    )
+
+        return [
+            BatchFailure(
+                asset_id=(failed.object_.properties or {}).get("asset_id", ""),
+                message=failed.message,
+            )
+            for failed in self.client.batch.failed_objects
+        ]
+
+    def _with_vectors(self, items: Iterable[AssetWithImage]) -> Iterator[Tuple[List[AssetWithImage], list]]:
+        """
+        Group items into embedding batches.
+
+        Yields:
+            (items, vectors) per chunk; vectors are None without an embedder
+        """
+        if self.embedder is None:
+            for item in items:
+                yield [item], [None]
+            return
+
+        chunk: List[AssetWithImage] = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= self.embedding_batch_size:
+                yield chunk, embed_assets(self.embedder, chunk).tolist()
+                chunk = []
+        if chunk:
+            yield chunk, embed_assets(self.embedder, chunk).tolist()
+
+    def _query_vector(self, text: str) -> Optional[List[float]]:
+        """Query vector from the in-process embedder (None: Weaviate vectorizes the query)."""
+        if self.embedder is None:
+            return None
+        return self.embedder.embed_texts([text])[0].tolist()
+
+    @staticmethod
+    def object_uuid(asset_id: str) -> str:
+        """Deterministic Weaviate object UUID for an asset (uuid5 of asset_id)."""
+        return generate_uuid5(asset_id, COLLECTION_NAME)
+
+    def compact(self) -> Dict[str, int]:
+        """
+        Deduplicate objects written before UUIDs were deterministic.
+
+        For each asset_id, keeps the object stored under its deterministic
+        UUID (or re-keys the most recently created duplicate to it, keeping
+        its vector) and deletes the rest.
+
+        Returns:
+            Counts: scanned objects, distinct asset_ids, re-keyed and deleted objects
+        """
+        if not self.multi_tenancy:
+            return self._compact(self.collection)
+
+        totals = defaultdict(int)
+        for tenant in self.collection.tenants.get():
+            for key, value in self._compact(self._scoped(tenant)).items():
+                totals[key] += value
+        return dict(totals)
+
+    def _compact(self, collection) -> Dict[str, int]:
+        """compact() for one collection (or one tenant)."""
+        # Pass 1: only ids and creation times (no blobs, no vectors)
+        groups = defaultdict(list)
+        scanned = 0
+        for obj in collection.iterator(
+            return_properties=["asset_id"],
+            return_metadata=MetadataQuery(creation_time=True),
+        ):
+            scanned += 1
+            groups[obj.properties.get("asset_id", "")].append(
+                (obj.metadata.creation_time, str(obj.uuid))
+            )
+
+        rekeyed = 0
+        to_delete = []
+        for asset_id, objects in groups.items():
+            if not asset_id:
+                continue
+            canonical = self.object_uuid(asset_id)
+            uuids = [uuid for _, uuid in objects]
+            if canonical not in uuids:
+                # Pass 2 (only where needed): copy newest duplicate to the canonical UUID
+                _, newest = max(objects)
+                source = collection.query.fetch_object_by_id(newest, include_vector=True)
+                collection.data.insert(
+                    source.properties,
+                    uuid=canonical,
+                    vector=source.vector.get("default") if source.vector else None,
+                )
+                rekeyed += 1
+            to_delete.extend(uuid for uuid in uuids if uuid != canonical)
+
+        for start in range(0, len(to_delete), DELETE_CHUNK_SIZE):
+            chunk = to_delete[start:start + DELETE_CHUNK_SIZE]
+            collection.data.delete_many(where=Filter.by_id().contains_any(chunk))
+
+        return {
+            "scanned": scanned,
+            "asset_ids": len(groups),
+            "rekeyed": rekeyed,
+            "deleted": len(to_delete),
+        }
+
+    def iter_phashes(self) -> Iterator[Tuple[str, str, int]]:
+        """
+        Stream stored perceptual hashes (to warm the dedup index at startup).
+
+        Yields:
+            (brand_id, asset_id, phash) for every object that has a hash
+        """
+        if self.multi_tenancy:
+            # Only active tenants: warming the index must not wake offloaded brands
+            collections = [
+                self.collection.with_tenant(name)
+                for name, tenant in self.collection.tenants.get().items()
+                if tenant.activity_status == TenantActivityStatus.ACTIVE
+            ]
+        else:
+            collections = [self.collection]
+
+        for collection in collections:
+            for obj in collection.iterator(return_properties=["asset_id", "brand_id", "phash"]):
+                phash = obj.properties.get("phash")
+                if phash:
+                    yield obj.properties.get("brand_id", ""), obj.properties.get("asset_id", ""), int(phash, 16)
+
+    # ------------------------------------------------------------------
+    # Multi-tenancy
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def tenant_name(brand_id: str) -> str:
+        """Tenant name for a brand (Weaviate allows [A-Za-z0-9_-], max 64 chars)."""
+        return re.sub(r"[^A-Za-z0-9_-]", "_", brand_id)[:64] or "_"
+
+    def offload_inactive(self, idle_seconds: Optional[float] = None) -> List[str]:
+        """
+        Deactivate (or offload) tenants this process used but has left idle.
+
+        Inactive tenants release memory and file handles; auto activation
+        brings them back on their next query or write.
+
+        Args:
+            idle_seconds: Idle time before a tenant is released (default: WEAVIATE_TENANT_IDLE_SECONDS)
+
+        Returns:
+            Names of released tenants
+        """
+        if not self.multi_tenancy:
+            return []
+        idle_seconds = self.tenant_idle_seconds if idle_seconds is None else idle_seconds
+        now = time.monotonic()
+        with self._tenant_lock:
+            self._last_sweep = now
+            idle = [name for name, used in self._last_used.items() if now - used >= idle_seconds]
+            for name in idle:
+                self._active_tenants.discard(name)
+                del self._last_used[name]
+        if idle:
+            if settings.WEAVIATE_TENANT_OFFLOAD == "offloaded":
+                self.collection.tenants.offload(idle)  # Requires an offload module (e.g., offload-s3)
+            else:
+                self.collection.tenants.deactivate(idle)
+        return idle
+
+    def migrate_to_tenants(self) -> Dict[str, int]:
+        """
+        Copy objects from the shared BrandAsset collection into per-brand tenants.
+
+        UUIDs and vectors are kept, so nothing is re-vectorized. The source
+        collection is left untouched.
+
+        Returns:
+            Counts: copied objects, brands (tenants), failed objects
+        """
+        if not self.multi_tenancy:
+            raise ValueError("Multi-tenancy is not enabled (set WEAVIATE_MULTI_TENANCY=true)")
+
+        source = self.client.collections.get(COLLECTION_NAME)
+        copied = 0
+        brands = set()
+        with self.client.batch.fixed_size(batch_size=200) as batch:
+            for obj in source.iterator(include_vector=True):
+                brand_id = obj.properties.get("brand_id", "")
+                if not brand_id:
+                    continue
+                brands.add(brand_id)
+                batch.add_object(
+                    collection=self.collection_name,
+                    properties=obj.properties,
+                    uuid=obj.uuid,
+                    vector=obj.vector.get("default") if obj.vector else None,
+                    tenant=self._tenant_for(brand_id),
+                )
+                copied += 1
+
+        return {
+            "copied": copied,
+            "brands": len(brands),
+            "failed": len(self.client.batch.failed_objects),
+        }
+
+    def _tenant_for(self, brand_id: str) -> Optional[str]:
+        """Tenant to write a brand's objects to (created if missing), or None without multi-tenancy."""
+        if not self.multi_tenancy:
+            return None
+        self._scoped(brand_id)
+        return self.tenant_name(brand_id)
+
+    def _scoped(self, brand_id: str, create: bool = True):
+        """
+        Collection handle for a brand: its tenant in multi-tenant mode.
+
+        Tenant existence/activity is checked once per process; later calls
+        only record usage.
+
+        Returns:
+            Collection handle, or None if the brand has no tenant and `create` is False
+        """
+        if not self.multi_tenancy:
+            return self.collection
+
+        name = self.tenant_name(brand_id)
+        now = time.monotonic()
+        with self._tenant_lock:
+            known = name in self._active_tenants
+            sweep_due = now - self._last_sweep >= self.tenant_idle_seconds
+
+        if not known:
+            tenant = self.collection.tenants.get_by_name(name)
+            if tenant is None:
+                if not create:
+                    return None
+                self.collection.tenants.create([Tenant(name=name)])
+            elif tenant.activity_status != TenantActivityStatus.ACTIVE:
+                self.collection.tenants.activate(name)
+
+        with self._tenant_lock:
+            self._active_tenants.add(name)
+            self._last_used[name] = now
+
+        if sweep_due:
+            self.offload_inactive()
+        return self.collection.with_tenant(name)
+
+    @staticmethod
+    def _to_properties(
+        asset: CreativeAsset,
+        image_bytes: Optional[bytes],
+        tags: Optional[List[str]],
+        palette: Optional[List[str]],
+        include_image: bool = True,
+    ) -> dict:
+        """Map an asset to BrandAsset properties (the thumbnail only when Weaviate vectorizes)."""
+        text_bbox = (asset.meta or {}).get("text_bbox")
         data = {
             "asset_id": asset.asset_id,
             "brand_id": asset.brand_id,
@@ -87,14 +527,19 @@ class WeaviateAssetRepository:
             "message": asset.message,
             "tags": tags or ["generated"],
             "image_url": asset.image_url,
+            "storage_path": (asset.meta or {}).get("storage_path", ""),
+            "phash": (asset.meta or {}).get("phash", ""),
+            "text_bbox": json.dumps(text_bbox) if text_bbox else "",
             "palette": palette or [],
         }
 
-        # Add image blob for vectorization (base64-encoded)
-        if image_bytes:
-            data["image"] = base64.b64encode(image_bytes).decode("ascii")
+        # Add CLIP-sized thumbnail for vectorization (base64-encoded);
+        # the full-resolution image stays in object storage
+        if image_bytes and include_image:
+            thumbnail = make_thumbnail(image_bytes, size=settings.WEAVIATE_THUMBNAIL_SIZE)
+            data["image"] = base64.b64encode(thumbnail).decode("ascii")
 
-        self.collection.data.insert(data)
+        return data
 
     def find_existing(
         self,
@@ -102,6 +547,7 @@ class WeaviateAssetRepository:
         aspect_ratio: str,
         locale: str = "en-US",
         limit: int = 3,
+        brand_id: Optional[str] = None,
     ) -> List[CreativeAsset]:
         """
         Search for existing similar assets using hybrid search (vector + text).
@@ -111,6 +557,7 @@ class WeaviateAssetRepository:
             aspect_ratio: Aspect ratio filter
             locale: Locale filter
             limit: Max results
+            brand_id: Restrict to one brand (required in multi-tenant mode)
 
         Returns:
             List of matching CreativeAsset entities
@@ -122,39 +569,83 @@ class WeaviateAssetRepository:
             & Filter.by_property("locale").equal(locale)
         )
 
+        if self.multi_tenancy:
+            # A brand's tenant holds only its own assets; no cross-tenant search
+            collection = self._scoped(brand_id, create=False) if brand_id else None
+            if collection is None:
+                return []
+        else:
+            collection = self.collection
+            if brand_id:
+                where_filter &= Filter.by_property("brand_id").equal(brand_id)
+
         # Hybrid search (combines vector similarity + keyword matching)
-        result = self.collection.query.hybrid(
-            query=f"{product_name} hero {aspect_ratio}",
+        query = f"{product_name} hero {aspect_ratio}"
+        result = collection.query.hybrid(
+            query=query,
+            vector=self._query_vector(query),
             filters=where_filter,
             limit=limit,
+            return_properties=EXISTING_ASSET_PROPERTIES,
+            return_metadata=MetadataQuery(score=True),
+            include_vector=False,
         )
 
-        # Convert to CreativeAsset entities
-        assets = []
-        for obj in result.objects:
-            props = obj.properties
-            assets.append(
-                CreativeAsset(
-                    asset_id=props.get("asset_id", ""),
-                    brand_id=props.get("brand_id", ""),
-                    brief_id="",
-                    product_name=props.get("product_name", ""),
-                    audience="",  # Not stored for seeds
-                    locale=props.get("locale", "en-US"),
-                    aspect_ratio=props.get("aspect_ratio", "1:1"),
-                    message=props.get("message", ""),
-                    image_url=props.get("image_url", ""),
-                    reused=True,  # These are existing assets
-                    generated_at=datetime.now(),  # Placeholder
-                    meta={},
-                )
-            )
+        return [self._to_asset(obj.properties, score=obj.metadata.score) for obj in result.objects]
 
-        return assets
+    def get_by_id(self, asset_id: str, brand_id: Optional[str] = None) -> Optional[CreativeAsset]:
+        """
+        Exact lookup by asset_id (primary-key fetch of its deterministic UUID, no search).
+
+        Args:
+            asset_id: Asset identifier
+            brand_id: Only return the asset if it belongs to this brand (required in multi-tenant mode)
+
+        Returns:
+            CreativeAsset (reused=True), or None if not indexed
+        """
+        if self.multi_tenancy:
+            collection = self._scoped(brand_id, create=False) if brand_id else None
+            if collection is None:
+                return None
+        else:
+            collection = self.collection
+
+        obj = collection.query.fetch_object_by_id(
+            self.object_uuid(asset_id),
+            return_properties=EXISTING_ASSET_PROPERTIES,
+        )
+        if obj is None or (brand_id and obj.properties.get("brand_id") != brand_id):
+            return None
+        return self._to_asset(obj.properties)
+
+    @staticmethod
+    def _to_asset(props: dict, score: Optional[float] = None) -> CreativeAsset:
+        """Map stored properties back to a (reused) CreativeAsset."""
+        # Objects indexed before storage_path existed only have the save() URI
+        meta = {"storage_path": props.get("storage_path") or key_from_uri(props.get("image_url") or "")}
+        if props.get("text_bbox"):
+            meta["text_bbox"] = json.loads(props["text_bbox"])  # Lets validation re-check reused assets' text
+        if score is not None:
+            meta["score"] = score
+        return CreativeAsset(
+            asset_id=props.get("asset_id", ""),
+            brand_id=props.get("brand_id", ""),
+            brief_id="",
+            product_name=props.get("product_name", ""),
+            audience="",  # Not stored for seeds
+            locale=props.get("locale", "en-US"),
+            aspect_ratio=props.get("aspect_ratio", "1:1"),
+            message=props.get("message", ""),
+            image_url=props.get("image_url", ""),
+            reused=True,  # These are existing assets
+            generated_at=datetime.now(),  # Placeholder
+            meta=meta,
+        )
 
     def find_seeds(
         self, brand_id: str, product_name: Optional[str] = None, limit: int = 5
-    ) -> List[dict]:
+    ) -> List[SeedAsset]:
         """
         Find seed assets (uploaded by user) for a brand.
 
@@ -164,25 +655,42 @@ class WeaviateAssetRepository:
             limit: Max results
 
         Returns:
-            List of Weaviate objects with seed asset data
+            List of SeedAsset references (load image bytes via storage_path)
         """
-        where_filter = (
-            Filter.by_property("brand_id").equal(brand_id)
-            & Filter.by_property("tags").contains_any(["seed", "uploaded"])
-        )
-
+        where_filter = Filter.by_property("tags").contains_any(["seed", "uploaded"])
         if product_name:
             where_filter &= Filter.by_property("product_name").equal(product_name)
 
-        result = self.collection.query.hybrid(
-            query=f"{brand_id} seed",
+        if self.multi_tenancy:
+            collection = self._scoped(brand_id, create=False)
+            if collection is None:
+                return []
+        else:
+            collection = self.collection
+            where_filter &= Filter.by_property("brand_id").equal(brand_id)
+
+        query = f"{brand_id} seed"
+        result = collection.query.hybrid(
+            query=query,
+            vector=self._query_vector(query),
             filters=where_filter,
             limit=limit,
+            return_properties=SEED_ASSET_PROPERTIES,
+            return_metadata=MetadataQuery(score=True),
+            include_vector=False,
         )
 
-        return result.objects
-
-    def __del__(self):
-        """Close Weaviate client connection."""
-        if hasattr(self, "client"):
-            self.client.close()
+        return [
+            SeedAsset(
+                asset_id=obj.properties.get("asset_id", ""),
+                brand_id=obj.properties.get("brand_id", ""),
+                product_name=obj.properties.get("product_name", ""),
+                image_url=obj.properties.get("image_url", ""),
+                storage_path=(
+                    obj.properties.get("storage_path") or key_from_uri(obj.properties.get("image_url") or "")
+                ),
+                palette=list(obj.properties.get("palette") or []),
+                score=obj.metadata.score,
+            )
+            for obj in result.objects
+        ]
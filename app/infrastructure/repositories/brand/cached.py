@@ -0,0 +1,109 @@
+"""
+Cached Brand Repository
+
+Brand lookup cache in front of any IBrandRepository (typically Weaviate):
+- get_by_id results (including "not found") cached per brand_id
+- get_many serves cached brands and loads only the rest, in one bulk call
+- TTL + LRU bounded, shared across threads (one instance per process)
+
+upsert through this repository invalidates that brand immediately; the TTL
+bounds how stale writes made by other processes can appear. Cached
+BrandSummary instances are shared: callers treat brands as read-only.
+"""
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.entities.brand_summary import BrandSummary
+from app.infrastructure.cache import TTLCache
+from app.infrastructure.repositories.brand.protocol import IBrandRepository
+
+
+_MISSING = object()
+
+
+class CachedBrandRepository:
+    """Brand repository decorator caching brand loads."""
+
+    def __init__(
+        self,
+        inner: IBrandRepository,
+        ttl_seconds: float = 600.0,
+        max_entries: int = 1024,
+    ):
+        """
+        Args:
+            inner: Repository to delegate to
+            ttl_seconds: How long a loaded brand is served without a query
+            max_entries: Max cached brands (LRU eviction beyond this)
+        """
+        self.inner = inner
+        self.cache = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+    def get_by_id(self, brand_id: str) -> Optional[BrandSummary]:
+        """Cached brand load."""
+        return self.cache.get_or_load(brand_id, lambda: self.inner.get_by_id(brand_id))
+
+    def get_many(self, brand_ids: Iterable[str]) -> Dict[str, BrandSummary]:
+        """
+        Load several brands, querying only for those not cached.
+
+        Args:
+            brand_ids: Brand identifiers (duplicates allowed)
+
+        Returns:
+            Found brands by brand_id (unknown ids are omitted)
+        """
+        brands: Dict[str, BrandSummary] = {}
+        missing: List[str] = []
+        for brand_id in dict.fromkeys(brand_ids):
+            brand = self.cache.get(brand_id, _MISSING)
+            if brand is _MISSING:
+                missing.append(brand_id)
+            elif brand is not None:
+                brands[brand_id] = brand
+
+        if missing:
+            loaded = _load_many(self.inner, missing)
+            for brand_id in missing:
+                brand = loaded.get(brand_id)
+                self.cache.set(brand_id, brand)
+                if brand is not None:
+                    brands[brand_id] = brand
+        return brands
+
+    def search_similar(self, brand: BrandSummary, limit: int = 5) -> List[BrandSummary]:
+        """Similarity search is not cached (results depend on the whole catalog)."""
+        return self.inner.search_similar(brand, limit=limit)
+
+    def upsert(self, brand: BrandSummary) -> None:
+        """Write through, then drop the cached copy of this brand."""
+        self.inner.upsert(brand)
+        self.cache.invalidate(brand.brand_id)
+
+    def invalidate(self, brand_id: Optional[str] = None) -> None:
+        """Drop one cached brand, or all of them (e.g., after out-of-band edits)."""
+        if brand_id is None:
+            self.cache.clear()
+        else:
+            self.cache.invalidate(brand_id)
+
+    def stats(self) -> Dict[str, float]:
+        """Hit-rate metrics and occupancy of the brand cache."""
+        return self.cache.stats()
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate repository-specific operations to the inner repository."""
+        if name == "inner":
+            raise AttributeError(name)
+        return getattr(self.inner, name)
+
+
+def _load_many(repository: IBrandRepository, brand_ids: List[str]) -> Dict[str, BrandSummary]:
+    """Bulk load when the repository supports it, otherwise one get_by_id per brand."""
+    if hasattr(repository, "get_many"):
+        return repository.get_many(brand_ids)
+    brands = {}
+    for brand_id in brand_ids:
+        brand = repository.get_by_id(brand_id)
+        if brand is not None:
+            brands[brand_id] = brand
+    return brands
@@ -0,0 +1,299 @@
+"""
+File Brand Repository
+
+Brand catalog loaded from a directory of YAML/JSON files (no vector DB needed):
+- Each file holds one brand mapping, a list of brands, or {"brands": [...]}
+- Parsed brands are kept in a pickled snapshot (with each file's mtime/size),
+  so a cold start with hundreds of brands only stats the directory
+- refresh() re-parses only files whose mtime or size changed, drops brands of
+  deleted files, and rewrites the snapshot; lookups refresh at most every
+  `reload_seconds`, so edits show up without a restart
+- A malformed (or half-written) file is logged and skipped; the brands it
+  last parsed to stay in the catalog until it parses again
+- Each refresh builds a new snapshot and swaps it in, so lookups never see a
+  catalog mid-update; a brand_id defined in several files resolves to the
+  last file by name, and survives the removal of any one of them
+
+The snapshot is a private cache (delete it any time); never point it at
+untrusted files, since it is unpickled.
+"""
+import json
+import logging
+import os
+import pickle
+import re
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import yaml
+
+from app.entities.brand_summary import BrandSummary
+from app.infrastructure.config import settings
+
+
+SNAPSHOT_VERSION = 2
+BRAND_SUFFIXES = (".yaml", ".yml", ".json")
+TOKEN_RE = re.compile(r"\w+")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Snapshot:
+    """Pickled catalog state: parsed brands plus the file stats they came from (never mutated once built)."""
+    version: int = SNAPSHOT_VERSION
+    directory: str = ""
+    files: Dict[str, Tuple[int, int, List[BrandSummary]]] = field(default_factory=dict)  # name -> (mtime_ns, size, brands)
+    brands: Dict[str, BrandSummary] = field(default_factory=dict)
+
+
+class FileBrandRepository:
+    """Directory-backed brand repository implementing IBrandRepository protocol."""
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        snapshot_path: Optional[Path] = None,
+        reload_seconds: Optional[float] = None,
+    ):
+        """
+        Args:
+            directory: Folder of brand YAML/JSON files (default: settings.BRAND_DIR)
+            snapshot_path: Compiled snapshot file (default: settings.BRAND_SNAPSHOT)
+            reload_seconds: Min seconds between change scans on lookup (default: settings.BRAND_RELOAD_SECONDS)
+        """
+        self.directory = Path(directory or settings.BRAND_DIR)
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else settings.BRAND_SNAPSHOT
+        self.reload_seconds = settings.BRAND_RELOAD_SECONDS if reload_seconds is None else reload_seconds
+        self._lock = threading.RLock()
+        self._snapshot = self._load_snapshot()
+        self._last_scan = float("-inf")
+        self.refresh()
+
+    def get_by_id(self, brand_id: str) -> Optional[BrandSummary]:
+        """Load brand from the catalog."""
+        self._maybe_refresh()
+        return self._snapshot.brands.get(brand_id)
+
+    def get_many(self, brand_ids: Iterable[str]) -> Dict[str, BrandSummary]:
+        """Load several brands from the catalog."""
+        self._maybe_refresh()
+        brands = self._snapshot.brands
+        return {brand_id: brands[brand_id] for brand_id in brand_ids if brand_id in brands}
+
+    def list_ids(self) -> List[str]:
+        """All brand ids in the catalog, sorted."""
+        self._maybe_refresh()
+        return sorted(self._snapshot.brands)
+
+    def search_similar(self, brand: BrandSummary, limit: int = 5) -> List[BrandSummary]:
+        """
+        Rank other brands by word overlap (Jaccard) of description, tone and audiences.
+
+        Args:
+            brand: Reference brand
+            limit: Maximum number of results
+
+        Returns:
+            Most similar brands, best first (excluding `brand` itself)
+        """
+        self._maybe_refresh()
+        reference = _tokens(brand)
+        scored = []
+        for other in self._snapshot.brands.values():  # Snapshots are swapped, never mutated
+            if other.brand_id == brand.brand_id:
+                continue
+            tokens = _tokens(other)
+            union = reference | tokens
+            if union:
+                scored.append((len(reference & tokens) / len(union), other.brand_id, other))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [other for score, _, other in scored[:limit] if score > 0]
+
+    def upsert(self, brand: BrandSummary) -> None:
+        """
+        Write a brand to `<brand_id>.yaml` in the catalog directory.
+
+        Args:
+            brand: BrandSummary entity to persist
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        data = {
+            "brand_id": brand.brand_id,
+            "name": brand.name,
+            "description": brand.description,
+            "colors": list(brand.colors),
+            "typography": brand.typography,
+            "voice_tone": brand.voice_tone,
+            "target_audiences": list(brand.target_audiences),
+            "target_regions": list(brand.target_regions),
+            "products": list(brand.products),
+            "campaign_slogans": list(brand.campaign_slogans),
+            "logo_url": brand.logo_url,
+            "created_at": brand.created_at.isoformat(),
+            "updated_at": brand.updated_at.isoformat(),
+        }
+        path = self.directory / f"{brand.brand_id}.yaml"
+        _atomic_write(path, yaml.safe_dump(data, sort_keys=False, allow_unicode=True).encode("utf-8"))
+        self.refresh()
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Re-parse changed files and persist the snapshot if anything changed.
+
+        Returns:
+            Counts: parsed (new/changed) files, unchanged files, removed files,
+            failed (unparseable, previous brands kept) files, brands
+        """
+        with self._lock:
+            self._last_scan = time.monotonic()
+            files = dict(self._snapshot.files)
+            current = self._scan()
+
+            parsed = unchanged = failed = 0
+            for name, (mtime_ns, size) in current.items():
+                known = files.get(name)
+                if known and known[:2] == (mtime_ns, size):
+                    unchanged += 1
+                    continue
+                try:
+                    brands = self._parse(self.directory / name)
+                except ValueError as e:
+                    # Keep the last good brands; the unchanged stat makes the next scan retry
+                    logger.warning("Skipping brand file: %s", e)
+                    failed += 1
+                    continue
+                files[name] = (mtime_ns, size, brands)
+                parsed += 1
+
+            removed = [name for name in files if name not in current]
+            for name in removed:
+                del files[name]
+
+            if parsed or removed:
+                self._snapshot = _Snapshot(directory=self._snapshot.directory, files=files, brands=_merge(files))
+                self._save_snapshot()
+            return {
+                "parsed": parsed,
+                "unchanged": unchanged,
+                "removed": len(removed),
+                "failed": failed,
+                "brands": len(self._snapshot.brands),
+            }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _maybe_refresh(self) -> None:
+        if time.monotonic() - self._last_scan >= self.reload_seconds:
+            self.refresh()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        """Brand files in the directory with their (mtime_ns, size); stat only, no reads."""
+        if not self.directory.is_dir():
+            return {}
+        files = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.lower().endswith(BRAND_SUFFIXES):
+                    stat = entry.stat()
+                    files[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        return files
+
+    def _parse(self, path: Path) -> List[BrandSummary]:
+        """Parse one brand file into entities."""
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+            data = json.loads(raw) if path.suffix.lower() == ".json" else yaml.safe_load(raw)
+            if isinstance(data, dict) and "brands" in data:
+                data = data["brands"]
+            entries = data if isinstance(data, list) else [data]
+            fallback = datetime.fromtimestamp(path.stat().st_mtime)
+            return [_to_brand(entry, fallback) for entry in entries if entry]
+        except (OSError, ValueError, KeyError, TypeError, yaml.YAMLError) as e:
+            raise ValueError(f"Invalid brand file {path}: {e}") from e
+
+    def _load_snapshot(self) -> _Snapshot:
+        """Snapshot from a previous run, or an empty one if missing, stale or unreadable."""
+        if self.snapshot_path and self.snapshot_path.exists():
+            try:
+                with open(self.snapshot_path, "rb") as f:
+                    snapshot = pickle.load(f)
+                if (
+                    isinstance(snapshot, _Snapshot)
+                    and snapshot.version == SNAPSHOT_VERSION
+                    and snapshot.directory == str(self.directory.resolve())
+                ):
+                    return snapshot
+            except Exception:
+                pass  # Corrupt or incompatible cache: rebuild from the files
+        return _Snapshot(directory=str(self.directory.resolve()))
+
+    def _save_snapshot(self) -> None:
+        if not self.snapshot_path:
+            return
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write(self.snapshot_path, pickle.dumps(self._snapshot, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _merge(files: Dict[str, Tuple[int, int, List[BrandSummary]]]) -> Dict[str, BrandSummary]:
+    """Catalog from every file's brands (later file names win on duplicate ids)."""
+    brands: Dict[str, BrandSummary] = {}
+    for name in sorted(files):
+        for brand in files[name][2]:
+            brands[brand.brand_id] = brand
+    return brands
+
+
+def _to_brand(data: dict, fallback: datetime) -> BrandSummary:
+    """Map one brand mapping to a BrandSummary (timestamps default to the file mtime)."""
+    return BrandSummary(
+        brand_id=str(data["brand_id"]),
+        name=data["name"],
+        description=data.get("description", ""),
+        colors=list(data.get("colors") or []),
+        typography=data.get("typography"),
+        voice_tone=data.get("voice_tone", ""),
+        target_audiences=list(data.get("target_audiences") or []),
+        target_regions=list(data.get("target_regions") or []),
+        products=list(data.get("products") or []),
+        campaign_slogans=list(data.get("campaign_slogans") or []),
+        logo_url=data.get("logo_url") or None,
+        created_at=_to_datetime(data.get("created_at"), fallback),
+        updated_at=_to_datetime(data.get("updated_at"), fallback),
+    )
+
+
+def _to_datetime(value, fallback: datetime) -> datetime:
+    """Accept ISO strings and YAML timestamps/dates."""
+    if value is None or value == "":
+        return fallback
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, datetime.min.time())
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+
+
+def _tokens(brand: BrandSummary) -> set:
+    text = f"{brand.description} {brand.voice_tone} {' '.join(brand.target_audiences)}"
+    return set(TOKEN_RE.findall(text.lower()))
+
+
+def _atomic_write(path: Path, content: bytes) -> None:
+    """Write via a temp file in the same directory, then rename (readers never see partial files)."""
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp, str(path))
+    except BaseException:
+        os.unlink(tmp)
+        raise
@@ -1,7 +1,7 @@
 """
 In-Memory Brand Repository for Testing
 """
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 from datetime import datetime
 from app.entities.brand_summary import BrandSummary
 
@@ -33,6 +33,14 @@ class InMemoryBrandRepository:
         """Load brand from dict."""
         return self.brands.get(brand_id)
 
+    def get_many(self, brand_ids: Iterable[str]) -> Dict[str, BrandSummary]:
+        """Load several brands from dict."""
+        return {brand_id: self.brands[brand_id] for brand_id in brand_ids if brand_id in self.brands}
+
+    def upsert(self, brand: BrandSummary) -> None:
+        """Insert or replace brand in dict."""
+        self.brands[brand.brand_id] = brand
+
     def search_similar(self, brand: BrandSummary, limit: int = 5) -> List[BrandSummary]:
         """Stub for vector search (Task 3)."""
         return []  # Not implemented in fake
@@ -2,10 +2,10 @@
 Brand Repository Protocol
 
 Defines contract for brand persistence:
-- YAML file loader (simple)
+- YAML/JSON file catalog with compiled snapshot (simple)
 - Weaviate vector store (advanced)
 """
-from typing import Protocol, Optional, List
+from typing import Dict, Iterable, Protocol, Optional, List
 from app.entities.brand_summary import BrandSummary
 
 
@@ -16,6 +16,10 @@ class IBrandRepository(Protocol):
         """Load brand by ID."""
         ...
 
+    def get_many(self, brand_ids: Iterable[str]) -> Dict[str, BrandSummary]:
+        """Load several brands at once (unknown ids are omitted)."""
+        ...
+
     def search_similar(self, brand: BrandSummary, limit: int = 5) -> List[BrandSummary]:
         """Find similar brands (for Task 3)."""
         ...
@@ -4,14 +4,14 @@ Weaviate Brand Repository
 Implements IBrandRepository protocol using Weaviate vector database.
 Enables brand similarity search and vector-based retrieval.
 """
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List
 from datetime import datetime
 import weaviate
 from weaviate.classes.config import Property, DataType, Configure
 from weaviate.classes.query import Filter
 
 from app.entities.brand_summary import BrandSummary
-from app.infrastructure.config import settings
+from app.infrastructure.weaviate_connection import WeaviateConnectionManager
 
 
 COLLECTION_NAME = "Brand"
@@ -20,21 +20,22 @@ COLLECTION_NAME = "Brand"
 class WeaviateBrandRepository:
     """Brand repository using Weaviate vector database."""
 
-    def __init__(self):
-        self.client = weaviate.connect_to_local(
-            host=settings.WEAVIATE_HOST,
-            port=settings.WEAVIATE_HTTP_PORT,
-            grpc_port=settings.WEAVIATE_GRPC_PORT,
-        )
-        self._ensure_schema()
-        self.collection = self.client.collections.get(COLLECTION_NAME)
+    def __init__(self, connection: Optional[WeaviateConnectionManager] = None):
+        """
+        Args:
+            connection: Connection manager to borrow the client from (default: process-wide)
+        """
+        self.connection = connection or WeaviateConnectionManager.instance()
+        self.collection = self.connection.ensure_collection(COLLECTION_NAME, self._ensure_schema)
+        self.client = self.connection.client
 
-    def _ensure_schema(self) -> None:
+    @staticmethod
+    def _ensure_schema(client: weaviate.WeaviateClient) -> None:
         """Create Brand collection schema if it doesn't exist."""
-        if COLLECTION_NAME in self.client.collections.list_all():
+        if client.collections.exists(COLLECTION_NAME):
             return
 
-        self.client.collections.create(
+        client.collections.create(
             name=COLLECTION_NAME,
             description="Brand identity and guidelines for campaign generation",
             vectorizer_config=Configure.Vectorizer.text2vec_transformers(),
@@ -72,33 +73,36 @@ class WeaviateBrandRepository:
         if not result.objects:
             return None
 
-        # Convert Weaviate object to BrandSummary entity
-        props = result.objects[0].properties
+        return self._to_brand(result.objects[0].properties)
 
-        # Weaviate v4 returns datetime objects, not strings
-        created_at = props["created_at"]
-        if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+    def get_many(self, brand_ids: Iterable[str]) -> Dict[str, BrandSummary]:
+        """
+        Load several brands in one query.
 
-        updated_at = props["updated_at"]
-        if isinstance(updated_at, str):
-            updated_at = datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
+        Args:
+            brand_ids: Unique brand identifiers
 
-        return BrandSummary(
-            brand_id=props["brand_id"],
-            name=props["name"],
-            description=props["description"],
-            colors=props.get("colors", []),
-            typography=props.get("typography", ""),
-            voice_tone=props.get("voice_tone", ""),
-            target_audiences=props.get("target_audiences", []),
-            target_regions=props.get("target_regions", []),
-            products=props.get("products", []),
-            campaign_slogans=props.get("campaign_slogans", []),
-            logo_url=props.get("logo_url"),
-            created_at=created_at,
-            updated_at=updated_at,
+        Returns:
+            Found brands by brand_id (unknown ids are omitted)
+        """
+        brand_ids = list(dict.fromkeys(brand_ids))
+        if not brand_ids:
+            return {}
+        result = self.collection.query.fetch_objects(
+            filters=Filter.by_property("brand_id").contains_any(brand_ids),
+            limit=len(brand_ids),
         )
+        brands = {}
+        for obj in result.objects:
+            brands.setdefault(obj.properties["brand_id"], self._to_brand(obj.properties))
+
+        # upsert() inserts, so one brand may occupy several of the `limit` slots
+        for brand_id in brand_ids:
+            if brand_id not in brands:
+                brand = self.get_by_id(brand_id)
+                if brand is not None:
+                    brands[brand_id] = brand
+        return brands
 
     def search_similar(self, brand: BrandSummary, limit: int = 5) -> List[BrandSummary]:
         """
@@ -119,39 +123,35 @@ class WeaviateBrandRepository:
             limit=limit,
         )
 
-        # Convert results to BrandSummary entities
-        brands = []
-        for obj in result.objects:
-            props = obj.properties
-
-            # Weaviate v4 returns datetime objects, not strings
-            created_at = props["created_at"]
-            if isinstance(created_at, str):
-                created_at = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-
-            updated_at = props["updated_at"]
-            if isinstance(updated_at, str):
-                updated_at = datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
-
-            brands.append(
-                BrandSummary(
-                    brand_id=props["brand_id"],
-                    name=props["name"],
-                    description=props["description"],
-                    colors=props.get("colors", []),
-                    typography=props.get("typography", ""),
-                    voice_tone=props.get("voice_tone", ""),
-                    target_audiences=props.get("target_audiences", []),
-                    target_regions=props.get("target_regions", []),
-                    products=props.get("products", []),
-                    campaign_slogans=props.get("campaign_slogans", []),
-                    logo_url=props.get("logo_url"),
-                    created_at=created_at,
-                    updated_at=updated_at,
-                )
-            )
+        return [self._to_brand(obj.properties) for obj in result.objects]
 
-        return brands
+    @staticmethod
+    def _to_brand(props: dict) -> BrandSummary:
+        """Convert Weaviate object properties to a BrandSummary entity."""
+        # Weaviate v4 returns datetime objects, not strings
+        created_at = props["created_at"]
+        if isinstance(created_at, str):
+            created_at = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+
+        updated_at = props["updated_at"]
+        if isinstance(updated_at, str):
+            updated_at = datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
+
+        return BrandSummary(
+            brand_id=props["brand_id"],
+            name=props["name"],
+            description=props["description"],
+            colors=props.get("colors", []),
+            typography=props.get("typography", ""),
+            voice_tone=props.get("voice_tone", ""),
+            target_audiences=props.get("target_audiences", []),
+            target_regions=props.get("target_regions", []),
+            products=props.get("products", []),
+            campaign_slogans=props.get("campaign_slogans", []),
+            logo_url=props.get("logo_url"),
+            created_at=created_at,
+            updated_at=updated_at,
+        )
 
     def upsert(self, brand: BrandSummary) -> None:
         """
@@ -176,8 +176,3 @@ class WeaviateBrandRepository:
             "updated_at": brand.updated_at.isoformat() + "Z",  # RFC3339 format with UTC
         }
         self.collection.data.insert(data)
-
-    def __del__(self):
-        """Close Weaviate client connection."""
-        if hasattr(self, "client"):
-            self.client.close()
@@ -0,0 +1,135 @@
+"""
+Weaviate Connection Manager
+
+One Weaviate connection per process, shared by all Weaviate repositories:
+- Sync client (HTTP connection pool + gRPC channel) opened lazily, once
+- Optional WeaviateAsyncClient for asyncio callers, opened on first use
+- Schema checks cached per collection, so `list_all()`/create round trips
+  happen once per process instead of once per repository construction
+- Explicit close() (also registered with atexit); repositories borrow the
+  client and never close it themselves
+"""
+import atexit
+import threading
+from typing import Callable, Optional, Set
+
+import weaviate
+from weaviate.classes.init import AdditionalConfig
+from weaviate.config import ConnectionConfig
+
+from app.infrastructure.config import settings
+
+
+class WeaviateConnectionManager:
+    """Owns the process-wide Weaviate clients and cached schema state."""
+
+    _instance: Optional["WeaviateConnectionManager"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        http_port: Optional[int] = None,
+        grpc_port: Optional[int] = None,
+    ):
+        self.host = host or settings.WEAVIATE_HOST
+        self.http_port = http_port or settings.WEAVIATE_HTTP_PORT
+        self.grpc_port = grpc_port or settings.WEAVIATE_GRPC_PORT
+        self._client: Optional[weaviate.WeaviateClient] = None
+        self._async_client: Optional[weaviate.WeaviateAsyncClient] = None
+        self._ensured: Set[str] = set()
+        self._lock = threading.RLock()
+
+    @classmethod
+    def instance(cls) -> "WeaviateConnectionManager":
+        """Process-wide manager (created on first use, closed at exit)."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                atexit.register(cls._instance.close)
+            return cls._instance
+
+    @property
+    def client(self) -> weaviate.WeaviateClient:
+        """Shared sync client, connected on first access (reconnects if closed)."""
+        with self._lock:
+            if self._client is None:
+                self._client = weaviate.connect_to_local(
+                    host=self.host,
+                    port=self.http_port,
+                    grpc_port=self.grpc_port,
+                    additional_config=self._additional_config(),
+                )
+            elif not self._client.is_connected():
+                self._client.connect()
+            return self._client
+
+    async def async_client(self) -> weaviate.WeaviateAsyncClient:
+        """Shared async client, connected on first await."""
+        with self._lock:
+            if self._async_client is None:
+                self._async_client = weaviate.use_async_with_local(
+                    host=self.host,
+                    port=self.http_port,
+                    grpc_port=self.grpc_port,
+                    additional_config=self._additional_config(),
+                )
+            client = self._async_client
+        if not client.is_connected():
+            await client.connect()
+        return client
+
+    def ensure_collection(self, name: str, create: Callable[[weaviate.WeaviateClient], None]):
+        """
+        Return a collection handle, creating/migrating it at most once per process.
+
+        Args:
+            name: Collection name
+            create: Idempotent schema setup (create if missing, add new properties);
+                called with the shared client only on the first request for `name`
+
+        Returns:
+            Collection handle bound to the shared client
+        """
+        with self._lock:
+            if name not in self._ensured:
+                create(self.client)
+                self._ensured.add(name)
+            return self.client.collections.get(name)
+
+    def forget_schema(self, name: Optional[str] = None) -> None:
+        """Re-run schema setup on next use (e.g., after a collection was dropped)."""
+        with self._lock:
+            if name is None:
+                self._ensured.clear()
+            else:
+                self._ensured.discard(name)
+
+    def close(self) -> None:
+        """
+        Close the sync client (the async client must be closed with aclose).
+
+        The client object is kept, so collection handles held by repositories
+        stay valid: the next `client` access reconnects it.
+        """
+        with self._lock:
+            if self._client is not None and self._client.is_connected():
+                self._client.close()
+            self._ensured.clear()
+
+    async def aclose(self) -> None:
+        """Close both clients."""
+        with self._lock:
+            client, self._async_client = self._async_client, None
+        if client is not None:
+            await client.close()
+        self.close()
+
+    @staticmethod
+    def _additional_config() -> AdditionalConfig:
+        return AdditionalConfig(
+            connection=ConnectionConfig(
+                session_pool_connections=settings.WEAVIATE_POOL_CONNECTIONS,
+                session_pool_maxsize=settings.WEAVIATE_POOL_MAXSIZE,
+            ),
+        )
@@ -3,11 +3,16 @@ Campaign Orchestrator
 
 Coordinates the complete campaign generation workflow:
 1. Load brand from repository
-2. Generate campaign assets (use case)
-3. Validate assets (use case)
+2. Generate campaign assets (use case; locales whose copy fails the
+   text-level checks are blocked before any image is generated)
+3. Validate generated assets (use case); assets that fail are no longer
+   offered for reuse by the generation use case's reuse engine
 4. Return summary results
+
+generate_campaigns runs several briefs, loading all their brands in one
+bulk call (get_many) when the brand repository supports it.
 """
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List
 
 from app.entities.campaign_brief import CampaignBrief
 from app.use_cases.generate_campaign_uc import GenerateCampaignUC
@@ -41,18 +46,58 @@ class CampaignOrchestrator:
         Returns:
             Dict with assets, validation results, and summary
         """
-        from datetime import datetime
-
         # Step 1: Load brand
         brand = self.brand_repository.get_by_id(brief.brand_id)
         if not brand:
             raise ValueError(f"Brand not found: {brief.brand_id}")
 
-        # Step 2: Generate assets
+        return self._run(brief, brand)
+
+    def generate_campaigns(self, briefs: Iterable[CampaignBrief]) -> List[Dict[str, Any]]:
+        """
+        Execute the workflow for several briefs, loading their brands up front.
+
+        Args:
+            briefs: Campaign briefs (may share brands)
+
+        Returns:
+            One result dict per brief, in order (see generate_campaign)
+        """
+        briefs = list(briefs)
+        brand_ids = [brief.brand_id for brief in briefs]
+        if hasattr(self.brand_repository, "get_many"):
+            brands = self.brand_repository.get_many(brand_ids)
+        else:
+            brands = {}
+            for brand_id in dict.fromkeys(brand_ids):
+                brand = self.brand_repository.get_by_id(brand_id)
+                if brand:
+                    brands[brand_id] = brand
+
+        missing = sorted(set(brand_ids) - set(brands))
+        if missing:
+            raise ValueError(f"Brand not found: {', '.join(missing)}")
+
+        return [self._run(brief, brands[brief.brand_id]) for brief in briefs]
+
+    def _run(self, brief: CampaignBrief, brand) -> Dict[str, Any]:
+        """Generate, validate and summarize one brief for an already-loaded brand."""
+        from datetime import datetime
+
+        # Step 2: Generate assets (copy screened first when the use case has a copy validator)
         assets = self.generate_uc.execute(brief, brand)
+        blocked_locales = {
+            locale: [issue.message for issue in issues]
+            for locale, issues in getattr(self.generate_uc, "blocked_locales", {}).items()
+        }
 
         # Step 3: Validate assets
-        validation_results = self.validate_uc.execute(assets)
+        validation_results = self.validate_uc.execute(assets, brand=brand)
+        reuse_engine = getattr(self.generate_uc, "reuse_engine", None)
+        if reuse_engine is not None:
+            for result in validation_results:
+                if not result.is_valid:
+                    reuse_engine.forget(result.asset_id)
 
         # Step 4: Build summary
         validation_failed = sum(1 for r in validation_results if not r.is_valid)
@@ -70,6 +115,7 @@ class CampaignOrchestrator:
             "generated_at": datetime.now().isoformat(),
             "assets": assets,
             "validation_results": validation_results,
+            "blocked_locales": blocked_locales,
             "summary": {
                 "total_assets": len(assets),
                 "products": unique_products,
@@ -77,5 +123,6 @@ class CampaignOrchestrator:
                 "aspects": unique_aspects,
                 "validation_passed": validation_passed,
                 "validation_failed": validation_failed,
+                "blocked_locales": len(blocked_locales),
             },
         }
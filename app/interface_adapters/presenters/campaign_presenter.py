@@ -40,9 +40,17 @@ class CampaignPresenter:
             f"  ✓ Validation Passed: {summary['validation_passed']}",
             f"  ✗ Validation Failed: {summary['validation_failed']}",
             "",
-            "Assets by Product:",
         ]
 
+        blocked = result.get("blocked_locales") or {}
+        if blocked:
+            output.append("Blocked Before Generation (copy failed validation):")
+            for locale, messages in blocked.items():
+                output.append(f"  ✗ {locale}: {'; '.join(messages)}")
+            output.append("")
+
+        output.append("Assets by Product:")
+
         # Group by product
         products = {}
         for asset in assets:
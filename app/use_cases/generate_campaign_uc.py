@@ -3,20 +3,28 @@ Generate Campaign Use Case
 
 Business logic for campaign generation:
 1. Search Weaviate for existing similar assets (reuse if found)
-2. Localize campaign slogan
-3. For each product × aspect × locale:
-   a. Check if similar asset exists in Weaviate
+2. Localize campaign slogan, then screen each localized slogan with the
+   text-level checks; locales whose copy would fail validation are blocked
+   before any image is generated or reused
+3. For each product × aspect × locale that is not blocked:
+   a. Ask the reuse engine (exact key → local index → vector search)
    b. If found: reuse existing asset
    c. If not: generate hero image, add text overlay, save
-4. Return list of assets
+4. Index newly generated assets in one batch
+5. Return list of assets
 """
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
+from io import BytesIO
 import hashlib
 
 from app.entities.campaign_brief import CampaignBrief
 from app.entities.brand_summary import BrandSummary
 from app.entities.creative_asset import CreativeAsset
+from app.entities.validation_result import ValidationIssue
+from app.infrastructure.repositories.asset.dto import AssetWithImage
+from app.infrastructure.dedup.perceptual_hash import to_hex
+from app.use_cases.reuse_engine import ReuseEngine
 
 
 class GenerateCampaignUC:
@@ -28,11 +36,22 @@ class GenerateCampaignUC:
         storage_adapter,
         asset_repository=None,
         progress_callback=None,
+        dedup_service=None,
+        reuse_engine: Optional[ReuseEngine] = None,
+        copy_validator=None,
     ):
         self.ai_adapter = ai_adapter
         self.storage_adapter = storage_adapter
         self.asset_repository = asset_repository  # Optional: Weaviate asset search
         self.progress_callback = progress_callback  # Optional: progress reporting
+        self.dedup_service = dedup_service  # Optional: perceptual-hash near-duplicate linking
+        # Tiered reuse decisions (default: all tiers over asset_repository, default vector cut-off)
+        if reuse_engine is None and asset_repository is not None:
+            reuse_engine = ReuseEngine(asset_repository)
+        self.reuse_engine = reuse_engine
+        # Optional: text-level checks run before generation (check_copy(message, locale) -> issues)
+        self.copy_validator = copy_validator
+        self.blocked_locales: Dict[str, List[ValidationIssue]] = {}  # From the last execute() call
 
     def execute(
         self,
@@ -47,9 +66,10 @@ class GenerateCampaignUC:
             brand: Brand guidelines (colors, voice, tone)
 
         Returns:
-            List of CreativeAsset entities
+            List of CreativeAsset entities (none for locales in self.blocked_locales)
         """
         assets = []
+        index_queue: List[AssetWithImage] = []
         total_assets = len(brief.products) * len(brief.aspects) * len(brief.target_locales)
         current_asset = 0
 
@@ -58,10 +78,19 @@ class GenerateCampaignUC:
             self.progress_callback("Localizing campaign slogans...", 0, total_assets)
         localized_slogans = self._localize_slogans(brief, brand)
 
+        # Step 1b: Fail fast on copy that would be rejected (no API budget spent on it)
+        self.blocked_locales = self._screen_slogans(localized_slogans)
+        locales = [locale for locale in brief.target_locales if locale not in self.blocked_locales]
+        total_assets = len(brief.products) * len(brief.aspects) * len(locales)
+        if self.progress_callback and self.blocked_locales:
+            self.progress_callback(
+                f"Blocked copy for: {', '.join(self.blocked_locales)}", 0, total_assets
+            )
+
         # Step 2: Generate assets for each combination
         for product in brief.products:
             for aspect in brief.aspects:
-                for locale in brief.target_locales:
+                for locale in locales:
                     current_asset += 1
                     if self.progress_callback:
                         self.progress_callback(
@@ -77,9 +106,13 @@ class GenerateCampaignUC:
                         aspect=aspect,
                         locale=locale,
                         slogan=localized_slogans[locale],
+                        index_queue=index_queue,
                     )
                     assets.append(asset)
 
+        # Step 3: Index new assets for future reuse (one batch at end of run)
+        self._index_assets(index_queue)
+
         return assets
 
     def _localize_slogans(self, brief: CampaignBrief, brand: BrandSummary) -> dict:
@@ -93,6 +126,22 @@ class GenerateCampaignUC:
             )
         return slogans
 
+    def _screen_slogans(self, slogans: Dict[str, str]) -> Dict[str, List[ValidationIssue]]:
+        """
+        Run text-level checks on each localized slogan.
+
+        Returns:
+            Blocking (error) issues per locale; locales with clean copy are omitted
+        """
+        if not self.copy_validator:
+            return {}
+        blocked = {}
+        for locale, slogan in slogans.items():
+            errors = [i for i in self.copy_validator.check_copy(slogan, locale) if i.severity == "error"]
+            if errors:
+                blocked[locale] = errors
+        return blocked
+
     def _generate_asset(
         self,
         brief: CampaignBrief,
@@ -101,27 +150,33 @@ class GenerateCampaignUC:
         aspect: str,
         locale: str,
         slogan: str,
+        index_queue: Optional[List[AssetWithImage]] = None,
     ) -> CreativeAsset:
         """
         Generate single creative asset.
 
-        Searches Weaviate for existing similar assets first.
-        If found, reuses existing asset. If not, generates new one.
+        Asks the reuse engine for an existing asset first.
+        If found, reuses existing asset. If not, generates new one and
+        queues it for indexing.
         """
-        # Step 1: Check Weaviate for existing similar assets
-        if self.asset_repository:
-            existing = self.asset_repository.find_existing(
+        asset_id = self._generate_asset_id(brief, product, aspect, locale)
+
+        # Step 1: Cheapest reuse tier that has a qualifying asset
+        if self.reuse_engine:
+            decision = self.reuse_engine.find(
+                asset_id=asset_id,
+                brand_id=brand.brand_id,
                 product_name=product.name,
                 aspect_ratio=aspect,
                 locale=locale,
-                limit=1,
             )
-            if existing:
+            if decision.reused:
                 # Reuse existing asset (update metadata)
-                reused_asset = existing[0]
+                reused_asset = decision.asset
                 reused_asset.brief_id = brief.brief_id
                 reused_asset.message = slogan
                 reused_asset.reused = True
+                reused_asset.meta["reuse_tier"] = decision.tier
                 return reused_asset
 
         # Step 2: No existing asset found - generate new one
@@ -129,33 +184,34 @@ class GenerateCampaignUC:
 
         # Check for seed images to use as base
         seed_image_bytes = None
-        if self.asset_repository:
+        if self.asset_repository is not None:
             seeds = self.asset_repository.find_seeds(
                 brand_id=brand.brand_id,
                 product_name=product.name,
                 limit=1
             )
             if seeds:
-                # Load seed image from storage
+                # Load full-resolution seed image from storage
+                # (Weaviate only holds a vectorization thumbnail)
                 try:
-                    seed_asset = seeds[0]
-                    if hasattr(seed_asset, 'properties') and 'image' in seed_asset.properties:
-                        # Weaviate stores base64-encoded image
-                        import base64
-                        seed_image_bytes = base64.b64decode(seed_asset.properties['image'])
+                    if seeds[0].storage_path:
+                        seed_image_bytes = self.storage_adapter.load(seeds[0].storage_path)
                 except Exception:
                     pass  # If seed loading fails, continue with text-to-image
 
         # Generate hero image (from seed if available, otherwise from prompt)
         image_bytes = self.ai_adapter.generate_image(prompt, aspect, seed_image=seed_image_bytes)
 
-        # Add text overlay
-        final_image = self.ai_adapter.overlay_text(image_bytes, slogan, aspect)
+        dedup_meta = self._check_duplicate(brand, image_bytes, asset_id)
 
-        # Save to storage
-        asset_id = self._generate_asset_id(brief, product, aspect, locale)
+        # Add text overlay, encoding straight into storage; when indexing, the
+        # overlay also emits the small vectorization thumbnail from its pixels
         storage_path = f"{product.name.lower().replace(' ', '-')}/{locale}/{aspect.replace(':', 'x')}/{asset_id}.png"
-        saved_path = self.storage_adapter.save(storage_path, final_image)
+        indexing = self.asset_repository is not None and index_queue is not None
+        thumbnail = BytesIO() if indexing else None
+        with self.storage_adapter.open_write(storage_path) as out:
+            text_bbox = self.ai_adapter.overlay_text_to(image_bytes, slogan, aspect, out, thumbnail=thumbnail)
+        saved_path = out.uri
 
         # Create entity
         asset = CreativeAsset(
@@ -173,19 +229,56 @@ class GenerateCampaignUC:
             meta={
                 "validation_status": "passed",  # Stub
                 "prompt": prompt,
+                "storage_path": storage_path,
+                **({"text_bbox": list(text_bbox)} if text_bbox else {}),
+                **dedup_meta,
             },
         )
 
-        # Step 3: Index new asset in Weaviate for future reuse
-        if self.asset_repository:
-            self.asset_repository.upsert(
-                asset,
-                image_bytes=final_image,
-                tags=["generated"],
-            )
+        # Queue the thumbnail of the final (overlaid) image for indexing
+        if thumbnail is not None:
+            index_queue.append(AssetWithImage(asset=asset, image_bytes=thumbnail.getvalue(), tags=["generated"]))
+        if self.reuse_engine:
+            self.reuse_engine.record(asset)
 
         return asset
 
+    def _check_duplicate(self, brand: BrandSummary, image_bytes: bytes, asset_id: str) -> dict:
+        """
+        Hash the hero image and link it to a near-duplicate of the brand, if any.
+
+        Returns:
+            Meta entries: phash, plus near_duplicate_of / near_duplicate_distance on a match
+        """
+        if not self.dedup_service:
+            return {}
+        try:
+            phash, match = self.dedup_service.check_and_add(brand.brand_id, image_bytes, asset_id)
+        except Exception:
+            return {}  # Undecodable image: skip dedup, keep generating
+        meta = {"phash": to_hex(phash, self.dedup_service.hash_size)}
+        if match and match.asset_id != asset_id:
+            meta["near_duplicate_of"] = match.asset_id
+            meta["near_duplicate_distance"] = match.distance
+        return meta
+
+    def _index_assets(self, items: List[AssetWithImage]) -> None:
+        """Index generated assets, batched when the repository supports it."""
+        if self.asset_repository is None or not items:
+            return
+
+        if hasattr(self.asset_repository, "upsert_many"):
+            failures = {f.asset_id: f.message for f in self.asset_repository.upsert_many(items) or []}
+            for item in items:
+                if item.asset.asset_id in failures:
+                    item.asset.meta["index_error"] = failures[item.asset.asset_id]
+                    if self.dedup_service:
+                        self.dedup_service.remove(item.asset.brand_id, item.asset.asset_id)
+            return
+
+        for item in items:
+            self.asset_repository.upsert(item.asset, image_bytes=item.image_bytes, tags=item.tags)
+
     def _create_prompt(self, brand: BrandSummary, product, aspect: str) -> str:
         """Create image generation prompt."""
         palette = ", ".join(product.palette_words)
@@ -0,0 +1,244 @@
+"""
+Reuse Engine
+
+Decides whether a campaign cell (brand × product × aspect × locale) can reuse
+an existing asset, trying the cheapest tier first:
+1. exact:  deterministic asset_id (local map, then repository primary-key fetch)
+2. local:  in-process metadata index of assets seen by this process
+3. vector: repository similarity search
+
+Each tier can have its own score cut-off (min_scores; hybrid scores are 0-1,
+in-memory cosine similarity is -1-1). By default only the vector tier has one
+(DEFAULT_MIN_SCORES), so a weak nearest neighbour is never reused.
+Each tier records lookups, hits and latency. Vector and exact repository hits
+are remembered locally, so repeat decisions resolve without a network call;
+assets that failed validation are forgotten and skipped by every tier.
+"""
+import dataclasses
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Iterable, Optional, Tuple
+
+from app.entities.creative_asset import CreativeAsset
+
+
+TIERS = ("exact", "local", "vector")
+LATENCY_WINDOW = 1024  # Recent samples kept per tier for percentiles
+DEFAULT_MIN_SCORES = {"vector": 0.6}
+
+
+@dataclass(frozen=True)
+class ReuseDecision:
+    """Outcome of a reuse lookup (asset is None when nothing qualified)."""
+    asset: Optional[CreativeAsset]
+    tier: Optional[str] = None
+    score: Optional[float] = None
+
+    @property
+    def reused(self) -> bool:
+        return self.asset is not None
+
+
+class _TierStats:
+    """Lookup/hit counters and recent latencies for one tier."""
+
+    def __init__(self):
+        self.lookups = 0
+        self.hits = 0
+        self.total_seconds = 0.0
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    def record(self, seconds: float, hit: bool) -> None:
+        self.lookups += 1
+        self.hits += int(hit)
+        self.total_seconds += seconds
+        self.latencies.append(seconds)
+
+    def as_dict(self) -> Dict[str, float]:
+        ordered = sorted(self.latencies)
+        p95 = ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))] if ordered else 0.0
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "hit_rate": self.hits / self.lookups if self.lookups else 0.0,
+            "avg_ms": 1000 * self.total_seconds / self.lookups if self.lookups else 0.0,
+            "p95_ms": 1000 * p95,
+        }
+
+
+class ReuseEngine:
+    """Tiered asset reuse: exact key → local index → thresholded vector search."""
+
+    def __init__(
+        self,
+        asset_repository=None,
+        tiers: Iterable[str] = TIERS,
+        min_scores: Optional[Dict[str, float]] = None,
+        vector_candidates: int = 3,
+        local_max_entries: int = 10_000,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        """
+        Args:
+            asset_repository: IAssetRepository for exact (get_by_id) and vector (find_existing) tiers
+            tiers: Enabled tiers, tried in TIERS order
+            min_scores: Minimum score per tier (repository-specific scale; default:
+                DEFAULT_MIN_SCORES, {} for no cut-off); tiers without an entry accept
+                any hit, tiers with one reject unscored hits
+            vector_candidates: Results requested from the vector search
+            local_max_entries: Max assets in the local index (LRU eviction beyond this)
+            clock: Timer for latency metrics (injectable for tests)
+        """
+        unknown = (set(tiers) | set(min_scores or {})) - set(TIERS)
+        if unknown:
+            raise ValueError(f"Unknown reuse tiers: {sorted(unknown)} (expected {', '.join(TIERS)})")
+        self.asset_repository = asset_repository
+        self.tiers = [tier for tier in TIERS if tier in set(tiers)]
+        self.min_scores = dict(DEFAULT_MIN_SCORES if min_scores is None else min_scores)
+        self.vector_candidates = vector_candidates
+        self.local_max_entries = local_max_entries
+        self._clock = clock
+
+        self._by_id: "OrderedDict[str, CreativeAsset]" = OrderedDict()
+        self._by_key: "OrderedDict[Tuple[str, str, str, str], str]" = OrderedDict()
+        self._rejected: "OrderedDict[str, None]" = OrderedDict()  # Forgotten asset ids
+        self._stats = {tier: _TierStats() for tier in TIERS}
+        self._decisions = 0
+        self._lock = threading.Lock()
+
+    def find(
+        self,
+        asset_id: str,
+        brand_id: str,
+        product_name: str,
+        aspect_ratio: str,
+        locale: str,
+    ) -> ReuseDecision:
+        """
+        Find a reusable asset for one campaign cell.
+
+        Args:
+            asset_id: Deterministic id the cell's asset would be generated under
+            brand_id: Brand the asset must belong to
+            product_name: Product name
+            aspect_ratio: Aspect ratio
+            locale: Locale
+
+        Returns:
+            ReuseDecision with a fresh copy of the asset (callers may mutate it)
+        """
+        with self._lock:
+            self._decisions += 1
+
+        key = (brand_id, product_name, aspect_ratio, locale)
+        lookups = {
+            "exact": lambda: self._find_exact(asset_id, brand_id),
+            "local": lambda: self._find_local(key),
+            "vector": lambda: self._find_vector(key),
+        }
+        for tier in self.tiers:
+            start = self._clock()
+            asset, score = lookups[tier]()
+            if asset is not None and (self._is_rejected(asset.asset_id) or not self._qualifies(tier, score)):
+                asset = None
+            with self._lock:
+                self._stats[tier].record(self._clock() - start, asset is not None)
+            if asset is not None:
+                if tier != "local":
+                    self.record(asset)
+                return ReuseDecision(
+                    asset=dataclasses.replace(asset, reused=True, meta=dict(asset.meta or {})),
+                    tier=tier,
+                    score=score,
+                )
+        return ReuseDecision(asset=None)
+
+    def record(self, asset: CreativeAsset) -> None:
+        """Remember an asset (e.g., just generated) for the exact and local tiers."""
+        key = (asset.brand_id, asset.product_name, asset.aspect_ratio, asset.locale)
+        with self._lock:
+            self._rejected.pop(asset.asset_id, None)
+            self._by_id[asset.asset_id] = asset
+            self._by_id.move_to_end(asset.asset_id)
+            self._by_key[key] = asset.asset_id
+            self._by_key.move_to_end(key)
+            while len(self._by_id) > self.local_max_entries:
+                self._by_id.popitem(last=False)
+            while len(self._by_key) > self.local_max_entries:
+                self._by_key.popitem(last=False)
+
+    def forget(self, asset_id: str) -> None:
+        """
+        Stop reusing an asset (e.g., it failed validation).
+
+        It is dropped from the local tiers and skipped by the repository tiers
+        until an asset with the same id is recorded again (regenerated).
+        """
+        with self._lock:
+            self._by_id.pop(asset_id, None)
+            self._rejected[asset_id] = None
+            self._rejected.move_to_end(asset_id)
+            while len(self._rejected) > self.local_max_entries:
+                self._rejected.popitem(last=False)
+
+    def stats(self) -> Dict[str, object]:
+        """Per-tier lookups, hit rate and latency, plus overall resolution rate."""
+        with self._lock:
+            tiers = {tier: self._stats[tier].as_dict() for tier in self.tiers}
+            hits = sum(stats["hits"] for stats in tiers.values())
+            return {
+                "decisions": self._decisions,
+                "reused": hits,
+                "reuse_rate": hits / self._decisions if self._decisions else 0.0,
+                "tiers": tiers,
+                "local_entries": len(self._by_id),
+            }
+
+    # ------------------------------------------------------------------
+    # Tiers
+    # ------------------------------------------------------------------
+
+    def _find_exact(self, asset_id: str, brand_id: str) -> Tuple[Optional[CreativeAsset], Optional[float]]:
+        with self._lock:
+            asset = self._by_id.get(asset_id)
+        if asset is not None and asset.brand_id == brand_id:
+            return asset, None
+        if self.asset_repository is not None and hasattr(self.asset_repository, "get_by_id"):
+            return self.asset_repository.get_by_id(asset_id, brand_id=brand_id), None
+        return None, None
+
+    def _find_local(self, key: Tuple[str, str, str, str]) -> Tuple[Optional[CreativeAsset], Optional[float]]:
+        with self._lock:
+            asset_id = self._by_key.get(key)
+            asset = self._by_id.get(asset_id) if asset_id else None
+            if asset is not None:
+                self._by_key.move_to_end(key)
+        return asset, None
+
+    def _find_vector(self, key: Tuple[str, str, str, str]) -> Tuple[Optional[CreativeAsset], Optional[float]]:
+        if self.asset_repository is None:
+            return None, None
+        brand_id, product_name, aspect_ratio, locale = key
+        candidates = self.asset_repository.find_existing(
+            product_name=product_name,
+            aspect_ratio=aspect_ratio,
+            locale=locale,
+            limit=self.vector_candidates,
+            brand_id=brand_id,
+        )
+        for asset in candidates:
+            score = (asset.meta or {}).get("score")
+            if not self._is_rejected(asset.asset_id) and self._qualifies("vector", score):
+                return asset, score
+        return None, None
+
+    def _qualifies(self, tier: str, score: Optional[float]) -> bool:
+        """A hit passes its tier's cut-off (unscored hits, e.g. from fakes, only pass an unset one)."""
+        min_score = self.min_scores.get(tier)
+        return min_score is None or (score is not None and score >= min_score)
+
+    def _is_rejected(self, asset_id: str) -> bool:
+        with self._lock:
+            return asset_id in self._rejected
@@ -1,71 +1,83 @@
 """
 Validate Campaign Use Case
 
-Business logic for campaign validation:
-- Legal content checks (prohibited words)
-- Brand compliance checks (stubbed for PoC)
+Business logic for campaign validation, run by the ValidationEngine:
+- Legal content checks (prohibited words, per-locale compiled policy); also
+  exposed as check_copy() so generation can reject copy before spending on images
+- Brand color compliance (CIEDE2000 palette coverage; runs when a brand with
+  colors and a storage adapter are available)
+- Text legibility (WCAG contrast and background busyness under the overlay's
+  text box, with a fix suggestion; runs when the asset records a text_bbox)
+- Image checks share one decode per asset and run in a process pool for
+  large campaigns (workers > 1)
 """
-from typing import List
+from typing import List, Optional, Sequence
 
+from app.adapters.storage.protocol import IStorageAdapter
+from app.entities.brand_summary import BrandSummary
 from app.entities.creative_asset import CreativeAsset
-from app.entities.validation_result import ValidationResult, ValidationStatus, ValidationIssue
+from app.entities.validation_result import ValidationResult, ValidationIssue
+from app.use_cases.validation.brand_colors import BrandColorsCheck
+from app.use_cases.validation.contrast import TextContrastCheck
+from app.use_cases.validation.engine import IValidationCheck, ValidationEngine
+from app.use_cases.validation.prohibited_words import ContentPolicy, ProhibitedWordsCheck, matcher_for
 
 
 class ValidateCampaignUC:
     """Use case: Validate campaign assets."""
 
-    PROHIBITED_WORDS = [
-        "guarantee",
-        "miracle",
-        "cure",
-        "free",  # Unless truly free
-    ]
+    def __init__(
+        self,
+        policy: Optional[ContentPolicy] = None,
+        storage_adapter: Optional[IStorageAdapter] = None,
+        color_check: Optional[BrandColorsCheck] = None,
+        contrast_check: Optional[TextContrastCheck] = None,
+        checks: Optional[Sequence[IValidationCheck]] = None,
+        workers: int = 1,
+        fail_fast: bool = False,
+    ):
+        """
+        Args:
+            policy: Prohibited-word lists per locale (default: built-in ContentPolicy)
+            storage_adapter: Where final images are read from (image checks are skipped without it)
+            color_check: Brand color thresholds (default: CIEDE2000 within 12, 5% coverage)
+            contrast_check: Text legibility thresholds (default: WCAG AA large text, 3:1)
+            checks: Checks to run instead of the default set (prohibited words, brand colors, text contrast)
+            workers: Processes for image checks (0 = one per core, 1 = in-process)
+            fail_fast: Stop checking an asset at its first error
+        """
+        self.policy = policy or ContentPolicy()
+        self.matcher = matcher_for(self.policy)
+        if checks is None:
+            checks = [
+                ProhibitedWordsCheck(self.policy),
+                color_check or BrandColorsCheck(),
+                contrast_check or TextContrastCheck(),
+            ]
+        self.engine = ValidationEngine(checks, storage_adapter=storage_adapter, workers=workers, fail_fast=fail_fast)
 
-    def execute(self, assets: List[CreativeAsset]) -> List[ValidationResult]:
+    def execute(self, assets: List[CreativeAsset], brand: Optional[BrandSummary] = None) -> List[ValidationResult]:
         """
         Validate list of assets.
 
         Args:
             assets: List of CreativeAsset entities
+            brand: Brand the assets belong to (enables brand checks)
 
         Returns:
             List of ValidationResult entities
         """
-        results = []
-        for asset in assets:
-            result = self._validate_asset(asset)
-            results.append(result)
-        return results
-
-    def _validate_asset(self, asset: CreativeAsset) -> ValidationResult:
-        """Validate single asset."""
-        issues = []
-        checks_run = ["prohibited_words"]
-
-        # Check 1: Prohibited words
-        for word in self.PROHIBITED_WORDS:
-            if word.lower() in asset.message.lower():
-                issues.append(ValidationIssue(
-                    check_name="prohibited_words",
-                    severity="error",
-                    message=f"Prohibited word detected: '{word}'",
-                    fix_suggestion=f"Remove or rephrase to avoid '{word}'",
-                ))
+        return self.engine.run(assets, brand)
 
-        # Check 2: Brand compliance (stubbed)
-        checks_run.append("brand_compliance")
-        # TODO: Implement logo presence, color usage checks
+    def check_copy(self, message: str, locale: str) -> List[ValidationIssue]:
+        """
+        Text-level checks only (no image needed), safe to run before generation.
 
-        # Determine status
-        failed_count = len([i for i in issues if i.severity == "error"])
-        passed_count = len(checks_run) - failed_count
-        status = ValidationStatus.PASSED if failed_count == 0 else ValidationStatus.FAILED
+        Args:
+            message: Localized copy
+            locale: Locale whose policy applies
 
-        return ValidationResult(
-            asset_id=asset.asset_id,
-            status=status,
-            checks_run=checks_run,
-            issues=issues,
-            passed_count=passed_count,
-            failed_count=failed_count,
-        )
+        Returns:
+            Issues found in the copy
+        """
+        return self.engine.check_copy(message, locale)
@@ -0,0 +1 @@
+"""Validation checks used by ValidateCampaignUC."""
@@ -0,0 +1,211 @@
+"""
+Brand Color Coverage
+
+Image-level brand color compliance, cheap enough to run on every asset:
+- Downsample the engine's shared decoded image to ~64 px by striding
+- Quantize the whole pixel array to a 15-bit palette (5 bits per channel)
+  and weight each palette color by its pixel count
+- Perceptual distance (CIEDE2000 in CIELAB) from every palette color to every
+  brand color in one vectorized NumPy call; a pixel is "on brand" when its
+  nearest brand color is within `delta_e`
+- Each asset's palette is scored on its own; batching and caching live in the
+  ValidationEngine, which caches results by image hash (re-validating reused
+  or unchanged assets costs nothing)
+"""
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.entities.brand_summary import BrandSummary
+from app.entities.creative_asset import CreativeAsset
+from app.entities.validation_result import ValidationIssue
+from app.use_cases.validation.engine import CheckContext
+
+
+SAMPLE_SIZE = 64
+QUANT_BITS = 5
+
+# sRGB (D65) -> XYZ, and the D65 reference white
+_RGB_TO_XYZ = np.array([
+    [0.4124564, 0.3575761, 0.1804375],
+    [0.2126729, 0.7151522, 0.0721750],
+    [0.0193339, 0.1191920, 0.9503041],
+])
+_WHITE_D65 = np.array([0.95047, 1.0, 1.08883])
+
+
+@dataclass(frozen=True)
+class ColorCoverage:
+    """Share of an image's pixels close to the brand palette."""
+    coverage: float  # Fraction of pixels within delta_e of any brand color
+    per_color: Dict[str, float]  # Fraction of pixels whose nearest brand color is this one (within delta_e)
+
+
+def hex_to_rgb(colors: Sequence[str]) -> np.ndarray:
+    """["#8B7355", ...] -> uint8 array (k, 3)."""
+    return np.array(
+        [[int(c.lstrip("#")[i:i + 2], 16) for i in (0, 2, 4)] for c in colors],
+        dtype=np.uint8,
+    ).reshape(-1, 3)
+
+
+def srgb_to_lab(rgb: np.ndarray) -> np.ndarray:
+    """
+    Convert sRGB colors to CIELAB (D65).
+
+    Args:
+        rgb: uint8 or float array (..., 3) in 0-255
+
+    Returns:
+        float64 array (..., 3) of L*, a*, b*
+    """
+    c = np.asarray(rgb, dtype=np.float64) / 255.0
+    linear = np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+    xyz = linear @ _RGB_TO_XYZ.T / _WHITE_D65
+    f = np.where(xyz > 216 / 24389, np.cbrt(xyz), (24389 / 27 * xyz + 16) / 116)
+    return np.stack(
+        [116 * f[..., 1] - 16, 500 * (f[..., 0] - f[..., 1]), 200 * (f[..., 1] - f[..., 2])],
+        axis=-1,
+    )
+
+
+def ciede2000(lab1: np.ndarray, lab2: np.ndarray) -> np.ndarray:
+    """
+    Pairwise CIEDE2000 color difference.
+
+    Args:
+        lab1: (n, 3) CIELAB colors
+        lab2: (k, 3) CIELAB colors
+
+    Returns:
+        (n, k) array of ΔE00
+    """
+    L1, a1, b1 = (lab1[:, i:i + 1] for i in range(3))
+    L2, a2, b2 = (lab2[None, :, i] for i in range(3))
+
+    c_bar7 = ((np.hypot(a1, b1) + np.hypot(a2, b2)) / 2) ** 7
+    g = 0.5 * (1 - np.sqrt(c_bar7 / (c_bar7 + 25.0 ** 7)))
+    a1p, a2p = (1 + g) * a1, (1 + g) * a2
+    c1p, c2p = np.hypot(a1p, b1), np.hypot(a2p, b2)
+    h1p = np.degrees(np.arctan2(b1, a1p)) % 360
+    h2p = np.degrees(np.arctan2(b2, a2p)) % 360
+    chroma_zero = (c1p * c2p) == 0
+
+    dLp = L2 - L1
+    dCp = c2p - c1p
+    dhp = h2p - h1p
+    dhp = np.where(dhp > 180, dhp - 360, np.where(dhp < -180, dhp + 360, dhp))
+    dhp = np.where(chroma_zero, 0.0, dhp)
+    dHp = 2 * np.sqrt(c1p * c2p) * np.sin(np.radians(dhp / 2))
+
+    Lp = (L1 + L2) / 2
+    Cp = (c1p + c2p) / 2
+    h_sum = h1p + h2p
+    hp = np.where(
+        chroma_zero,
+        h_sum,
+        np.where(np.abs(h1p - h2p) <= 180, h_sum / 2, np.where(h_sum < 360, (h_sum + 360) / 2, (h_sum - 360) / 2)),
+    )
+
+    t = (
+        1
+        - 0.17 * np.cos(np.radians(hp - 30))
+        + 0.24 * np.cos(np.radians(2 * hp))
+        + 0.32 * np.cos(np.radians(3 * hp + 6))
+        - 0.20 * np.cos(np.radians(4 * hp - 63))
+    )
+    d_theta = 30 * np.exp(-(((hp - 275) / 25) ** 2))
+    cp7 = Cp ** 7
+    rc = 2 * np.sqrt(cp7 / (cp7 + 25.0 ** 7))
+    sl = 1 + 0.015 * (Lp - 50) ** 2 / np.sqrt(20 + (Lp - 50) ** 2)
+    sc = 1 + 0.045 * Cp
+    sh = 1 + 0.015 * Cp * t
+    rt = -np.sin(np.radians(2 * d_theta)) * rc
+
+    return np.sqrt(
+        (dLp / sl) ** 2 + (dCp / sc) ** 2 + (dHp / sh) ** 2 + rt * (dCp / sc) * (dHp / sh)
+    )
+
+
+def quantized_palette(pixels: np.ndarray, bits: int = QUANT_BITS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Quantize an RGB pixel array to 2**(3*bits) colors.
+
+    Args:
+        pixels: uint8 array (..., 3)
+        bits: Bits kept per channel
+
+    Returns:
+        (colors (m, 3) uint8 at bucket centers, weights (m,) summing to 1)
+    """
+    flat = pixels.reshape(-1, 3) >> (8 - bits)
+    packed = (flat[:, 0].astype(np.int32) << (2 * bits)) | (flat[:, 1].astype(np.int32) << bits) | flat[:, 2]
+    codes, counts = np.unique(packed, return_counts=True)
+    mask = (1 << bits) - 1
+    buckets = np.stack([codes >> (2 * bits), (codes >> bits) & mask, codes & mask], axis=1)
+    colors = (buckets << (8 - bits)) + (1 << (7 - bits))
+    return colors.astype(np.uint8), counts / counts.sum()
+
+
+def palette_of_pixels(pixels: np.ndarray, sample_size: int = SAMPLE_SIZE) -> Tuple[np.ndarray, np.ndarray]:
+    """Quantized palette of a decoded RGB array, downsampled by striding to ~sample_size px."""
+    step = max(1, max(pixels.shape[:2]) // sample_size)
+    return quantized_palette(pixels[::step, ::step])
+
+
+def score_palette(
+    palette: Tuple[np.ndarray, np.ndarray], colors: Sequence[str], delta_e: float
+) -> ColorCoverage:
+    """
+    Coverage of one palette, all ΔE distances in one vectorized call.
+
+    Args:
+        palette: (colors, weights), as from quantized_palette()
+        colors: Brand hex colors
+        delta_e: Max CIEDE2000 distance for a pixel to count as a brand color
+
+    Returns:
+        ColorCoverage (total and per brand color)
+    """
+    palette_colors, weights = palette
+    distances = ciede2000(srgb_to_lab(palette_colors), srgb_to_lab(hex_to_rgb(colors)))
+    nearest = distances.argmin(axis=1)
+    on_brand = distances[np.arange(len(nearest)), nearest] <= delta_e
+
+    # Weighted pixel share per brand color
+    shares = np.bincount(nearest, weights=np.where(on_brand, weights, 0.0), minlength=len(colors))
+    return ColorCoverage(
+        coverage=float(shares.sum()),
+        per_color={color: float(share) for color, share in zip(colors, shares)},
+    )
+
+
+@dataclass(frozen=True)
+class BrandColorsCheck:
+    """Validation engine check: brand color coverage of the shared decoded image."""
+    delta_e: float = 12.0
+    min_coverage: float = 0.05
+    sample_size: int = SAMPLE_SIZE
+    name: str = "brand_colors"
+    inputs: Tuple[str, ...] = ("image", "brand")
+    cost: str = "cpu"
+
+    def cache_key(self, asset: CreativeAsset, brand: Optional[BrandSummary]) -> Hashable:
+        return (self.delta_e, self.min_coverage, self.sample_size, tuple(brand.colors) if brand else ())
+
+    def run(self, ctx: CheckContext) -> Optional[List[ValidationIssue]]:
+        """Record coverage in meta; warn when below min_coverage (None without pixels or brand colors)."""
+        if ctx.pixels is None or ctx.brand is None or not ctx.brand.colors:
+            return None
+        palette = palette_of_pixels(ctx.pixels, self.sample_size)
+        coverage = score_palette(palette, ctx.brand.colors, self.delta_e)
+        ctx.meta["brand_color_coverage"] = round(coverage.coverage, 4)
+        if coverage.coverage >= self.min_coverage:
+            return []
+        return [ValidationIssue(
+            check_name=self.name,
+            severity="warning",
+            message=f"Brand colors cover {coverage.coverage:.0%} of the image (minimum {self.min_coverage:.0%})",
+            fix_suggestion="Mention the brand palette in the prompt or regenerate the image",
+        )]
@@ -0,0 +1,197 @@
+"""
+Text Contrast
+
+Legibility of the slogan overlay, measured on the engine's shared decoded
+image (no second decode):
+- Crop the text bounding box recorded by the overlay (asset.meta["text_bbox"]),
+  striding very large boxes down to ~16k pixels
+- WCAG relative luminance per pixel via a 256-entry lookup table
+- Split the box into glyph and background pixels with Otsu's threshold; the
+  minority class is the glyphs (fill and outline cover less of the box)
+- WCAG contrast ratio between the two class means, and the luminance standard
+  deviation of the background away from glyph edges (busy backgrounds hurt
+  legibility even at a good average contrast)
+- Auto-fix: the text color that would pass, or the opacity of a dark backing
+  box that brings the background down far enough for white text
+"""
+from dataclasses import dataclass
+from typing import Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.entities.brand_summary import BrandSummary
+from app.entities.creative_asset import CreativeAsset
+from app.entities.validation_result import ValidationIssue
+from app.use_cases.validation.engine import CheckContext
+
+
+MAX_SAMPLES = 16384
+GLYPH_HALO = 3  # Pixels around glyphs (outline, anti-aliasing) excluded from the busyness measure
+MIN_CLEAR_SHARE = 0.1  # Below this share of glyph-free box pixels, busyness is measured around the box
+
+# sRGB 8-bit -> linear (WCAG 2.x definition), and luminance weights
+_channels = np.arange(256) / 255.0
+_LINEAR_LUT = np.where(_channels <= 0.03928, _channels / 12.92, ((_channels + 0.055) / 1.055) ** 2.4)
+_LUMINANCE_WEIGHTS = np.array([0.2126, 0.7152, 0.0722])
+
+
+@dataclass(frozen=True)
+class TextContrast:
+    """Measured legibility of the text box."""
+    ratio: float  # WCAG contrast ratio between glyph and background (1-21)
+    text_luminance: float
+    background_luminance: float
+    background_std: float  # Luminance standard deviation of the background away from glyphs
+
+
+def relative_luminance(pixels: np.ndarray) -> np.ndarray:
+    """WCAG relative luminance (0-1) of uint8 RGB pixels (..., 3)."""
+    return _LINEAR_LUT[pixels] @ _LUMINANCE_WEIGHTS
+
+
+def contrast_ratio(l1: float, l2: float) -> float:
+    """WCAG contrast ratio of two relative luminances."""
+    high, low = max(l1, l2), min(l1, l2)
+    return (high + 0.05) / (low + 0.05)
+
+
+def otsu_threshold(values: np.ndarray, bins: int = 256) -> float:
+    """Threshold (0-1) maximizing between-class variance of `values`."""
+    counts, edges = np.histogram(values, bins=bins, range=(0.0, 1.0))
+    centers = (edges[:-1] + edges[1:]) / 2
+    weight_low = np.cumsum(counts)
+    weight_high = weight_low[-1] - weight_low
+    sum_low = np.cumsum(counts * centers)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_low = sum_low / weight_low
+        mean_high = (sum_low[-1] - sum_low) / weight_high
+        between = weight_low * weight_high * (mean_low - mean_high) ** 2
+    return float(edges[int(np.nanargmax(between)) + 1]) if np.isfinite(between).any() else 0.5
+
+
+def measure_text_region(
+    pixels: np.ndarray, bbox: Sequence[int], max_samples: int = MAX_SAMPLES
+) -> Optional[TextContrast]:
+    """
+    Contrast and background busyness inside a text box.
+
+    Args:
+        pixels: Decoded RGB image, uint8 (H, W, 3)
+        bbox: (left, top, right, bottom) in image pixels
+        max_samples: Boxes with more pixels are strided down to about this many
+
+    Returns:
+        TextContrast, or None if the box is empty or outside the image
+    """
+    height, width = pixels.shape[:2]
+    left, top, right, bottom = (int(v) for v in bbox)
+    left, top = max(0, left), max(0, top)
+    right, bottom = min(width, right), min(height, bottom)
+    if right <= left or bottom <= top:
+        return None
+
+    step = max(1, int(np.ceil(np.sqrt((right - left) * (bottom - top) / max_samples))))
+    luminance = relative_luminance(pixels[top:bottom:step, left:right:step])
+
+    # Glyphs (fill and outline alike) are the minority class of the box
+    bright = luminance >= otsu_threshold(luminance.ravel())
+    glyph_mask = bright if bright.mean() <= 0.5 else ~bright
+    glyphs, background = luminance[glyph_mask], luminance[~glyph_mask]
+    if not glyphs.size or not background.size:
+        glyphs = background = luminance.ravel()  # Uniform box: ratio 1 (nothing legible)
+    text_luminance, background_luminance = float(glyphs.mean()), float(background.mean())
+
+    # Busyness: background clear of glyph edges and anti-aliasing; if glyphs fill
+    # the box, use a ring of the same neighborhood around it instead
+    clear = ~_dilate(glyph_mask, max(1, round(GLYPH_HALO / step)))
+    if clear.mean() >= MIN_CLEAR_SHARE:
+        background_std = float(luminance[clear].std())
+    else:
+        pad = max(GLYPH_HALO, (bottom - top) // 2)
+        outer = (max(0, left - pad), max(0, top - pad), min(width, right + pad), min(height, bottom + pad))
+        ring = relative_luminance(pixels[outer[1]:outer[3]:step, outer[0]:outer[2]:step])
+        inside = np.zeros(ring.shape, dtype=bool)
+        inside[(top - outer[1]) // step:(bottom - outer[1]) // step, (left - outer[0]) // step:(right - outer[0]) // step] = True
+        background_std = float(ring[~inside].std()) if (~inside).any() else 0.0
+
+    return TextContrast(
+        ratio=contrast_ratio(text_luminance, background_luminance),
+        text_luminance=text_luminance,
+        background_luminance=background_luminance,
+        background_std=background_std,
+    )
+
+
+def _dilate(mask: np.ndarray, radius: int) -> np.ndarray:
+    """Binary dilation with a square of side 2*radius+1 (separable shifts, no SciPy)."""
+    out = mask
+    for axis in (0, 1):
+        grown = out.copy()
+        for shift in range(1, radius + 1):
+            head = [slice(None)] * 2
+            tail = [slice(None)] * 2
+            head[axis], tail[axis] = slice(shift, None), slice(None, -shift)
+            grown[tuple(head)] |= out[tuple(tail)]
+            grown[tuple(tail)] |= out[tuple(head)]
+        out = grown
+    return out
+
+
+def suggest_fix(contrast: TextContrast, min_ratio: float, busy: bool = False) -> str:
+    """Cheapest change that reaches `min_ratio` against the measured background."""
+    background = contrast.background_luminance
+    if not busy:
+        if contrast.text_luminance < background and contrast_ratio(1.0, background) >= min_ratio:
+            return "Switch the text to white (#FFFFFF)"
+        if contrast.text_luminance > background and contrast_ratio(0.0, background) >= min_ratio:
+            return "Switch the text to black (#000000)"
+    # White text on a black box of opacity a: background becomes (1 - a) * background
+    opacity = 1.0 - (1.05 / min_ratio - 0.05) / background if background > 0 else 0.0
+    opacity = min(1.0, max(0.2, opacity + 0.05))
+    return f"Add a black backing box at {opacity:.0%} opacity behind white text"
+
+
+@dataclass(frozen=True)
+class TextContrastCheck:
+    """Validation engine check: WCAG contrast and background busyness under the slogan."""
+    min_ratio: float = 3.0  # WCAG AA for large text (overlay slogans are >= 18pt)
+    max_background_std: float = 0.15
+    max_samples: int = MAX_SAMPLES
+    name: str = "text_contrast"
+    inputs: Tuple[str, ...] = ("image", "text")
+    cost: str = "cpu"
+
+    def cache_key(self, asset: CreativeAsset, brand: Optional[BrandSummary]) -> Hashable:
+        bbox = asset.meta.get("text_bbox")
+        return (self.min_ratio, self.max_background_std, tuple(bbox) if bbox else None)
+
+    def run(self, ctx: CheckContext) -> Optional[List[ValidationIssue]]:
+        """Error below min_ratio, warning on a busy background (None without pixels or a text box)."""
+        bbox = ctx.asset.meta.get("text_bbox") if ctx.asset else None
+        if ctx.pixels is None or not bbox:
+            return None
+        contrast = measure_text_region(ctx.pixels, bbox, self.max_samples)
+        if contrast is None:
+            return None
+        ctx.meta["text_contrast"] = round(contrast.ratio, 2)
+        ctx.meta["text_background_std"] = round(contrast.background_std, 3)
+
+        issues = []
+        if contrast.ratio < self.min_ratio:
+            issues.append(ValidationIssue(
+                check_name=self.name,
+                severity="error",
+                message=f"Text contrast {contrast.ratio:.1f}:1 is below {self.min_ratio:.1f}:1",
+                fix_suggestion=suggest_fix(contrast, self.min_ratio),
+            ))
+        if contrast.background_std > self.max_background_std:
+            issues.append(ValidationIssue(
+                check_name=self.name,
+                severity="warning",
+                message=(
+                    f"Busy background behind text (luminance std {contrast.background_std:.2f}, "
+                    f"max {self.max_background_std:.2f})"
+                ),
+                fix_suggestion=suggest_fix(contrast, self.min_ratio, busy=True),
+            ))
+        return issues
@@ -0,0 +1,377 @@
+"""
+Validation Engine
+
+Runs pluggable checks over campaign assets:
+- Each check declares its inputs ("text", "image", "brand") and its cost, which
+  decides where it runs: "inline" checks (cheap, e.g. memoized regex or a pixel
+  count) always run in the calling process, text checks first; "cpu" checks
+  (Pillow/NumPy) take the image and go to a process pool for large batches
+- Image checks of one asset share a single decoded RGB array per process, so
+  adding a check never adds a decode (with a pool, the worker decodes for the
+  cpu checks and the caller only decodes when inline image checks exist)
+- Images are loaded as tasks are dispatched, with a bounded number in flight,
+  so memory does not grow with campaign size
+- Runs in-process by default; an engine-owned pool is shut down by close() or
+  at interpreter exit
+- Optional fail-fast: stop checking an asset at its first blocking error
+  (a copy error then skips loading and decoding the image entirely)
+- Image check results are cached by (image hash, check config), so re-validating
+  reused or unchanged images costs one hash
+"""
+import atexit
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+from io import BytesIO
+from typing import Any, Dict, Hashable, List, Optional, Protocol, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+
+from app.entities.brand_summary import BrandSummary
+from app.entities.creative_asset import CreativeAsset
+from app.entities.validation_result import ValidationIssue, ValidationResult, ValidationStatus
+
+
+PARALLEL_MIN_ASSETS = 8
+CACHE_SIZE = 4096
+IN_FLIGHT_PER_WORKER = 2  # Images loaded ahead of the pool, per worker
+
+
+@dataclass
+class CheckContext:
+    """Inputs handed to a check (image checks get the shared decoded pixels)."""
+    message: str
+    locale: str
+    asset: Optional[CreativeAsset] = None
+    brand: Optional[BrandSummary] = None
+    pixels: Optional[np.ndarray] = None  # RGB uint8 (H, W, 3), decoded once per asset
+    meta: Dict[str, Any] = field(default_factory=dict)  # Check outputs merged into asset.meta
+
+
+class IValidationCheck(Protocol):
+    """
+    Interface for validation checks.
+
+    Checks with cost "cpu" must take the image and are pickled to worker
+    processes, so they must hold only plain configuration (no locks, caches or
+    open handles). Checks with cost "inline" never leave the calling process.
+    """
+
+    name: str
+    inputs: Tuple[str, ...]  # Subset of ("text", "image", "brand")
+    cost: str  # "inline" or "cpu"
+
+    def cache_key(self, asset: CreativeAsset, brand: Optional[BrandSummary]) -> Hashable:
+        """Everything besides the image that the result depends on (config, brand fields, asset meta)."""
+        ...
+
+    def run(self, ctx: CheckContext) -> Optional[List[ValidationIssue]]:
+        """
+        Run the check.
+
+        Returns:
+            Issues found, or None if the check does not apply (not counted as run)
+        """
+        ...
+
+
+@dataclass
+class _ImageTask:
+    """One asset's image checks (picklable unit of work)."""
+    asset: CreativeAsset
+    brand: Optional[BrandSummary]
+    image_bytes: bytes
+    checks: Tuple[IValidationCheck, ...]
+    fail_fast: bool
+
+
+@dataclass
+class _ImageOutcome:
+    checks_run: List[str]
+    issues: List[ValidationIssue]
+    meta: Dict[str, Any]
+
+
+class ValidationEngine:
+    """Check runner: inline checks in-process, cpu checks pooled, shared decode, result cache."""
+
+    def __init__(
+        self,
+        checks: Sequence[IValidationCheck],
+        storage_adapter=None,
+        workers: int = 1,
+        fail_fast: bool = False,
+        parallel_min_assets: int = PARALLEL_MIN_ASSETS,
+        cache_size: int = CACHE_SIZE,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Args:
+            checks: Checks in run order (text checks, then inline image checks, then cpu checks)
+            storage_adapter: Where final images are read from (image checks are skipped without it)
+            workers: Worker processes for cpu checks (0 = one per core, 1 = run inline)
+            fail_fast: Stop checking an asset at its first error
+            parallel_min_assets: Smaller batches run inline (pool overhead outweighs the gain)
+            cache_size: Max cached image results (LRU)
+            executor: Executor to use instead of an engine-owned process pool
+        """
+        unknown = [c.cost for c in checks if c.cost not in ("inline", "cpu")]
+        if unknown:
+            raise ValueError(f"Unknown check cost: {unknown[0]}")
+        imageless = [c.name for c in checks if c.cost == "cpu" and "image" not in c.inputs]
+        if imageless:
+            raise ValueError(f"cpu check must take the image (only image work is pooled): {imageless[0]}")
+        self.checks = list(checks)
+        self.text_checks = [c for c in self.checks if "image" not in c.inputs]
+        self.inline_image_checks = tuple(c for c in self.checks if "image" in c.inputs and c.cost == "inline")
+        self.cpu_checks = tuple(c for c in self.checks if c.cost == "cpu")
+        self.image_checks = self.inline_image_checks + self.cpu_checks
+        self.storage = storage_adapter
+        self.workers = workers or os.cpu_count() or 1
+        self.fail_fast = fail_fast
+        self.parallel_min_assets = parallel_min_assets
+        self.cache_size = cache_size
+        self._executor = executor
+        self._owns_executor = False
+        self._cache: "OrderedDict[Tuple, _ImageOutcome]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"images_checked": 0, "cache_hits": 0, "parallel_batches": 0}
+
+    def check_copy(self, message: str, locale: str) -> List[ValidationIssue]:
+        """
+        Run only the text checks (no image needed), e.g. before generation.
+
+        Args:
+            message: Localized copy
+            locale: Locale whose rules apply
+
+        Returns:
+            Issues found in the copy
+        """
+        ctx = CheckContext(message=message, locale=locale)
+        issues: List[ValidationIssue] = []
+        for check in self.text_checks:
+            issues.extend(check.run(ctx) or [])
+            if self.fail_fast and _has_error(issues):
+                break
+        return issues
+
+    def run(self, assets: Sequence[CreativeAsset], brand: Optional[BrandSummary] = None) -> List[ValidationResult]:
+        """
+        Validate assets.
+
+        Args:
+            assets: CreativeAsset entities (check outputs are merged into their meta)
+            brand: Brand the assets belong to
+
+        Returns:
+            One ValidationResult per asset, in order
+        """
+        checks_run: List[List[str]] = []
+        issues: List[List[ValidationIssue]] = []
+
+        # Stage 1: text checks (all inline), in-process
+        for asset in assets:
+            ctx = CheckContext(message=asset.message, locale=asset.locale, asset=asset, brand=brand)
+            ran, found = [], []
+            for check in self.text_checks:
+                result = check.run(ctx)
+                if result is None:
+                    continue
+                ran.append(check.name)
+                found.extend(result)
+                if self.fail_fast and _has_error(found):
+                    break
+            asset.meta.update(ctx.meta)
+            checks_run.append(ran)
+            issues.append(found)
+
+        # Stage 2: image checks, one task per distinct image (cpu checks pooled for large batches)
+        for i, outcome in self._image_outcomes(assets, brand, issues).items():
+            checks_run[i].extend(outcome.checks_run)
+            issues[i].extend(outcome.issues)
+            assets[i].meta.update(outcome.meta)
+
+        return [_to_result(asset, ran, found) for asset, ran, found in zip(assets, checks_run, issues)]
+
+    def stats(self) -> Dict[str, int]:
+        """Image checks executed, cache hits, and batches sent to the pool."""
+        with self._lock:
+            return dict(self._stats, cached=len(self._cache))
+
+    def close(self) -> None:
+        """Shut down the engine-owned process pool (if started)."""
+        with self._lock:
+            executor = self._executor if self._owns_executor else None
+            if executor is not None:
+                self._executor = None
+                self._owns_executor = False
+        if executor is not None:
+            atexit.unregister(self.close)
+            executor.shutdown()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _image_outcomes(
+        self,
+        assets: Sequence[CreativeAsset],
+        brand: Optional[BrandSummary],
+        issues: List[List[ValidationIssue]],
+    ) -> Dict[int, _ImageOutcome]:
+        """
+        Load each image as it is dispatched, dedupe by hash, serve from cache, run the rest.
+
+        In-process, one task runs every image check on one decode. With a pool,
+        the inline image checks run here first and only the cpu checks are
+        submitted (skipped when fail-fast already has an error).
+        """
+        if not self.image_checks or self.storage is None:
+            return {}
+
+        candidates = [
+            i for i, asset in enumerate(assets)
+            if asset.meta.get("storage_path") and not (self.fail_fast and _has_error(issues[i]))
+        ]
+        executor = None
+        if self.workers > 1 and len(candidates) >= self.parallel_min_assets:
+            executor = self._get_executor()
+            with self._lock:
+                self._stats["parallel_batches"] += 1
+        max_in_flight = self.workers * IN_FLIGHT_PER_WORKER
+
+        outcomes: Dict[int, _ImageOutcome] = {}
+        pending: Dict[Tuple, List[int]] = {}
+        in_flight: Dict[Future, Tuple[Tuple, _ImageOutcome]] = {}
+        for i in candidates:
+            asset = assets[i]
+            try:
+                image_bytes = self.storage.load(asset.meta["storage_path"])
+            except Exception:
+                continue  # Missing image: image checks are skipped for this asset
+            config = tuple((c.name, c.cache_key(asset, brand)) for c in self.image_checks)
+            key = (hashlib.sha256(image_bytes).hexdigest(), config)
+            with self._lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    self._stats["cache_hits"] += 1
+            if cached is not None:
+                outcomes[i] = cached
+                continue
+            if key in pending:
+                pending[key].append(i)  # Same image still being checked: reuse its outcome
+                continue
+
+            pending[key] = [i]
+            with self._lock:
+                self._stats["images_checked"] += 1
+            task = _ImageTask(
+                asset=asset,
+                brand=brand,
+                image_bytes=image_bytes,
+                checks=self.image_checks,
+                fail_fast=self.fail_fast,
+            )
+            if executor is None:
+                self._finish(key, run_image_checks(task), pending, outcomes)
+                continue
+
+            inline = _ImageOutcome(checks_run=[], issues=[], meta={})
+            if self.inline_image_checks:
+                inline = run_image_checks(replace(task, checks=self.inline_image_checks))
+            if not self.cpu_checks or (self.fail_fast and _has_error(inline.issues)):
+                self._finish(key, inline, pending, outcomes)
+                continue
+            if len(in_flight) >= max_in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    done_key, done_inline = in_flight.pop(future)
+                    self._finish(done_key, _combine(done_inline, future.result()), pending, outcomes)
+            task = replace(task, checks=self.cpu_checks)
+            in_flight[executor.submit(run_image_checks, task)] = (key, inline)
+
+        for future in wait(in_flight).done:
+            done_key, done_inline = in_flight[future]
+            self._finish(done_key, _combine(done_inline, future.result()), pending, outcomes)
+        return outcomes
+
+    def _finish(
+        self,
+        key: Tuple,
+        outcome: _ImageOutcome,
+        pending: Dict[Tuple, List[int]],
+        outcomes: Dict[int, _ImageOutcome],
+    ) -> None:
+        """Cache a finished image's outcome and hand it to every asset waiting on it."""
+        with self._lock:
+            self._cache[key] = outcome
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        for i in pending.pop(key):
+            outcomes[i] = outcome
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                self._owns_executor = True
+                atexit.register(self.close)
+            return self._executor
+
+
+def run_image_checks(task: _ImageTask) -> _ImageOutcome:
+    """Decode once and run every image check on the shared pixels (worker entry point)."""
+    try:
+        with Image.open(BytesIO(task.image_bytes)) as img:
+            pixels = np.asarray(img.convert("RGB"))
+    except Exception:
+        return _ImageOutcome(checks_run=[], issues=[], meta={})  # Undecodable (e.g., placeholder bytes)
+
+    asset = task.asset
+    ctx = CheckContext(message=asset.message, locale=asset.locale, asset=asset, brand=task.brand, pixels=pixels)
+    ran, found = [], []
+    for check in task.checks:
+        result = check.run(ctx)
+        if result is None:
+            continue
+        ran.append(check.name)
+        found.extend(result)
+        if task.fail_fast and _has_error(found):
+            break
+    return _ImageOutcome(checks_run=ran, issues=found, meta=ctx.meta)
+
+
+def _combine(first: _ImageOutcome, second: _ImageOutcome) -> _ImageOutcome:
+    """One asset's inline and pooled image outcomes, in run order."""
+    return _ImageOutcome(
+        checks_run=first.checks_run + second.checks_run,
+        issues=first.issues + second.issues,
+        meta={**first.meta, **second.meta},
+    )
+
+
+def _has_error(issues: Sequence[ValidationIssue]) -> bool:
+    return any(i.severity == "error" for i in issues)
+
+
+def _to_result(asset: CreativeAsset, checks_run: List[str], issues: List[ValidationIssue]) -> ValidationResult:
+    """Status and per-check counts (a check with several errors fails once)."""
+    failing = {i.check_name for i in issues if i.severity == "error"}
+    failed_count = sum(1 for name in checks_run if name in failing)
+    passed_count = len(checks_run) - failed_count
+    status = ValidationStatus.FAILED if failing else ValidationStatus.PASSED
+    return ValidationResult(
+        asset_id=asset.asset_id,
+        status=status,
+        checks_run=checks_run,
+        issues=issues,
+        passed_count=passed_count,
+        failed_count=failed_count,
+    )
@@ -0,0 +1,158 @@
+"""
+Prohibited-Word Policy
+
+Legal copy check compiled once per policy version:
+- Per-locale word lists: "*" applies everywhere, then the language ("es")
+  and the full locale ("es-US") add their own words
+- One case-insensitive regex per locale with word-boundary guards, so "free"
+  matches "Free!" but not "carefree"; a trailing "*" matches word prefixes
+  ("guarantee*" also catches "guaranteed")
+- Results memoized per (message, locale) on the policy's matcher, so the same
+  slogan across products and aspects is scanned once
+"""
+import hashlib
+import json
+import re
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Hashable, List, Mapping, Optional, Tuple
+
+import yaml
+
+from app.entities.brand_summary import BrandSummary
+from app.entities.creative_asset import CreativeAsset
+from app.entities.validation_result import ValidationIssue
+from app.use_cases.validation.engine import CheckContext
+
+
+DEFAULT_WORDS: Dict[str, Tuple[str, ...]] = {
+    "*": ("guarantee*", "miracle*", "cure", "cures", "cured", "free"),  # "free": unless truly free
+    "es": ("garantía", "garantiza*", "milagro*", "cura", "gratis"),
+}
+MESSAGE_CACHE_SIZE = 65536
+
+
+@dataclass(frozen=True)
+class ContentPolicy:
+    """Prohibited words per locale ("*" = all locales)."""
+    words: Mapping[str, Tuple[str, ...]] = field(default_factory=lambda: dict(DEFAULT_WORDS))
+    version: str = field(init=False, compare=False)
+
+    def __post_init__(self):
+        # Content hash of the word lists: changes whenever any list changes
+        canonical = json.dumps({k: sorted(v) for k, v in self.words.items()}, sort_keys=True, ensure_ascii=False)
+        object.__setattr__(self, "version", hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16])
+
+    def words_for(self, locale: str) -> Tuple[str, ...]:
+        """Words applying to a locale: global, language, then full locale."""
+        language = locale.split("-")[0]
+        scopes = ["*", language.lower(), locale.lower()]
+        lowered = {key.lower(): value for key, value in self.words.items()}
+        words: List[str] = []
+        for scope in dict.fromkeys(scopes):
+            words.extend(lowered.get(scope, ()))
+        return tuple(dict.fromkeys(w.lower() for w in words if w))
+
+    @classmethod
+    def from_file(cls, path: Path) -> "ContentPolicy":
+        """
+        Load a policy from YAML/JSON: {"words": {"*": [...], "es": [...]}}.
+
+        Args:
+            path: Policy file
+
+        Returns:
+            ContentPolicy
+        """
+        raw = Path(path).read_bytes()
+        data = json.loads(raw) if str(path).lower().endswith(".json") else yaml.safe_load(raw)
+        words = (data or {}).get("words", data or {})
+        return cls(words={str(scope): tuple(values or ()) for scope, values in words.items()})
+
+
+class ProhibitedWordMatcher:
+    """Compiled, memoized prohibited-word finder for one policy version."""
+
+    def __init__(self, policy: ContentPolicy, cache_size: int = MESSAGE_CACHE_SIZE):
+        self.policy = policy
+        self.version = policy.version
+        self._pattern = lru_cache(maxsize=None)(self._compile)
+        self.find = lru_cache(maxsize=cache_size)(self._find)
+
+    def _find(self, message: str, locale: str) -> Tuple[str, ...]:
+        """
+        Policy words occurring in a message (memoized per message and locale).
+
+        Args:
+            message: Localized copy
+            locale: Locale whose word lists apply
+
+        Returns:
+            Matched policy entries (as written in the policy, without "*"), in order of first occurrence
+        """
+        pattern, exact, prefixes = self._pattern(locale)
+        if pattern is None:
+            return ()
+        found = []
+        for match in pattern.finditer(message):
+            token = match.group(0).lower()
+            word = token if token in exact else next(p for p in prefixes if token.startswith(p))
+            if word not in found:
+                found.append(word)
+        return tuple(found)
+
+    def _compile(self, locale: str):
+        """One alternation per locale; longest alternatives first so prefixes cannot shadow words."""
+        words = self.policy.words_for(locale)
+        exact = frozenset(w for w in words if not w.endswith("*"))
+        prefixes = tuple(sorted((w[:-1] for w in words if w.endswith("*")), key=len, reverse=True))
+        alternatives = sorted(
+            [re.escape(w) for w in exact] + [re.escape(p) + r"\w*" for p in prefixes],
+            key=len,
+            reverse=True,
+        )
+        if not alternatives:
+            return None, exact, prefixes
+        pattern = re.compile(r"(?<!\w)(?:" + "|".join(alternatives) + r")(?!\w)", re.IGNORECASE)
+        return pattern, exact, prefixes
+
+
+_matchers: Dict[str, ProhibitedWordMatcher] = {}
+_matchers_lock = threading.Lock()
+
+
+def matcher_for(policy: ContentPolicy) -> ProhibitedWordMatcher:
+    """Shared matcher per policy version (built once per process, reused by every validator)."""
+    with _matchers_lock:
+        matcher = _matchers.get(policy.version)
+        if matcher is None:
+            matcher = _matchers[policy.version] = ProhibitedWordMatcher(policy)
+        return matcher
+
+
+class ProhibitedWordsCheck:
+    """Validation engine check: prohibited words in the copy (inline, memoized)."""
+
+    name = "prohibited_words"
+    inputs = ("text",)
+    cost = "inline"
+
+    def __init__(self, policy: ContentPolicy):
+        self.matcher = matcher_for(policy)
+
+    def cache_key(self, asset: CreativeAsset, brand: Optional[BrandSummary]) -> Hashable:
+        return self.matcher.version
+
+    def run(self, ctx: CheckContext) -> Optional[List[ValidationIssue]]:
+        """One error per policy word found in the message."""
+        return [
+            ValidationIssue(
+                check_name=self.name,
+                severity="error",
+                message=f"Prohibited word detected: '{word}'",
+                fix_suggestion=f"Remove or rephrase to avoid '{word}'",
+            )
+            for word in self.matcher.find(ctx.message, ctx.locale)
+        ]
@@ -10,14 +10,16 @@ from datetime import datetime
 
 from app.entities.campaign_brief import CampaignBrief, Product
 from app.use_cases.generate_campaign_uc import GenerateCampaignUC
-from app.use_cases.validate_campaign_uc import ValidateCampaignUC
 from app.interface_adapters.orchestrators.campaign_orchestrator import CampaignOrchestrator
 from app.interface_adapters.presenters.campaign_presenter import CampaignPresenter
 from app.infrastructure.factories import (
     create_ai_adapter,
     create_storage_adapter,
     create_brand_repository,
+    create_asset_repository,
+    create_validate_campaign_uc,
 )
+from app.infrastructure.repositories.asset.weaviate import WeaviateAssetRepository
 
 app = typer.Typer(
     name="campaign-generator",
@@ -40,8 +42,8 @@ def build_orchestrator(use_real: bool = False) -> CampaignOrchestrator:
     storage_adapter = create_storage_adapter(use_real=use_real)
     brand_repo = create_brand_repository(use_real=use_real)
 
-    generate_uc = GenerateCampaignUC(ai_adapter, storage_adapter)
-    validate_uc = ValidateCampaignUC()
+    validate_uc = create_validate_campaign_uc(storage_adapter)
+    generate_uc = GenerateCampaignUC(ai_adapter, storage_adapter, copy_validator=validate_uc)
 
     return CampaignOrchestrator(generate_uc, validate_uc, brand_repo)
 
@@ -185,5 +187,52 @@ def demo():
     typer.echo("💡 Tip: Try 'campaign-generator generate --help' for custom campaigns")
 
 
+@app.command("compact-assets")
+def compact_assets():
+    """
+    Deduplicate the BrandAsset collection (one-off, real Weaviate only).
+
+    Earlier versions inserted a new object on every upsert. This keeps one
+    object per asset_id under its deterministic UUID and deletes the rest.
+    """
+    typer.echo("🧹 Compacting BrandAsset collection...")
+    try:
+        repo = create_asset_repository(use_real=True)
+        stats = repo.compact()
+    except Exception as e:
+        typer.echo(f"\n❌ Error: {e}", err=True)
+        typer.echo("Make sure Weaviate is running: make up", err=True)
+        raise typer.Exit(code=1)
+
+    typer.echo(f"   Objects scanned: {stats['scanned']}")
+    typer.echo(f"   Distinct assets: {stats['asset_ids']}")
+    typer.echo(f"   Re-keyed: {stats['rekeyed']}")
+    typer.echo(f"   Duplicates deleted: {stats['deleted']}")
+    typer.echo("\n✅ Compaction complete!")
+
+
+@app.command("migrate-asset-tenants")
+def migrate_asset_tenants():
+    """
+    Copy BrandAsset objects into per-brand tenants (real Weaviate only).
+
+    Run once before enabling WEAVIATE_MULTI_TENANCY=true. Vectors are copied,
+    so nothing is re-vectorized; the shared collection is left in place.
+    """
+    typer.echo("🏷️  Migrating BrandAsset into per-brand tenants...")
+    try:
+        repo = WeaviateAssetRepository(multi_tenancy=True)
+        stats = repo.migrate_to_tenants()
+    except Exception as e:
+        typer.echo(f"\n❌ Error: {e}", err=True)
+        typer.echo("Make sure Weaviate is running: make up", err=True)
+        raise typer.Exit(code=1)
+
+    typer.echo(f"   Objects copied: {stats['copied']}")
+    typer.echo(f"   Brands (tenants): {stats['brands']}")
+    typer.echo(f"   Failed: {stats['failed']}")
+    typer.echo("\n✅ Migration complete! Set WEAVIATE_MULTI_TENANCY=true to use tenants.")
+
+
 if __name__ == "__main__":
     app()
@@ -14,15 +14,20 @@ from PIL import Image
 
 from app.entities.campaign_brief import CampaignBrief, Product
 from app.use_cases.generate_campaign_uc import GenerateCampaignUC
-from app.use_cases.validate_campaign_uc import ValidateCampaignUC
 from app.interface_adapters.orchestrators.campaign_orchestrator import CampaignOrchestrator
-from app.infrastructure.factories import (
-    create_ai_adapter,
-    create_storage_adapter,
-    create_brand_repository,
-    create_asset_repository,
+from app.infrastructure.factories import create_ai_adapter
+from drivers.ui.streamlit.shared import (
+    parse_brief_file,
+    upload_seed_assets,
+    get_storage_adapter,
+    get_asset_repository,
+    get_brand_repository,
+    get_dedup_service,
+    get_reuse_engine,
+    get_validate_uc,
+    asset_storage_path,
+    image_url,
 )
-from drivers.ui.streamlit.shared import parse_brief_file, upload_seed_assets
 
 st.set_page_config(page_title="Generate Campaign", page_icon="🎨", layout="wide")
 
@@ -122,6 +127,12 @@ if use_real:
                         st.error(result["error"])
                     else:
                         st.success(f"✓ Uploaded {result['seed_count']} seed(s) for {product_name}")
+                        for failure in result.get("failed", []):
+                            st.warning(f"Indexing failed for {failure['asset_id']}: {failure['message']}")
+                        for dup in result.get("duplicates", []):
+                            st.info(f"Skipped {dup['filename']}: near-duplicate of {dup['duplicate_of']}")
+                        for reject in result.get("rejected", []):
+                            st.warning(f"Rejected {reject['filename']}: {reject['message']}")
                 except Exception as e:
                     st.error(f"Upload failed: {e}")
 
@@ -282,17 +293,20 @@ if st.button("🚀 Generate Campaign", type="primary", use_container_width=True)
             # Create orchestrator with progress callback
             status_text.text("🔍 Loading brand information...")
             ai_adapter = create_ai_adapter(use_real=use_real)
-            storage_adapter = create_storage_adapter(use_real=use_real)
-            brand_repo = create_brand_repository(use_real=use_real)
-            asset_repo = create_asset_repository(use_real=use_real)
+            storage_adapter = get_storage_adapter(use_real=use_real)
+            brand_repo = get_brand_repository(use_real=use_real)
+            asset_repo = get_asset_repository(use_real=use_real)
 
+            validate_uc = get_validate_uc(use_real=use_real)
             generate_uc = GenerateCampaignUC(
                 ai_adapter,
                 storage_adapter,
                 asset_repo,
-                progress_callback=update_progress
+                progress_callback=update_progress,
+                dedup_service=get_dedup_service(use_real=use_real),
+                reuse_engine=get_reuse_engine(use_real=use_real),
+                copy_validator=validate_uc,
             )
-            validate_uc = ValidateCampaignUC()
             orchestrator = CampaignOrchestrator(generate_uc, validate_uc, brand_repo)
 
             # Run actual generation with real-time progress
@@ -338,6 +352,8 @@ if "result" in st.session_state:
         st.success(f"✅ All {passed} assets passed validation")
     else:
         st.warning(f"⚠️ {failed} assets failed validation, {passed} passed")
+    for locale, messages in result.get("blocked_locales", {}).items():
+        st.error(f"🚫 {locale} not generated, copy failed validation: {'; '.join(messages)}")
 
     # Assets Gallery
     st.subheader("Generated Assets")
@@ -365,17 +381,17 @@ if "result" in st.session_state:
 
                         # Show reused flag
                         if hasattr(asset, 'reused') and asset.reused:
-                            st.caption("♻️ Reused from asset library")
+                            tier = (asset.meta or {}).get("reuse_tier")
+                            st.caption(f"♻️ Reused from asset library ({tier} match)" if tier else "♻️ Reused from asset library")
 
                         # Display image if using real adapters
                         if use_real_for_display:
                             try:
-                                storage = create_storage_adapter(use_real=True)
-                                # Extract path from S3 URI (s3://bucket/path -> path)
-                                path = asset.image_url.replace(f"s3://{storage.bucket}/", "")
-                                image_bytes = storage.load(path)
-                                image = Image.open(BytesIO(image_bytes))
-                                st.image(image, use_container_width=True)
+                                storage = get_storage_adapter(use_real=True)
+                                st.image(
+                                    image_url(storage, asset_storage_path(asset)),
+                                    use_container_width=True,
+                                )
                             except Exception as e:
                                 st.error(f"Failed to load image: {e}")
                         else:
@@ -92,6 +92,12 @@ if st.button("🚀 Upload Seeds", type="primary", disabled=not uploaded_files, u
                     st.error(result["error"])
                 else:
                     st.success(f"✅ Uploaded {result['seed_count']} seed asset(s)")
+                    for failure in result.get("failed", []):
+                        st.warning(f"Indexing failed for {failure['asset_id']}: {failure['message']}")
+                    for dup in result.get("duplicates", []):
+                        st.info(f"Skipped {dup['filename']}: near-duplicate of {dup['duplicate_of']}")
+                    for reject in result.get("rejected", []):
+                        st.warning(f"Rejected {reject['filename']}: {reject['message']}")
 
                     # Show details
                     st.subheader("Upload Details")
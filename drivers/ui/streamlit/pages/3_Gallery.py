@@ -4,10 +4,8 @@ Page 2: Asset Gallery
 View all generated assets across campaigns.
 """
 import streamlit as st
-from PIL import Image
-from io import BytesIO
 
-from app.infrastructure.factories import create_storage_adapter
+from drivers.ui.streamlit.shared import get_storage_adapter, image_url
 
 st.set_page_config(page_title="Asset Gallery", page_icon="🖼️", layout="wide")
 
@@ -16,7 +14,7 @@ st.header("🖼️ Asset Gallery")
 use_real = st.checkbox("Use real storage (MinIO)", value=False)
 
 if use_real:
-    storage = create_storage_adapter(use_real=True)
+    storage = get_storage_adapter(use_real=True)
 
     # List all assets
     all_assets = storage.list("")
@@ -42,18 +40,12 @@ if use_real:
         for idx, asset_path in enumerate(filtered_assets):
             with cols[idx % 3]:
                 try:
-                    image_bytes = storage.load(asset_path)
-                    image = Image.open(BytesIO(image_bytes))
-                    st.image(image, caption=asset_path, use_container_width=True)
+                    # Browser fetches the image directly (no bytes through this process)
+                    url = image_url(storage, asset_path)
+                    st.image(url, caption=asset_path, use_container_width=True)
 
-                    # Add download button
-                    st.download_button(
-                        label="Download",
-                        data=image_bytes,
-                        file_name=asset_path.split("/")[-1],
-                        mime="image/png",
-                        key=f"download_{idx}",
-                    )
+                    if url.startswith("http"):
+                        st.link_button("Download", url)
                 except Exception as e:
                     st.error(f"Failed to load {asset_path}: {e}")
 else:
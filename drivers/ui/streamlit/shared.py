@@ -7,15 +7,97 @@ import io
 import json
 import yaml
 import hashlib
+import streamlit as st
 from typing import Tuple, Dict, List
 from datetime import datetime
 from io import BytesIO
+from urllib.parse import urlparse, unquote
 from colorthief import ColorThief
 
+from app.adapters.storage.keys import key_from_uri
 from app.entities.campaign_brief import CampaignBrief, Product
 from app.entities.creative_asset import CreativeAsset
-from app.infrastructure.repositories.asset.weaviate import WeaviateAssetRepository
-from app.adapters.storage.minio import MinIOStorageAdapter
+from app.infrastructure.repositories.asset.dto import AssetWithImage
+from app.infrastructure.repositories.asset.protocol import IAssetRepository
+from app.adapters.storage.protocol import IStorageAdapter
+from app.infrastructure.repositories.brand.protocol import IBrandRepository
+from app.infrastructure.dedup.perceptual_hash import to_hex
+from app.infrastructure.dedup.service import DedupService
+from app.infrastructure.factories import (
+    create_asset_repository,
+    create_validate_campaign_uc,
+    create_brand_repository,
+    create_dedup_service,
+    create_reuse_engine,
+    create_storage_adapter,
+)
+from app.use_cases.reuse_engine import ReuseEngine
+from app.use_cases.validate_campaign_uc import ValidateCampaignUC
+from app.infrastructure.config import settings
+
+
+@st.cache_resource
+def get_storage_adapter(use_real: bool) -> IStorageAdapter:
+    """
+    Process-wide storage adapter.
+
+    Streamlit reruns the page script on every interaction; sharing the adapter
+    keeps its read-through cache warm so repeat views skip the network.
+    """
+    return create_storage_adapter(use_real=use_real)
+
+
+@st.cache_resource
+def get_asset_repository(use_real: bool) -> IAssetRepository:
+    """
+    Process-wide asset repository.
+
+    In fake mode the in-memory index must outlive a single page run,
+    otherwise generated assets could never be reused.
+    """
+    return create_asset_repository(use_real=use_real)
+
+
+@st.cache_resource
+def get_brand_repository(use_real: bool) -> IBrandRepository:
+    """Process-wide brand repository, so brand loads are cached across page runs."""
+    return create_brand_repository(use_real=use_real)
+
+
+@st.cache_resource
+def get_dedup_service(use_real: bool) -> DedupService:
+    """Process-wide near-duplicate index, warmed once from stored hashes."""
+    return create_dedup_service(get_asset_repository(use_real=use_real))
+
+
+@st.cache_resource
+def get_reuse_engine(use_real: bool) -> ReuseEngine:
+    """Process-wide reuse engine, so its local index and tier metrics span page runs."""
+    return create_reuse_engine(get_asset_repository(use_real=use_real))
+
+
+@st.cache_resource
+def get_validate_uc(use_real: bool) -> ValidateCampaignUC:
+    """Process-wide validation use case, so its image-result cache and worker pool span page runs."""
+    return create_validate_campaign_uc(get_storage_adapter(use_real=use_real))
+
+
+def image_url(storage: IStorageAdapter, path: str) -> str:
+    """
+    URL for st.image without proxying bytes through the Streamlit server.
+
+    Presigned MinIO URLs are handed to the browser as-is; file:// URIs are
+    converted to local paths, which Streamlit serves as static media.
+    """
+    url = storage.url_for(path, ttl=settings.STORAGE_URL_TTL_SECONDS)
+    if url.startswith("file://"):
+        return unquote(urlparse(url).path)
+    return url
+
+
+def asset_storage_path(asset: CreativeAsset) -> str:
+    """Recover the storage key of an asset (falls back to parsing s3:// URIs)."""
+    return (asset.meta or {}).get("storage_path") or key_from_uri(asset.image_url) or asset.image_url
 
 
 def parse_brief_file(upload) -> Tuple[CampaignBrief, dict]:
@@ -69,6 +151,11 @@ def upload_seed_assets(
     """
     Upload seed images to MinIO and index in Weaviate.
 
+    Near-duplicates of a brand's existing seeds (perceptual hash within the
+    dedup threshold) are skipped and reported instead of stored and indexed.
+    Files that cannot be decoded or saved are reported as rejected; the rest
+    of the batch is still stored and indexed.
+
     Args:
         brand_id: Brand identifier
         product_name: Product name for these assets
@@ -76,18 +163,40 @@ def upload_seed_assets(
         use_real: Use real adapters (MinIO + Weaviate)
 
     Returns:
-        Dict with seed_count and seeded assets list
+        Dict with seed_count, seeded assets list, skipped duplicates, rejected files,
+        and per-object indexing failures (if any)
     """
     if not use_real:
         return {"seed_count": 0, "seeded": [], "error": "Real adapters required for upload"}
 
-    storage = MinIOStorageAdapter()
-    asset_repo = WeaviateAssetRepository()
+    storage = get_storage_adapter(use_real=True)
+    asset_repo = get_asset_repository(use_real=True)
+    dedup = get_dedup_service(use_real=True)
 
     seeded = []
+    duplicates = []
+    rejected = []
+    to_index = []
     for upload in uploaded_files:
         raw = upload.getvalue()
 
+        # Generate asset ID
+        asset_id = f"seed-{hashlib.sha1(raw).hexdigest()[:8]}"
+
+        # Skip near-identical re-exports before any upload or vectorization
+        try:
+            phash, match = dedup.check_and_add(brand_id, raw, asset_id)
+        except Exception as e:
+            rejected.append({"filename": upload.name, "message": f"Not a readable image: {e}"})
+            continue
+        if match:
+            duplicates.append({
+                "filename": upload.name,
+                "duplicate_of": match.asset_id,
+                "distance": match.distance,
+            })
+            continue
+
         # Extract color palette
         try:
             ct = ColorThief(BytesIO(raw))
@@ -96,12 +205,14 @@ def upload_seed_assets(
         except Exception:
             palette_hex = []
 
-        # Generate asset ID
-        asset_id = f"seed-{hashlib.sha1(raw).hexdigest()[:8]}"
-
-        # Save to MinIO
+        # Save to MinIO (a failed save must not leave its hash behind as a phantom duplicate)
         key = f"{brand_id}/{product_name}/seeds/{upload.name}"
-        image_url = storage.save(key, raw)
+        try:
+            image_url = storage.save(key, raw)
+        except Exception as e:
+            dedup.remove(brand_id, asset_id)
+            rejected.append({"filename": upload.name, "message": f"Upload failed: {e}"})
+            continue
 
         # Create asset entity
         asset = CreativeAsset(
@@ -116,16 +227,16 @@ def upload_seed_assets(
             image_url=image_url,
             reused=False,  # This is a new upload
             generated_at=datetime.now(),
-            meta={"tags": ["seed", "uploaded"]},
+            meta={"tags": ["seed", "uploaded"], "storage_path": key, "phash": to_hex(phash, dedup.hash_size)},
         )
 
-        # Index in Weaviate with image bytes for vectorization
-        asset_repo.upsert(
-            asset,
+        # Queue for batch indexing in Weaviate (image bytes for vectorization)
+        to_index.append(AssetWithImage(
+            asset=asset,
             image_bytes=raw,
             tags=["seed", "uploaded"],
             palette=palette_hex,
-        )
+        ))
 
         seeded.append({
             "filename": upload.name,
@@ -134,4 +245,14 @@ def upload_seed_assets(
             "palette": palette_hex,
         })
 
-    return {"seed_count": len(seeded), "seeded": seeded}
+    # One batch write instead of a round trip per image
+    failures = asset_repo.upsert_many(to_index)
+    failed_ids = {f.asset_id for f in failures}
+    seeded = [item for item in seeded if item["asset_id"] not in failed_ids]
+    for asset_id in failed_ids:
+        dedup.remove(brand_id, asset_id)
+
+    result = {"seed_count": len(seeded), "seeded": seeded, "duplicates": duplicates, "rejected": rejected}
+    if failures:
+        result["failed"] = [{"asset_id": f.asset_id, "message": f.message} for f in failures]
+    return result
@@ -0,0 +1,75 @@
+"""
+Adapter Tests: CachedEmbeddingAdapter
+
+Content-hash caching over the deterministic hashing embedder.
+"""
+import numpy as np
+
+from app.adapters.embedding.cached import CachedEmbeddingAdapter
+from app.adapters.embedding.fake import HashingEmbeddingAdapter
+
+
+class CountingEmbedder(HashingEmbeddingAdapter):
+    """Hashing embedder that records every image batch it receives."""
+
+    def __init__(self):
+        super().__init__(dimensions=64)
+        self.image_batches = []
+
+    def embed_images(self, images):
+        self.image_batches.append(list(images))
+        return super().embed_images(images)
+
+
+def test_unchanged_images_are_not_re_embedded_across_restarts(tmp_path):
+    """
+    Given: A persistent embedding cache that has embedded two images
+    When: A new process re-indexes them together with one new image
+    Then: Only the new image reaches the embedder, and cached vectors match the originals
+    """
+    # GIVEN
+    inner = CountingEmbedder()
+    first = CachedEmbeddingAdapter(inner, db_path=tmp_path / "embeddings.db")
+    original = first.embed_images([b"image-a", b"image-b"])
+    first.close()
+
+    # WHEN
+    inner.image_batches.clear()
+    second = CachedEmbeddingAdapter(inner, db_path=tmp_path / "embeddings.db")
+    vectors = second.embed_images([b"image-a", b"image-c", b"image-b"])
+
+    # THEN
+    assert inner.image_batches == [[b"image-c"]]
+    np.testing.assert_array_equal(vectors[[0, 2]], original)
+    assert second.stats()["hits"] == 2
+    assert second.stats()["entries"] == 3
+
+
+def test_duplicates_in_one_batch_are_embedded_once():
+    """
+    Given: An empty cache
+    When: A batch contains the same image twice
+    Then: The embedder sees it once and both rows get the same vector
+    """
+    inner = CountingEmbedder()
+    embedder = CachedEmbeddingAdapter(inner)
+
+    vectors = embedder.embed_images([b"same", b"same"])
+
+    assert inner.image_batches == [[b"same"]]
+    np.testing.assert_array_equal(vectors[0], vectors[1])
+
+
+def test_texts_and_images_do_not_share_cache_keys():
+    """
+    Given: A text and an image with identical bytes
+    When: Both are embedded
+    Then: Each is a separate cache entry (different towers, different vectors)
+    """
+    embedder = CachedEmbeddingAdapter(CountingEmbedder())
+
+    embedder.embed_texts(["soap"])
+    embedder.embed_images([b"soap"])
+
+    assert embedder.stats()["entries"] == 2
+    assert embedder.stats()["misses"] == 2
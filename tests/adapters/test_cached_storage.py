@@ -0,0 +1,183 @@
+"""
+Adapter Tests: CachedStorageAdapter
+
+Read-through caching over a counting fake store.
+"""
+from app.adapters.storage.cached import CachedStorageAdapter
+from app.adapters.storage.fake import FakeStorageAdapter
+
+
+class CountingStorage(FakeStorageAdapter):
+    """Fake store with ETag support that counts inner reads."""
+
+    def __init__(self):
+        super().__init__()
+        self.loads = 0
+
+    def load_conditional(self, path, etag=None):
+        self.loads += 1
+        content = self.load(path)
+        current = str(hash(content))
+        if etag == current:
+            return None, etag
+        return content, current
+
+
+def test_repeat_loads_hit_memory(tmp_path):
+    """
+    Given: A cached store in front of a counting store
+    When: The same path is loaded repeatedly
+    Then: Only the first load reaches the inner store
+    """
+    # GIVEN
+    inner = CountingStorage()
+    inner.save("a.png", b"aaa")
+    cache = CachedStorageAdapter(inner, disk_dir=tmp_path)
+
+    # WHEN
+    for _ in range(5):
+        assert cache.load("a.png") == b"aaa"
+
+    # THEN
+    assert inner.loads == 1
+    assert cache.stats()["memory_hits"] == 4
+    assert cache.stats()["hit_rate"] == 0.8
+
+
+def test_memory_budget_demotes_to_disk(tmp_path):
+    """
+    Given: A memory budget that fits only one object
+    When: Two objects are loaded
+    Then: The older one is served from disk without another inner read
+    """
+    # GIVEN
+    inner = CountingStorage()
+    inner.save("a.png", b"a" * 10)
+    inner.save("b.png", b"b" * 10)
+    cache = CachedStorageAdapter(inner, memory_budget_bytes=10, disk_dir=tmp_path)
+
+    # WHEN
+    cache.load("a.png")
+    cache.load("b.png")
+
+    # THEN
+    assert cache.load("a.png") == b"a" * 10
+    assert inner.loads == 2
+    assert cache.stats()["disk_hits"] == 1
+
+
+def test_save_invalidates_and_stale_entries_revalidate(tmp_path):
+    """
+    Given: A cached object
+    When: It is overwritten via save, or goes stale
+    Then: New bytes are served, and unchanged stale objects are revalidated (304)
+    """
+    # GIVEN
+    inner = CountingStorage()
+    cache = CachedStorageAdapter(inner, disk_dir=tmp_path, revalidate_after=0)
+    cache.save("a.png", b"v1")
+    assert cache.load("a.png") == b"v1"
+
+    # WHEN: overwritten
+    cache.save("a.png", b"v2")
+
+    # THEN
+    assert cache.load("a.png") == b"v2"
+
+    # WHEN: stale but unchanged
+    assert cache.load("a.png") == b"v2"
+
+    # THEN
+    assert cache.stats()["not_modified"] == 1
+
+
+def test_disk_tier_is_reused_after_restart(tmp_path):
+    """
+    Given: An object demoted to the disk tier by one cache instance
+    When: A new instance on the same directory loads it
+    Then: The file is kept, revalidated with its ETag (304), and served from disk
+    """
+    # GIVEN
+    inner = CountingStorage()
+    inner.save("a.png", b"a" * 10)
+    inner.save("b.png", b"b" * 10)
+    first = CachedStorageAdapter(inner, memory_budget_bytes=10, disk_dir=tmp_path)
+    first.load("a.png")
+    first.load("b.png")
+
+    # WHEN
+    second = CachedStorageAdapter(inner, memory_budget_bytes=10, disk_dir=tmp_path)
+
+    # THEN
+    assert second.stats()["disk_entries"] == 1
+    assert second.load("a.png") == b"a" * 10
+    assert second.stats()["disk_hits"] == 1
+    assert second.stats()["not_modified"] == 1
+
+
+def test_empty_object_demoted_without_disk_tier():
+    """
+    Given: A cache without a disk directory holding an empty object in memory
+    When: Later loads exceed the memory budget and demote it
+    Then: It is dropped (no disk tier) instead of failing
+    """
+    # GIVEN
+    inner = CountingStorage()
+    inner.save("empty.txt", b"")
+    inner.save("x.png", b"x" * 5)
+    inner.save("y.png", b"y" * 6)
+    cache = CachedStorageAdapter(inner, memory_budget_bytes=10)
+    cache.load("empty.txt")
+
+    # WHEN
+    cache.load("x.png")
+    cache.load("y.png")
+
+    # THEN
+    assert cache.load("empty.txt") == b""
+    assert cache.stats()["disk_entries"] == 0
+
+
+def test_oversize_disk_hits_are_not_promoted(tmp_path):
+    """
+    Given: Five small objects in memory and one object larger than the memory budget
+    When: The large object is read repeatedly
+    Then: It is served from disk each time and the small objects stay in memory
+    """
+    # GIVEN
+    inner = CountingStorage()
+    for i in range(5):
+        inner.save(f"small-{i}.png", bytes([i]) * 10)
+    inner.save("big.png", b"b" * 200)
+    cache = CachedStorageAdapter(inner, memory_budget_bytes=100, disk_dir=tmp_path)
+    for i in range(5):
+        cache.load(f"small-{i}.png")
+
+    # WHEN
+    for _ in range(3):
+        assert cache.load("big.png") == b"b" * 200
+
+    # THEN
+    stats = cache.stats()
+    assert (stats["memory_entries"], stats["disk_entries"]) == (5, 1)
+    assert stats["disk_hits"] == 2
+    assert inner.loads == 6
+
+
+def test_promoted_disk_files_stay_for_other_processes(tmp_path):
+    """
+    Given: An object demoted to the shared disk directory
+    When: It is read back (promoted to memory)
+    Then: Its file is still on disk for other processes
+    """
+    inner = CountingStorage()
+    inner.save("a.png", b"a" * 10)
+    inner.save("b.png", b"b" * 10)
+    cache = CachedStorageAdapter(inner, memory_budget_bytes=10, disk_dir=tmp_path)
+    cache.load("a.png")
+    cache.load("b.png")
+
+    cache.load("a.png")
+
+    other = CachedStorageAdapter(inner, memory_budget_bytes=10, disk_dir=tmp_path)
+    assert other.stats()["disk_entries"] == 2
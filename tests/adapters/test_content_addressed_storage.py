@@ -0,0 +1,144 @@
+"""
+Adapter Tests: ContentAddressedStorageAdapter
+
+Deduplication and refcounting over the in-memory fake store.
+"""
+import shutil
+
+import pytest
+
+from app.adapters.storage.content_addressed import REF_DB_NAME, ContentAddressedStorageAdapter
+from app.adapters.storage.fake import FakeStorageAdapter
+from app.adapters.storage.local_fs import LocalFSStorageAdapter
+
+
+class CountingStorage(FakeStorageAdapter):
+    """Fake store that counts uploads."""
+
+    def __init__(self):
+        super().__init__()
+        self.saves = 0
+
+    def save(self, path, content):
+        self.saves += 1
+        return super().save(path, content)
+
+
+def test_identical_content_is_uploaded_once(tmp_path):
+    """
+    Given: A content-addressed store
+    When: The same bytes are saved under two paths (e.g., a seed uploaded twice)
+    Then: One blob is uploaded and both paths load it
+    """
+    # GIVEN
+    inner = CountingStorage()
+    storage = ContentAddressedStorageAdapter(inner, ref_db_path=tmp_path / "refs.db")
+
+    # WHEN
+    uri_1 = storage.save("brand/soap/seeds/photo.png", b"same-bytes")
+    uri_2 = storage.save("brand/soap/seeds/photo-copy.png", b"same-bytes")
+    with storage.open_write("brand/soap/seeds/photo-stream.png") as out:
+        out.write(b"same-bytes")
+
+    # THEN
+    assert inner.saves == 2  # Store marker + one blob
+    assert (uri_1, uri_2, out.uri) == (
+        "brand/soap/seeds/photo.png",
+        "brand/soap/seeds/photo-copy.png",
+        "brand/soap/seeds/photo-stream.png",
+    )
+    assert storage.load("brand/soap/seeds/photo-copy.png") == b"same-bytes"
+    assert storage.list("brand/soap/") == [
+        "brand/soap/seeds/photo-copy.png",
+        "brand/soap/seeds/photo-stream.png",
+        "brand/soap/seeds/photo.png",
+    ]
+    assert storage.stats() == {
+        "paths": 3,
+        "blobs": 1,
+        "logical_bytes": 30,
+        "stored_bytes": 10,
+    }
+
+
+def test_overwrite_releases_old_blob(tmp_path):
+    """
+    Given: A path pointing at a blob
+    When: The path is overwritten with different bytes
+    Then: The old blob's refcount drops to zero and it is reported as orphaned
+    """
+    storage = ContentAddressedStorageAdapter(FakeStorageAdapter(), ref_db_path=tmp_path / "refs.db")
+    storage.save("a.png", b"v1")
+
+    storage.save("a.png", b"v2")
+
+    assert storage.load("a.png") == b"v2"
+    assert len(storage.orphans()) == 1
+    with pytest.raises(FileNotFoundError):
+        storage.load("missing.png")
+
+
+class ExistsCountingStorage(CountingStorage):
+    """Counting store that also counts existence checks."""
+
+    def __init__(self):
+        super().__init__()
+        self.exists_calls = 0
+
+    def exists(self, path):
+        self.exists_calls += 1
+        return super().exists(path)
+
+
+def test_known_blobs_are_trusted_and_unknown_ones_looked_up(tmp_path):
+    """
+    Given: A store whose blobs outlived their reference table
+    When: Known bytes are saved again, then bytes only the store has are saved
+    Then: The known digest costs no store round trip, and the blob the store
+          already holds is linked without being uploaded again
+    """
+    # GIVEN
+    inner = ExistsCountingStorage()
+    ContentAddressedStorageAdapter(inner, ref_db_path=tmp_path / "old.db").save("old.png", b"kept-bytes")
+    storage = ContentAddressedStorageAdapter(inner, ref_db_path=tmp_path / "refs.db")
+    storage.save("a.png", b"bytes")
+    saves, exists_calls = inner.saves, inner.exists_calls
+
+    # WHEN
+    storage.save("b.png", b"bytes")
+    storage.save("c.png", b"kept-bytes")
+
+    # THEN
+    assert inner.saves == saves
+    assert inner.exists_calls == exists_calls + 1  # Only for the digest the table did not know
+    assert storage.load("b.png") == b"bytes"
+    assert storage.load("c.png") == b"kept-bytes"
+
+
+def test_wiped_store_resets_the_reference_table(tmp_path):
+    """
+    Given: A local store with the reference table at its default location
+    When: The store directory is wiped and the adapter is recreated
+    Then: The table lives inside the store, and no stale paths survive the wipe
+    """
+    # GIVEN
+    root = tmp_path / "assets"
+    storage = ContentAddressedStorageAdapter(LocalFSStorageAdapter(root=root))
+    storage.save("a.png", b"bytes")
+    assert (root / REF_DB_NAME).exists()
+
+    # WHEN: wiped with the table (make clean)
+    shutil.rmtree(root)
+    storage = ContentAddressedStorageAdapter(LocalFSStorageAdapter(root=root))
+
+    # THEN
+    assert storage.list("") == []
+
+    # WHEN: blobs wiped but the table kept (e.g. dropped MinIO volume)
+    ContentAddressedStorageAdapter(FakeStorageAdapter(), ref_db_path=tmp_path / "refs.db").save("a.png", b"bytes")
+    storage = ContentAddressedStorageAdapter(FakeStorageAdapter(), ref_db_path=tmp_path / "refs.db")
+
+    # THEN
+    assert storage.list("") == []
+    with pytest.raises(FileNotFoundError):
+        storage.load("a.png")
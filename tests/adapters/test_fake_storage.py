@@ -0,0 +1,83 @@
+"""
+Adapter Tests: FakeStorageAdapter
+
+Prefix index, memory budget and spill behaviour of the in-memory engine.
+"""
+import gc
+
+import pytest
+
+from app.adapters.storage.fake import FakeStorageAdapter
+
+
+def test_list_uses_sorted_prefix_index():
+    """
+    Given: Keys saved in arbitrary order
+    When: Listing by prefix
+    Then: Only matching keys are returned, sorted
+    """
+    storage = FakeStorageAdapter()
+    for key in ["soap/b.png", "gel/a.png", "soap/a.png", "soapy/a.png"]:
+        storage.save(key, b"x")
+    storage.save("soap/a.png", b"overwrite")
+
+    assert storage.list("soap/") == ["soap/a.png", "soap/b.png"]
+    assert storage.list("") == ["gel/a.png", "soap/a.png", "soap/b.png", "soapy/a.png"]
+    assert storage.stats()["objects"] == 4
+
+
+def test_memory_budget_spills_least_recently_used(tmp_path):
+    """
+    Given: A budget that fits two objects and a spill directory
+    When: A third object is saved
+    Then: The least recently used object spills to disk and stays loadable
+    """
+    storage = FakeStorageAdapter(memory_budget_bytes=20, spill_dir=tmp_path)
+    storage.save("a", b"a" * 10)
+    storage.save("b", b"b" * 10)
+    storage.load("a")  # "b" is now least recently used
+
+    storage.save("c", b"c" * 10)
+
+    stats = storage.stats()
+    assert stats["memory_bytes"] == 20
+    assert stats["spilled_objects"] == 1
+    assert storage.load("b") == b"b" * 10
+    assert storage.list("") == ["a", "b", "c"]
+
+
+def test_spill_files_are_private_and_removed_on_close(tmp_path):
+    """
+    Given: Two adapters spilling under the same directory
+    When: Both spill an object stored under the same path, then are closed or dropped
+    Then: Neither sees the other's bytes, and no spill files are left behind
+    """
+    # GIVEN
+    first = FakeStorageAdapter(memory_budget_bytes=5, spill_dir=tmp_path)
+    second = FakeStorageAdapter(memory_budget_bytes=5, spill_dir=tmp_path)
+
+    # WHEN
+    first.save("a", b"first-bytes")
+    second.save("a", b"second-bytes")
+
+    # THEN
+    assert (first.load("a"), second.load("a")) == (b"first-bytes", b"second-bytes")
+    first.close()
+    del second
+    gc.collect()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_memory_budget_without_spill_raises():
+    """
+    Given: A budget and no spill directory
+    When: Saving past the budget
+    Then: MemoryError is raised and existing content is untouched
+    """
+    storage = FakeStorageAdapter(memory_budget_bytes=10)
+    storage.save("a", b"a" * 10)
+
+    with pytest.raises(MemoryError):
+        storage.save("b", b"b")
+
+    assert storage.list("") == ["a"]
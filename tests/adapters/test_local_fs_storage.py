@@ -0,0 +1,102 @@
+"""
+Adapter Tests: LocalFSStorageAdapter
+
+Filesystem storage round-trips against a temporary directory.
+"""
+import pytest
+
+from app.adapters.storage.local_fs import LocalFSStorageAdapter
+
+
+def test_save_and_load_round_trip(tmp_path):
+    """
+    Given: A local filesystem storage adapter
+    When: Content is saved and loaded back
+    Then: Bytes match and the file lives in a shard directory
+    """
+    # GIVEN
+    storage = LocalFSStorageAdapter(root=tmp_path)
+
+    # WHEN
+    uri = storage.save("lavender-soap/en-US/1x1/asset-1.png", b"png-bytes")
+
+    # THEN
+    assert uri.startswith("file://")
+    assert storage.load("lavender-soap/en-US/1x1/asset-1.png") == b"png-bytes"
+    assert storage.exists("lavender-soap/en-US/1x1/asset-1.png")
+    shard_dirs = list((tmp_path / "lavender-soap" / "en-US" / "1x1").iterdir())
+    assert len(shard_dirs) == 1 and shard_dirs[0].is_dir()
+
+
+def test_list_hides_shards_and_filters_prefix(tmp_path):
+    """
+    Given: Assets saved under several products
+    When: Listing by prefix
+    Then: Logical paths are returned without shard directories
+    """
+    # GIVEN
+    storage = LocalFSStorageAdapter(root=tmp_path)
+    storage.save("lavender-soap/en-US/1x1/a.png", b"a")
+    storage.save("lavender-soap/es-US/1x1/b.png", b"b")
+    storage.save("citrus-gel/en-US/1x1/c.png", b"c")
+
+    # WHEN / THEN
+    assert storage.list("lavender-soap/") == [
+        "lavender-soap/en-US/1x1/a.png",
+        "lavender-soap/es-US/1x1/b.png",
+    ]
+    assert storage.list("lavender-soap/en") == ["lavender-soap/en-US/1x1/a.png"]
+    assert len(storage.list("")) == 3
+
+
+def test_missing_and_invalid_paths(tmp_path):
+    """
+    Given: An empty store
+    When: Loading missing or escaping paths
+    Then: FileNotFoundError / ValueError are raised
+    """
+    storage = LocalFSStorageAdapter(root=tmp_path)
+
+    with pytest.raises(FileNotFoundError):
+        storage.load("missing.png")
+    with pytest.raises(ValueError):
+        storage.save("../escape.png", b"x")
+
+
+def test_url_for_returns_file_uri(tmp_path):
+    """
+    Given: A saved asset
+    When: Asking for its URL
+    Then: A file:// URI pointing at the sharded file is returned
+    """
+    storage = LocalFSStorageAdapter(root=tmp_path)
+    storage.save("soap/a.png", b"a")
+
+    url = storage.url_for("soap/a.png", ttl=60)
+
+    assert url.startswith("file://") and url.endswith("/a.png")
+    with pytest.raises(FileNotFoundError):
+        storage.url_for("soap/missing.png")
+
+
+def test_open_write_commits_on_close_and_aborts_on_error(tmp_path):
+    """
+    Given: A streaming writer
+    When: The context exits cleanly, or with an exception
+    Then: Content is committed atomically, or nothing is left behind
+    """
+    storage = LocalFSStorageAdapter(root=tmp_path)
+
+    with storage.open_write("soap/a.png") as out:
+        out.write(b"chunk-1,")
+        out.write(b"chunk-2")
+    assert out.uri.startswith("file://")
+    with storage.open_read("soap/a.png") as f:
+        assert f.read() == b"chunk-1,chunk-2"
+
+    with pytest.raises(RuntimeError):
+        with storage.open_write("soap/b.png") as out:
+            out.write(b"partial")
+            raise RuntimeError("encoder failed")
+    assert not storage.exists("soap/b.png")
+    assert storage.list("soap/") == ["soap/a.png"]
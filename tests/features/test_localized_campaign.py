@@ -100,5 +100,54 @@ def test_localized_campaign_generation():
     assert result["summary"]["validation_failed"] == 0
 
 
+
+@pytest.mark.acceptance
+def test_multiple_briefs_share_one_brand_load():
+    """
+    Given: Three briefs for the same brand and a cached brand repository
+    When: I run them together
+    Then: Each brief gets its own result, and the brand is loaded from the store once
+    """
+    from app.adapters.ai.fake import FakeAIAdapter
+    from app.adapters.storage.fake import FakeStorageAdapter
+    from app.infrastructure.repositories.brand.cached import CachedBrandRepository
+    from app.infrastructure.repositories.brand.in_memory import InMemoryBrandRepository
+    from app.use_cases.generate_campaign_uc import GenerateCampaignUC
+    from app.use_cases.validate_campaign_uc import ValidateCampaignUC
+    from app.interface_adapters.orchestrators.campaign_orchestrator import CampaignOrchestrator
+
+    # GIVEN
+    briefs = [
+        CampaignBrief(
+            brief_id=f"multi-{i}",
+            brand_id="natural-suds-co",
+            campaign_slogan="Pure Nature",
+            target_region="North America",
+            target_audience="Everyone",
+            target_locales=["en-US"],
+            products=[Product(name="Lavender Soap", palette_words=["calming"])],
+            aspects=["1:1"],
+            created_at=datetime.now(),
+        )
+        for i in range(3)
+    ]
+    brand_repo = CachedBrandRepository(InMemoryBrandRepository())
+    orchestrator = CampaignOrchestrator(
+        GenerateCampaignUC(ai_adapter=FakeAIAdapter(), storage_adapter=FakeStorageAdapter()),
+        ValidateCampaignUC(),
+        brand_repo,
+    )
+
+    # WHEN
+    results = orchestrator.generate_campaigns(briefs)
+    orchestrator.generate_campaign(briefs[0])
+
+    # THEN
+    assert [r["brief_id"] for r in results] == ["multi-0", "multi-1", "multi-2"]
+    assert all(r["summary"]["total_assets"] == 1 for r in results)
+    assert brand_repo.stats()["misses"] == 1
+    assert brand_repo.stats()["hits"] == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
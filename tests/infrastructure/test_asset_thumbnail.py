@@ -0,0 +1,28 @@
+"""
+Infrastructure Tests: vectorization thumbnails
+"""
+from io import BytesIO
+
+from PIL import Image
+
+from app.infrastructure.repositories.asset.thumbnail import make_thumbnail
+
+
+def test_thumbnail_is_clip_sized_and_small():
+    """
+    Given: A full-size 16:9 PNG
+    When: A vectorization thumbnail is built
+    Then: It is a 224x224 JPEG, much smaller than the source
+    """
+    # GIVEN
+    source = BytesIO()
+    Image.effect_noise((768, 432), 64).convert("RGBA").save(source, format="PNG")
+
+    # WHEN
+    thumbnail = make_thumbnail(source.getvalue())
+
+    # THEN
+    image = Image.open(BytesIO(thumbnail))
+    assert image.format == "JPEG"
+    assert image.size == (224, 224)
+    assert len(thumbnail) < len(source.getvalue()) / 10
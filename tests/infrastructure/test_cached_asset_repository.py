@@ -0,0 +1,117 @@
+"""
+Infrastructure Tests: CachedAssetRepository and TTLCache
+
+Query caching with precise invalidation over the in-memory repository.
+"""
+from app.infrastructure.cache import TTLCache
+from app.infrastructure.repositories.asset.cached import CachedAssetRepository
+from app.infrastructure.repositories.asset.in_memory import InMemoryAssetRepository
+from tests.infrastructure.test_in_memory_asset_repository import make_asset
+
+
+class CountingAssetRepository(InMemoryAssetRepository):
+    """In-memory repository that counts lookups reaching it."""
+
+    def __init__(self):
+        super().__init__()
+        self.queries = 0
+
+    def find_existing(self, *args, **kwargs):
+        self.queries += 1
+        return super().find_existing(*args, **kwargs)
+
+    def find_seeds(self, *args, **kwargs):
+        self.queries += 1
+        return super().find_seeds(*args, **kwargs)
+
+    def get_by_id(self, *args, **kwargs):
+        self.queries += 1
+        return super().get_by_id(*args, **kwargs)
+
+
+def test_repeat_lookups_are_served_from_cache():
+    """
+    Given: A cached repository with one indexed asset
+    When: The same reuse lookup runs twice and the caller mutates the result
+    Then: The inner repository is queried once and the cached copy is unchanged
+    """
+    # GIVEN
+    inner = CountingAssetRepository()
+    inner.upsert(make_asset("a1"))
+    repo = CachedAssetRepository(inner)
+
+    # WHEN
+    first = repo.find_existing("Lavender Soap", "1:1", "en-US", limit=1)
+    first[0].message = "Mutated by caller"
+    second = repo.find_existing("Lavender Soap", "1:1", "en-US", limit=1)
+
+    # THEN
+    assert inner.queries == 1
+    assert second[0].message == "Pure Nature"
+    assert repo.stats()["hit_rate"] == 0.5
+
+
+def test_upsert_invalidates_only_matching_entries():
+    """
+    Given: Cached lookups for two products and a brand's seeds
+    When: An asset for one product/aspect/locale is upserted
+    Then: Only that product's reuse lookup goes back to the inner repository
+    """
+    # GIVEN
+    inner = CountingAssetRepository()
+    repo = CachedAssetRepository(inner)
+    repo.find_existing("Lavender Soap", "1:1", "en-US")
+    repo.find_existing("Citrus Gel", "1:1", "en-US")
+    repo.find_seeds("natural-suds-co", product_name="Lavender Soap")
+    assert inner.queries == 3
+
+    # WHEN
+    repo.upsert(make_asset("a1"), tags=["generated"])
+
+    # THEN
+    assert [a.asset_id for a in repo.find_existing("Lavender Soap", "1:1", "en-US")] == ["a1"]
+    repo.find_existing("Citrus Gel", "1:1", "en-US")
+    repo.find_seeds("natural-suds-co", product_name="Lavender Soap")
+    assert inner.queries == 4
+
+    # Seed uploads invalidate the brand's seed lookups
+    repo.upsert(make_asset("seed-1"), tags=["seed", "uploaded"])
+    assert [s.asset_id for s in repo.find_seeds("natural-suds-co", product_name="Lavender Soap")] == ["seed-1"]
+
+
+def test_ttl_cache_expires_and_evicts_lru():
+    """
+    Given: A TTL cache with two slots and a controllable clock
+    When: Entries age past the TTL, or a third entry is stored
+    Then: Expired and least recently used entries are dropped
+    """
+    now = [0.0]
+    cache = TTLCache(max_entries=2, ttl_seconds=10, clock=lambda: now[0])
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)  # Evicts "b" (least recently used)
+    assert cache.get("b") is None and cache.get("a") == 1
+
+    now[0] = 11
+    assert cache.get("a") is None
+    assert cache.stats()["expired"] == 1 and cache.stats()["evicted"] == 1
+
+
+def test_exact_lookup_misses_are_cached_until_that_asset_is_written():
+    """
+    Given: A cached repository and an asset_id that is not indexed yet
+    When: It is looked up twice, then upserted and looked up again
+    Then: The miss is served from cache, and the write makes the asset visible
+    """
+    inner = CountingAssetRepository()
+    repo = CachedAssetRepository(inner)
+
+    assert repo.get_by_id("a1") is None
+    assert repo.get_by_id("a1") is None
+    repo.upsert(make_asset("a1"))
+    found = repo.get_by_id("a1")
+
+    assert inner.queries == 2
+    assert found.asset_id == "a1" and found.reused
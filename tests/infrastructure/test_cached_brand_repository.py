@@ -0,0 +1,65 @@
+"""
+Infrastructure Tests: CachedBrandRepository
+
+Brand load caching and bulk loads over the in-memory repository.
+"""
+import dataclasses
+
+from app.infrastructure.repositories.brand.cached import CachedBrandRepository
+from app.infrastructure.repositories.brand.in_memory import InMemoryBrandRepository
+
+
+class CountingBrandRepository(InMemoryBrandRepository):
+    """In-memory repository that counts loads reaching it."""
+
+    def __init__(self):
+        super().__init__()
+        self.loads = []
+
+    def get_by_id(self, brand_id):
+        self.loads.append(("get_by_id", brand_id))
+        return super().get_by_id(brand_id)
+
+    def get_many(self, brand_ids):
+        brand_ids = list(brand_ids)
+        self.loads.append(("get_many", tuple(brand_ids)))
+        return super().get_many(brand_ids)
+
+
+def test_brand_is_loaded_once_until_upserted():
+    """
+    Given: A cached brand repository
+    When: The same brand is loaded repeatedly, then upserted with a new name
+    Then: The inner repository is hit once before the write and once after it
+    """
+    # GIVEN
+    inner = CountingBrandRepository()
+    repo = CachedBrandRepository(inner)
+
+    # WHEN
+    first = repo.get_by_id("natural-suds-co")
+    repo.get_by_id("natural-suds-co")
+    repo.upsert(dataclasses.replace(first, name="Natural Suds"))
+    renamed = repo.get_by_id("natural-suds-co")
+
+    # THEN
+    assert inner.loads == [("get_by_id", "natural-suds-co"), ("get_by_id", "natural-suds-co")]
+    assert renamed.name == "Natural Suds"
+    assert repo.stats()["hits"] == 1
+
+
+def test_get_many_loads_only_uncached_brands_in_one_call():
+    """
+    Given: A cache holding one brand
+    When: get_many asks for it, an unknown brand, and a duplicate id
+    Then: One bulk call loads only the unknown brand, and the miss is cached too
+    """
+    inner = CountingBrandRepository()
+    repo = CachedBrandRepository(inner)
+    repo.get_by_id("natural-suds-co")
+
+    brands = repo.get_many(["natural-suds-co", "unknown-brand", "natural-suds-co"])
+    repo.get_many(["unknown-brand"])
+
+    assert list(brands) == ["natural-suds-co"]
+    assert inner.loads == [("get_by_id", "natural-suds-co"), ("get_many", ("unknown-brand",))]
@@ -0,0 +1,91 @@
+"""
+Infrastructure Tests: DedupService
+
+Perceptual-hash near-duplicate detection with BK-tree lookups.
+"""
+from io import BytesIO
+
+import numpy as np
+from PIL import Image
+
+from app.infrastructure.dedup.bk_tree import BKTree
+from app.infrastructure.dedup.service import DedupService
+
+
+def photo(seed, size=(256, 192), fmt="PNG", quality=95):
+    """Smooth random 'product photo' (blurred noise), encoded."""
+    rng = np.random.default_rng(seed)
+    small = (rng.random((6, 8, 3)) * 255).astype(np.uint8)
+    img = Image.fromarray(small).resize(size, Image.BICUBIC)
+    buf = BytesIO()
+    img.save(buf, format=fmt, quality=quality)
+    return buf.getvalue()
+
+
+def test_reexport_is_detected_as_near_duplicate():
+    """
+    Given: A seed indexed for a brand
+    When: A resized, JPEG re-export of the same photo is checked
+    Then: It matches the original within the threshold
+    """
+    # GIVEN
+    dedup = DedupService(threshold=6)
+    _, match = dedup.check_and_add("natural-suds-co", photo(1), "seed-original")
+    assert match is None
+
+    # WHEN
+    _, match = dedup.check_and_add(
+        "natural-suds-co", photo(1, size=(640, 480), fmt="JPEG", quality=70), "seed-reexport"
+    )
+
+    # THEN
+    assert match is not None
+    assert match.asset_id == "seed-original" and match.distance <= 6
+    assert dedup.stats()["hashes"] == 1  # Duplicate was not indexed
+
+
+def test_different_photos_and_brands_are_not_duplicates():
+    """
+    Given: A seed indexed for one brand
+    When: A different photo, or the same photo for another brand, is checked
+    Then: Neither matches
+    """
+    dedup = DedupService(threshold=6)
+    dedup.check_and_add("brand-a", photo(1), "a-1")
+
+    assert dedup.check_and_add("brand-a", photo(2), "a-2")[1] is None
+    assert dedup.check_and_add("brand-b", photo(1), "b-1")[1] is None
+
+
+def test_removed_assets_no_longer_match():
+    """
+    Given: An indexed asset whose indexing later failed
+    When: It is removed and the same image is checked again
+    Then: No match is reported
+    """
+    dedup = DedupService()
+    phash, _ = dedup.check_and_add("brand-a", photo(3), "a-1")
+
+    dedup.remove("brand-a", "a-1")
+
+    assert dedup.find("brand-a", phash) is None
+
+
+def test_bk_tree_radius_search_matches_linear_scan():
+    """
+    Given: A BK-tree over random 64-bit hashes
+    When: Searching with a radius
+    Then: Results equal a brute-force Hamming scan
+    """
+    rng = np.random.default_rng(0)
+    hashes = [int(h) for h in rng.integers(0, 2**63, size=500, dtype=np.int64)]
+    tree = BKTree()
+    for i, h in enumerate(hashes):
+        tree.add(h, str(i))
+
+    query = hashes[0] ^ 0b1011  # 3 bits away from hashes[0]
+    expected = sorted(
+        ((h ^ query).bit_count(), str(i)) for i, h in enumerate(hashes) if (h ^ query).bit_count() <= 10
+    )
+    assert tree.search(query, 10) == expected
+    assert (3, "0") in expected
@@ -0,0 +1,154 @@
+"""
+Infrastructure Tests: FileBrandRepository
+
+Directory catalog with compiled snapshot and mtime-based reloads.
+"""
+import dataclasses
+import os
+
+import pytest
+
+from app.infrastructure.repositories.brand import file as file_module
+from app.infrastructure.repositories.brand.file import FileBrandRepository
+
+
+BRAND_YAML = """
+brand_id: {brand_id}
+name: {name}
+description: Organic personal care
+colors: ["#8B7355"]
+voice_tone: warm
+target_audiences: [Eco-friendly shoppers]
+created_at: 2025-01-01
+"""
+
+
+def write_brand(directory, brand_id, name, mtime_ns=None):
+    path = directory / f"{brand_id}.yaml"
+    path.write_text(BRAND_YAML.format(brand_id=brand_id, name=name))
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    directory = tmp_path / "brands"
+    directory.mkdir()
+    write_brand(directory, "brand-a", "Brand A")
+    write_brand(directory, "brand-b", "Brand B")
+    (directory / "more.json").write_text(
+        '{"brands": [{"brand_id": "brand-c", "name": "Brand C", "updated_at": "2025-02-01T10:00:00Z"}]}'
+    )
+    return directory, tmp_path / "brands.pickle"
+
+
+def test_loads_yaml_and_json_brands(catalog):
+    """
+    Given: A directory with two YAML brands and a JSON file listing one more
+    When: The repository is created
+    Then: All three brands load, with YAML dates and ISO timestamps parsed
+    """
+    directory, snapshot = catalog
+
+    repo = FileBrandRepository(directory, snapshot_path=snapshot)
+
+    assert repo.list_ids() == ["brand-a", "brand-b", "brand-c"]
+    assert repo.get_by_id("brand-a").created_at.year == 2025
+    assert repo.get_by_id("brand-c").updated_at.month == 2
+    assert list(repo.get_many(["brand-c", "missing"])) == ["brand-c"]
+
+
+def test_cold_start_from_snapshot_parses_nothing(catalog, monkeypatch):
+    """
+    Given: A snapshot written by a previous process
+    When: A new repository starts on the unchanged directory
+    Then: No brand file is parsed, and brands come from the snapshot
+    """
+    directory, snapshot = catalog
+    FileBrandRepository(directory, snapshot_path=snapshot)
+    monkeypatch.setattr(file_module.yaml, "safe_load", lambda raw: pytest.fail("file was re-parsed"))
+
+    repo = FileBrandRepository(directory, snapshot_path=snapshot)
+
+    assert repo.refresh()["parsed"] == 0
+    assert repo.get_by_id("brand-b").name == "Brand B"
+
+
+def test_refresh_reparses_only_changed_and_drops_deleted_files(catalog):
+    """
+    Given: A loaded catalog
+    When: One file is edited, one deleted, and one added
+    Then: Only the edited and added files are parsed, and the deleted brand disappears
+    """
+    # GIVEN
+    directory, snapshot = catalog
+    repo = FileBrandRepository(directory, snapshot_path=snapshot, reload_seconds=0)
+
+    # WHEN
+    write_brand(directory, "brand-a", "Brand A Renamed", mtime_ns=4_000_000_000_000_000_000)
+    (directory / "brand-b.yaml").unlink()
+    write_brand(directory, "brand-d", "Brand D")
+    counts = repo.refresh()
+
+    # THEN
+    assert counts == {"parsed": 2, "unchanged": 1, "removed": 1, "failed": 0, "brands": 3}
+    assert repo.get_by_id("brand-a").name == "Brand A Renamed"
+    assert repo.get_by_id("brand-b") is None
+
+
+def test_upsert_writes_a_file_visible_to_new_processes(catalog):
+    """
+    Given: A catalog repository
+    When: A brand is upserted
+    Then: It is saved as YAML and another repository instance loads it
+    """
+    directory, snapshot = catalog
+    repo = FileBrandRepository(directory, snapshot_path=snapshot)
+
+    repo.upsert(dataclasses.replace(repo.get_by_id("brand-a"), brand_id="brand-e", name="Brand E"))
+
+    assert (directory / "brand-e.yaml").exists()
+    assert FileBrandRepository(directory, snapshot_path=snapshot).get_by_id("brand-e").name == "Brand E"
+
+
+def test_malformed_file_is_skipped_and_keeps_its_last_good_brands(catalog, caplog):
+    """
+    Given: A loaded catalog, plus a new file that is not valid YAML
+    When: An existing file is then half-written (truncated) and the catalog refreshes
+    Then: Both failures are logged, other brands load, and the truncated file's brand keeps its last version
+    """
+    # GIVEN
+    directory, snapshot = catalog
+    (directory / "broken.yaml").write_text("brand_id: [unclosed")
+
+    repo = FileBrandRepository(directory, snapshot_path=snapshot, reload_seconds=0)
+
+    # WHEN
+    (directory / "brand-a.yaml").write_text("brand_id: brand-a\nname")
+    counts = repo.refresh()
+
+    # THEN
+    assert counts["failed"] == 2
+    assert repo.list_ids() == ["brand-a", "brand-b", "brand-c"]
+    assert repo.get_by_id("brand-a").name == "Brand A"
+    assert "broken.yaml" in caplog.text
+
+
+def test_brand_defined_in_two_files_survives_removing_one(catalog):
+    """
+    Given: brand-a defined in its own file and again in a later file
+    When: Either file is removed
+    Then: brand-a is still served, from the remaining file
+    """
+    directory, snapshot = catalog
+    (directory / "zz-override.yaml").write_text(BRAND_YAML.format(brand_id="brand-a", name="Brand A Override"))
+    repo = FileBrandRepository(directory, snapshot_path=snapshot, reload_seconds=0)
+    assert repo.get_by_id("brand-a").name == "Brand A Override"
+
+    (directory / "zz-override.yaml").unlink()
+    assert repo.get_by_id("brand-a").name == "Brand A"
+
+    (directory / "zz-override.yaml").write_text(BRAND_YAML.format(brand_id="brand-a", name="Brand A Override"))
+    (directory / "brand-a.yaml").unlink()
+    assert repo.get_by_id("brand-a").name == "Brand A Override"
@@ -0,0 +1,134 @@
+"""
+Infrastructure Tests: InMemoryAssetRepository
+
+Indexed filters and NumPy vector ranking with the deterministic embedder.
+"""
+from datetime import datetime
+from io import BytesIO
+
+from PIL import Image
+
+from app.entities.creative_asset import CreativeAsset
+from app.infrastructure.repositories.asset.dto import AssetWithImage
+from app.infrastructure.repositories.asset.in_memory import InMemoryAssetRepository
+
+
+def make_asset(asset_id, product="Lavender Soap", aspect="1:1", locale="en-US", message="Pure Nature"):
+    return CreativeAsset(
+        asset_id=asset_id,
+        brief_id="brief-1",
+        brand_id="natural-suds-co",
+        product_name=product,
+        audience="Everyone",
+        locale=locale,
+        aspect_ratio=aspect,
+        message=message,
+        image_url=f"memory://{asset_id}.png",
+        reused=False,
+        generated_at=datetime.now(),
+        meta={"storage_path": f"{asset_id}.png"},
+    )
+
+
+def png(color):
+    buf = BytesIO()
+    Image.new("RGB", (32, 32), color).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def test_find_existing_filters_on_indexed_fields():
+    """
+    Given: Assets across products, aspects and locales
+    When: Searching for one product/aspect/locale
+    Then: Only exact matches come back, as reused copies with a score
+    """
+    # GIVEN
+    repo = InMemoryAssetRepository()
+    repo.upsert_many([
+        AssetWithImage(asset=make_asset("a1"), image_bytes=png("purple")),
+        AssetWithImage(asset=make_asset("a2", aspect="9:16")),
+        AssetWithImage(asset=make_asset("a3", locale="es-US")),
+        AssetWithImage(asset=make_asset("a4", product="Citrus Gel")),
+    ])
+
+    # WHEN
+    found = repo.find_existing("Lavender Soap", "1:1", "en-US", limit=3)
+
+    # THEN
+    assert [a.asset_id for a in found] == ["a1"]
+    assert found[0].reused is True
+    assert found[0].meta["storage_path"] == "a1.png"
+    assert isinstance(found[0].meta["score"], float)
+    assert repo.find_existing("Rose Cream", "1:1") == []
+
+
+
+def test_reused_copies_keep_their_text_box():
+    """
+    Given: An indexed asset whose overlay recorded a text box
+    When: It is fetched by id or found by search
+    Then: Both copies carry the text box, and the stored asset is not aliased
+    """
+    repo = InMemoryAssetRepository()
+    asset = make_asset("a1")
+    asset.meta["text_bbox"] = [10, 20, 200, 60]
+    repo.upsert(asset)
+
+    by_id = repo.get_by_id("a1")
+    (found,) = repo.find_existing("Lavender Soap", "1:1", "en-US")
+
+    assert by_id.meta["text_bbox"] == found.meta["text_bbox"] == [10, 20, 200, 60]
+    by_id.meta["text_bbox"].append(0)
+    assert repo.get_by_id("a1").meta["text_bbox"] == [10, 20, 200, 60]
+
+
+def test_upsert_replaces_row_and_reindexes():
+    """
+    Given: An indexed asset
+    When: The same asset_id is upserted with a different locale
+    Then: The old index entry is dropped and there is still one row
+    """
+    repo = InMemoryAssetRepository()
+    repo.upsert(make_asset("a1"))
+
+    repo.upsert(make_asset("a1", locale="es-US"))
+
+    assert len(repo) == 1
+    assert repo.find_existing("Lavender Soap", "1:1", "en-US") == []
+    assert [a.asset_id for a in repo.find_existing("Lavender Soap", "1:1", "es-US")] == ["a1"]
+
+
+def test_find_existing_ranks_by_similarity_and_limits():
+    """
+    Given: Many candidates for the same key (enough to grow the vector matrix)
+    When: Searching with a small limit
+    Then: Results are sorted by descending score and capped at the limit
+    """
+    repo = InMemoryAssetRepository()
+    repo.upsert_many(AssetWithImage(asset=make_asset(f"a{i}", message=f"slogan {i}")) for i in range(2000))
+
+    found = repo.find_existing("Lavender Soap", "1:1", limit=5)
+
+    scores = [a.meta["score"] for a in found]
+    assert len(found) == 5
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_find_seeds_by_brand_tag_and_product():
+    """
+    Given: Seed uploads and generated assets
+    When: Finding seeds for a brand and product
+    Then: Only seed-tagged assets are returned as SeedAsset DTOs
+    """
+    repo = InMemoryAssetRepository()
+    repo.upsert(make_asset("seed-1"), image_bytes=png("white"), tags=["seed", "uploaded"], palette=["#ffffff"])
+    repo.upsert(make_asset("seed-2", product="Citrus Gel"), tags=["seed", "uploaded"])
+    repo.upsert(make_asset("gen-1"), tags=["generated"])
+
+    seeds = repo.find_seeds("natural-suds-co", product_name="Lavender Soap")
+
+    assert [s.asset_id for s in seeds] == ["seed-1"]
+    assert seeds[0].storage_path == "seed-1.png"
+    assert seeds[0].palette == ["#ffffff"]
+    assert len(repo.find_seeds("natural-suds-co")) == 2
+    assert repo.find_seeds("other-brand") == []
@@ -0,0 +1,43 @@
+"""
+Infrastructure Tests: BrandAsset vector index configuration
+
+HNSW/quantizer settings map to Weaviate config objects.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from app.infrastructure.repositories.asset.index_config import (
+    VectorIndexSettings,
+    hnsw_config,
+    needs_update,
+)
+
+
+def test_hnsw_config_carries_graph_and_quantizer_settings():
+    """
+    Given: HNSW parameters with product quantization
+    When: Building the creation config
+    Then: ef/efConstruction/maxConnections and PQ segments are set
+    """
+    index = VectorIndexSettings(ef=128, ef_construction=256, max_connections=48, quantizer="pq", pq_segments=128)
+
+    config = hnsw_config(index)
+
+    assert (config.ef, config.efConstruction, config.maxConnections) == (128, 256, 48)
+    assert config.quantizer.segments == 128
+
+
+def test_needs_update_only_for_mutable_drift():
+    """
+    Given: A live collection's index config
+    When: Comparing with configured settings
+    Then: An update is needed for ef changes or enabling quantization, not otherwise
+    """
+    current = SimpleNamespace(ef=-1, vector_cache_max_objects=1_000_000, quantizer=None)
+
+    assert not needs_update(VectorIndexSettings(), current)
+    assert needs_update(VectorIndexSettings(ef=64), current)
+    assert needs_update(VectorIndexSettings(quantizer="bq"), current)
+    with pytest.raises(ValueError):
+        VectorIndexSettings(quantizer="zstd")
@@ -0,0 +1,200 @@
+"""
+Infrastructure Tests: WeaviateAssetRepository bring-your-own-vector ingestion
+
+In-process embedding on batch insert and query, against a stub client
+(no Weaviate server needed).
+"""
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+from app.adapters.embedding.fake import HashingEmbeddingAdapter
+from app.infrastructure.repositories.asset.dto import AssetWithImage
+from app.infrastructure.repositories.asset.weaviate import WeaviateAssetRepository
+from tests.infrastructure.test_in_memory_asset_repository import make_asset, png
+
+
+class RecordingEmbedder(HashingEmbeddingAdapter):
+    """Hashing embedder that records batch sizes."""
+
+    def __init__(self):
+        super().__init__(dimensions=32)
+        self.image_batches = []
+
+    def embed_images(self, images):
+        self.image_batches.append(len(images))
+        return super().embed_images(images)
+
+
+class StubBatch:
+    def __init__(self):
+        self.objects = []
+        self.failed_objects = []
+        self.modes = []
+
+    def dynamic(self):
+        self.modes.append(("dynamic",))
+        return self._context()
+
+    def fixed_size(self, batch_size, concurrent_requests):
+        self.modes.append(("fixed_size", batch_size, concurrent_requests))
+        return self._context()
+
+    @contextmanager
+    def _context(self):
+        yield self
+
+    def add_object(self, **kwargs):
+        self.objects.append(kwargs)
+
+
+class StubConnection:
+    def __init__(self):
+        self.hybrid_calls = []
+        stub = self
+        self.client = SimpleNamespace(batch=StubBatch())
+        self.collection = SimpleNamespace(
+            query=SimpleNamespace(
+                hybrid=lambda **kwargs: stub.hybrid_calls.append(kwargs) or SimpleNamespace(objects=[])
+            )
+        )
+
+    def ensure_collection(self, name, create):
+        return self.collection
+
+
+def test_batch_insert_supplies_vectors_embedded_in_batches():
+    """
+    Given: A repository with an in-process embedder and an embedding batch size of 2
+    When: Five assets with images are indexed in one call
+    Then: Images are embedded 2 + 2 + 1 at a time, every object carries its vector,
+          and no thumbnail BLOB is sent for server-side vectorization
+    """
+    # GIVEN
+    embedder = RecordingEmbedder()
+    connection = StubConnection()
+    repo = WeaviateAssetRepository(connection=connection, multi_tenancy=False, embedder=embedder)
+    repo.embedding_batch_size = 2
+    items = [
+        AssetWithImage(asset=make_asset(f"a{i}"), image_bytes=png((i * 40, 0, 0)), tags=["seed"])
+        for i in range(5)
+    ]
+
+    # WHEN
+    failures = repo.upsert_many(items)
+
+    # THEN
+    objects = connection.client.batch.objects
+    assert failures == []
+    assert embedder.image_batches == [2, 2, 1]
+    assert len(objects) == 5
+    assert all(len(obj["vector"]) == 32 for obj in objects)
+    assert all("image" not in obj["properties"] for obj in objects)
+
+
+def test_queries_supply_their_own_vector():
+    """
+    Given: A repository with an in-process embedder
+    When: Searching for reusable assets
+    Then: The hybrid query carries a query vector from the same embedder
+    """
+    embedder = RecordingEmbedder()
+    connection = StubConnection()
+    repo = WeaviateAssetRepository(connection=connection, multi_tenancy=False, embedder=embedder)
+
+    repo.find_existing("Soap", "1:1", brand_id="brand-a")
+
+    (call,) = connection.hybrid_calls
+    assert call["vector"] == embedder.embed_texts([call["query"]])[0].tolist()
+
+
+def test_reused_assets_keep_their_text_box():
+    """
+    Given: An indexed asset whose overlay recorded a text box
+    When: It comes back from a reuse search
+    Then: The text box is restored in meta (validation can re-check its contrast)
+    """
+    # GIVEN
+    connection = StubConnection()
+    repo = WeaviateAssetRepository(connection=connection, multi_tenancy=False, embedder=RecordingEmbedder())
+    asset = make_asset("a1")
+    asset.meta["text_bbox"] = [10, 20, 200, 60]
+    repo.upsert_many([AssetWithImage(asset=asset, image_bytes=png((0, 0, 0)))])
+    (stored,) = connection.client.batch.objects
+    connection.collection.query.hybrid = lambda **kwargs: SimpleNamespace(
+        objects=[SimpleNamespace(properties=stored["properties"], metadata=SimpleNamespace(score=0.9))]
+    )
+
+    # WHEN
+    (found,) = repo.find_existing("Lavender Soap", "1:1", brand_id="natural-suds-co")
+
+    # THEN
+    assert found.meta == {"storage_path": "a1.png", "text_bbox": [10, 20, 200, 60], "score": 0.9}
+
+
+def stub_schema_client(existing_properties):
+    """Client whose collection already exists with `existing_properties`; records added properties."""
+    added, opened = [], []
+    collection = SimpleNamespace(
+        config=SimpleNamespace(
+            get=lambda: SimpleNamespace(
+                properties=[SimpleNamespace(name=name) for name in existing_properties],
+                vector_index_config=None,
+            ),
+            add_property=added.append,
+        )
+    )
+    client = SimpleNamespace(
+        collections=SimpleNamespace(exists=lambda name: True, get=lambda name: opened.append(name) or collection)
+    )
+    return client, added, opened
+
+
+def test_existing_collections_gain_the_text_box_property():
+    """
+    Given: A collection created before overlay text boxes were stored
+    When: The schema is ensured
+    Then: Only the text_bbox property is added, in place
+    """
+    client, added, _ = stub_schema_client(["asset_id", "storage_path", "phash"])
+
+    WeaviateAssetRepository._ensure_schema(client, name="BrandAsset")
+
+    assert [prop.name for prop in added] == ["text_bbox"]
+
+
+def test_schema_migration_stays_on_the_named_collection():
+    """
+    Given: A tenant collection created before any added text property existed
+    When: The schema is ensured for it by name
+    Then: Every added property lands on that collection, opened once under its own name
+    """
+    client, added, opened = stub_schema_client(["asset_id"])
+
+    WeaviateAssetRepository._ensure_schema(client, name="BrandAssetByBrand", multi_tenancy=True)
+
+    assert opened == ["BrandAssetByBrand"]
+    assert [prop.name for prop in added] == ["storage_path", "phash", "text_bbox"]
+
+
+def test_seeds_indexed_without_storage_path_fall_back_to_their_url():
+    """
+    Given: A seed indexed before storage_path existed (empty property, s3:// image_url)
+    When: Seeds are looked up
+    Then: The storage key is recovered from the image URL
+    """
+    connection = StubConnection()
+    repo = WeaviateAssetRepository(connection=connection, multi_tenancy=False, embedder=RecordingEmbedder())
+    legacy = {
+        "asset_id": "seed-1",
+        "brand_id": "natural-suds-co",
+        "product_name": "Lavender Soap",
+        "image_url": "s3://campaign-assets/natural-suds-co/Lavender Soap/seeds/photo.png",
+        "storage_path": "",
+    }
+    connection.collection.query.hybrid = lambda **kwargs: SimpleNamespace(
+        objects=[SimpleNamespace(properties=legacy, metadata=SimpleNamespace(score=0.5))]
+    )
+
+    (seed,) = repo.find_seeds("natural-suds-co", "Lavender Soap")
+
+    assert seed.storage_path == "natural-suds-co/Lavender Soap/seeds/photo.png"
@@ -0,0 +1,234 @@
+"""
+Infrastructure Tests: WeaviateAssetRepository writes and queries
+
+Batch failure mapping, idempotent single upserts, compaction and query
+projections, against
+the stub client from the BYOV tests (no Weaviate server needed).
+"""
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from weaviate.exceptions import UnexpectedStatusCodeError
+
+from app.infrastructure.repositories.asset.dto import AssetWithImage, BatchFailure, SeedAsset
+from app.infrastructure.repositories.asset.weaviate import (
+    EXISTING_ASSET_PROPERTIES,
+    SEED_ASSET_PROPERTIES,
+    WeaviateAssetRepository,
+)
+from tests.infrastructure.test_in_memory_asset_repository import make_asset, png
+from tests.infrastructure.test_weaviate_asset_byov import RecordingEmbedder, StubConnection
+
+
+class StubData:
+    """collection.data: insert fails with `insert_status` when set; records every write."""
+
+    def __init__(self, insert_status=None):
+        self.insert_status = insert_status
+        self.inserted = []
+        self.replaced = []
+        self.deleted = []
+
+    def insert(self, properties, uuid, vector=None):
+        self.inserted.append((uuid, properties, vector))
+        if self.insert_status:
+            raise UnexpectedStatusCodeError("insert failed", httpx.Response(self.insert_status, json={}))
+
+    def replace(self, uuid, properties, vector=None):
+        self.replaced.append((uuid, properties, vector))
+
+    def delete_many(self, where):
+        self.deleted.extend(where.value)
+
+
+def make_repo(connection):
+    return WeaviateAssetRepository(connection=connection, multi_tenancy=False, embedder=RecordingEmbedder())
+
+
+def failed_object(asset_id, message):
+    """Shape of an entry in client.batch.failed_objects."""
+    return SimpleNamespace(object_=SimpleNamespace(properties={"asset_id": asset_id}), message=message)
+
+
+def test_batch_failures_are_reported_per_object():
+    """
+    Given: A batch in which the server rejected one of three objects
+    When: The assets are indexed with upsert_many
+    Then: Every object was sent under its deterministic UUID, and exactly the
+          rejected one comes back as a BatchFailure with the server's message
+    """
+    # GIVEN
+    connection = StubConnection()
+    connection.client.batch.failed_objects = [failed_object("a1", "vectorizer timed out")]
+    repo = make_repo(connection)
+    items = [AssetWithImage(asset=make_asset(f"a{i}"), image_bytes=png((i * 60, 0, 0))) for i in range(3)]
+
+    # WHEN
+    failures = repo.upsert_many(items, batch_size=0)
+
+    # THEN
+    assert failures == [BatchFailure(asset_id="a1", message="vectorizer timed out")]
+    assert [obj["uuid"] for obj in connection.client.batch.objects] == [
+        WeaviateAssetRepository.object_uuid(f"a{i}") for i in range(3)
+    ]
+
+
+def test_fixed_batch_size_uses_concurrent_fixed_size_batches():
+    """
+    Given: A fixed batch size and request concurrency
+    When: Assets are indexed with upsert_many
+    Then: The client's fixed-size batcher is used with both settings
+    """
+    connection = StubConnection()
+
+    failures = make_repo(connection).upsert_many(
+        [AssetWithImage(asset=make_asset("a1"), image_bytes=png((0, 0, 0)))], batch_size=50, concurrent_requests=4
+    )
+
+    assert failures == []
+    assert connection.client.batch.modes == [("fixed_size", 50, 4)]
+
+
+def test_upsert_replaces_an_object_that_already_exists():
+    """
+    Given: A collection that rejects the insert with 422 (the UUID already exists)
+    When: An asset is upserted
+    Then: The object is replaced under the same deterministic UUID, with its vector
+    """
+    # GIVEN
+    connection = StubConnection()
+    connection.collection.data = StubData(insert_status=422)
+    repo = make_repo(connection)
+
+    # WHEN
+    repo.upsert(make_asset("a1"), image_bytes=png((0, 0, 0)))
+
+    # THEN
+    ((inserted_uuid, properties, vector),) = connection.collection.data.inserted
+    assert connection.collection.data.replaced == [(inserted_uuid, properties, vector)]
+    assert inserted_uuid == WeaviateAssetRepository.object_uuid("a1")
+    assert len(vector) == 32
+
+
+def test_upsert_raises_other_insert_errors():
+    """
+    Given: A collection that fails the insert with a 500
+    When: An asset is upserted
+    Then: The error propagates and nothing is replaced
+    """
+    connection = StubConnection()
+    connection.collection.data = StubData(insert_status=500)
+
+    with pytest.raises(UnexpectedStatusCodeError):
+        make_repo(connection).upsert(make_asset("a1"))
+
+    assert connection.collection.data.replaced == []
+
+
+def stored_object(asset_id, object_uuid, created, vector=None):
+    """Object as returned by collection.iterator / fetch_object_by_id."""
+    return SimpleNamespace(
+        uuid=object_uuid,
+        properties={"asset_id": asset_id},
+        metadata=SimpleNamespace(creation_time=created),
+        vector={"default": vector} if vector else {},
+    )
+
+
+def test_compact_rekeys_and_deletes_duplicates():
+    """
+    Given: a1 stored twice under random UUIDs, a2 under its deterministic UUID
+           plus a random duplicate, and one object without an asset_id
+    When: The collection is compacted
+    Then: a1's newest copy (and its vector) is re-keyed to the deterministic UUID,
+          every non-canonical copy of a1 and a2 is deleted, and the id-less one is left alone
+    """
+    # GIVEN
+    now = datetime.now()
+    old_a1, new_a1, dup_a2, orphan = (str(uuid.uuid4()) for _ in range(4))
+    canonical_a2 = WeaviateAssetRepository.object_uuid("a2")
+    objects = [
+        stored_object("a1", old_a1, now - timedelta(days=2)),
+        stored_object("a1", new_a1, now - timedelta(days=1), vector=[0.5, 0.5]),
+        stored_object("a2", canonical_a2, now - timedelta(days=3)),
+        stored_object("a2", dup_a2, now),
+        stored_object("", orphan, now),
+    ]
+    connection = StubConnection()
+    connection.collection.data = StubData()
+    connection.collection.iterator = lambda **kwargs: iter(objects)
+    connection.collection.query.fetch_object_by_id = lambda object_uuid, **kwargs: next(
+        obj for obj in objects if obj.uuid == object_uuid
+    )
+    repo = make_repo(connection)
+
+    # WHEN
+    counts = repo.compact()
+
+    # THEN
+    assert counts == {"scanned": 5, "asset_ids": 3, "rekeyed": 1, "deleted": 3}
+    assert connection.collection.data.inserted == [
+        (WeaviateAssetRepository.object_uuid("a1"), {"asset_id": "a1"}, [0.5, 0.5])
+    ]
+    assert sorted(connection.collection.data.deleted) == sorted([old_a1, new_a1, dup_a2])
+
+
+def test_lookups_project_only_the_fields_they_map():
+    """
+    Given: A repository over the stub collection
+    When: Reuse candidates, an exact id and seeds are looked up
+    Then: Each query asks for its projection only, never the image BLOB or vectors
+    """
+    # GIVEN
+    connection = StubConnection()
+    fetches = []
+    connection.collection.query.fetch_object_by_id = lambda object_uuid, **kwargs: fetches.append(kwargs)
+    repo = make_repo(connection)
+
+    # WHEN
+    repo.find_existing("Lavender Soap", "1:1", brand_id="natural-suds-co")
+    repo.get_by_id("a1", brand_id="natural-suds-co")
+    repo.find_seeds("natural-suds-co", "Lavender Soap")
+
+    # THEN
+    existing, seeds = connection.hybrid_calls
+    assert existing["return_properties"] == EXISTING_ASSET_PROPERTIES
+    assert fetches == [{"return_properties": EXISTING_ASSET_PROPERTIES}]
+    assert seeds["return_properties"] == SEED_ASSET_PROPERTIES
+    assert existing["include_vector"] is False and seeds["include_vector"] is False
+    assert "image" not in EXISTING_ASSET_PROPERTIES + SEED_ASSET_PROPERTIES
+
+
+def test_seeds_come_back_as_lightweight_references():
+    """
+    Given: A seed object carrying exactly the seed projection
+    When: Seeds are looked up
+    Then: A SeedAsset DTO is returned with its storage key, palette and score
+    """
+    connection = StubConnection()
+    props = {
+        "asset_id": "seed-1",
+        "brand_id": "natural-suds-co",
+        "product_name": "Lavender Soap",
+        "image_url": "s3://campaign-assets/seeds/seed-1.png",
+        "storage_path": "seeds/seed-1.png",
+        "palette": ["#8B7355"],
+    }
+    connection.collection.query.hybrid = lambda **kwargs: SimpleNamespace(
+        objects=[SimpleNamespace(properties=props, metadata=SimpleNamespace(score=0.7))]
+    )
+
+    seeds = make_repo(connection).find_seeds("natural-suds-co")
+
+    assert seeds == [SeedAsset(
+        asset_id="seed-1",
+        brand_id="natural-suds-co",
+        product_name="Lavender Soap",
+        image_url="s3://campaign-assets/seeds/seed-1.png",
+        storage_path="seeds/seed-1.png",
+        palette=["#8B7355"],
+        score=0.7,
+    )]
@@ -0,0 +1,130 @@
+"""
+Infrastructure Tests: WeaviateAssetRepository multi-tenancy
+
+Lazy per-brand tenants and idle offloading, against a stub collection
+(no Weaviate server needed).
+"""
+from types import SimpleNamespace
+
+from weaviate.classes.tenants import TenantActivityStatus
+
+from app.infrastructure.repositories.asset.weaviate import WeaviateAssetRepository
+
+
+class StubTenants:
+    def __init__(self):
+        self.tenants = {}
+        self.lookups = 0
+        self.deactivated = []
+
+    def get_by_name(self, name):
+        self.lookups += 1
+        return self.tenants.get(name)
+
+    def create(self, tenants):
+        for tenant in tenants:
+            self.tenants[tenant.name] = SimpleNamespace(activity_status=TenantActivityStatus.ACTIVE)
+
+    def activate(self, name):
+        self.tenants[name].activity_status = TenantActivityStatus.ACTIVE
+
+    def deactivate(self, names):
+        self.deactivated.extend(names)
+        for name in names:
+            self.tenants[name].activity_status = TenantActivityStatus.INACTIVE
+
+
+class StubCollection:
+    def __init__(self):
+        self.tenants = StubTenants()
+        self.inserted = []
+        self.queried = []
+
+    def with_tenant(self, name):
+        stub = self
+
+        class Scoped:
+            class data:
+                @staticmethod
+                def insert(properties, uuid, vector=None):
+                    stub.inserted.append((name, properties["asset_id"]))
+
+            class query:
+                @staticmethod
+                def hybrid(**kwargs):
+                    stub.queried.append(name)
+                    return SimpleNamespace(objects=[])
+
+        return Scoped()
+
+
+class StubConnection:
+    def __init__(self):
+        self.collection = StubCollection()
+        self.client = object()
+        self.ensured = []
+
+    def ensure_collection(self, name, create):
+        self.ensured.append(name)
+        return self.collection
+
+
+def make_repo():
+    connection = StubConnection()
+    return WeaviateAssetRepository(connection=connection, multi_tenancy=True), connection
+
+
+def test_tenants_are_created_lazily_and_checked_once():
+    """
+    Given: A multi-tenant asset repository
+    When: Assets for a brand are written several times and queried
+    Then: The brand's tenant is created on first write, looked up once, and queried in isolation
+    """
+    # GIVEN
+    repo, connection = make_repo()
+    asset = SimpleNamespace(
+        asset_id="a1", brand_id="natural-suds-co", product_name="Soap", locale="en-US",
+        aspect_ratio="1:1", message="Hi", image_url="", meta={},
+    )
+
+    # WHEN
+    repo.upsert(asset)
+    repo.upsert(asset)
+    repo.find_existing("Soap", "1:1", "en-US", brand_id="natural-suds-co")
+
+    # THEN
+    assert connection.ensured == ["BrandAssetByBrand"]
+    assert "natural-suds-co" in connection.collection.tenants.tenants
+    assert connection.collection.tenants.lookups == 1
+    assert connection.collection.queried == ["natural-suds-co"]
+
+
+def test_unknown_brand_queries_do_not_create_tenants():
+    """
+    Given: A multi-tenant repository with no tenants
+    When: Searching for a brand that never wrote anything (or without a brand)
+    Then: Nothing is created and no results are returned
+    """
+    repo, connection = make_repo()
+
+    assert repo.find_existing("Soap", "1:1", brand_id="new-brand") == []
+    assert repo.find_existing("Soap", "1:1") == []
+    assert repo.find_seeds("new-brand") == []
+    assert connection.collection.tenants.tenants == {}
+
+
+def test_idle_tenants_are_deactivated_and_reactivated_on_use():
+    """
+    Given: A tenant used by this process
+    When: It stays idle past the threshold and is then used again
+    Then: It is deactivated, and reactivated on its next query
+    """
+    repo, connection = make_repo()
+    tenants = connection.collection.tenants
+    repo._scoped("brand-a")
+
+    assert repo.offload_inactive(idle_seconds=0) == ["brand-a"]
+    assert tenants.tenants["brand-a"].activity_status == TenantActivityStatus.INACTIVE
+
+    repo.find_seeds("brand-a")
+    assert tenants.tenants["brand-a"].activity_status == TenantActivityStatus.ACTIVE
@@ -0,0 +1,87 @@
+"""
+Infrastructure Tests: WeaviateConnectionManager
+
+Repositories share one client and schema checks run once per process.
+Uses a stub client (no Weaviate server needed).
+"""
+from app.infrastructure import weaviate_connection
+from app.infrastructure.repositories.asset.weaviate import WeaviateAssetRepository
+from app.infrastructure.repositories.brand.weaviate import WeaviateBrandRepository
+from app.infrastructure.weaviate_connection import WeaviateConnectionManager
+
+
+class StubCollections:
+    def __init__(self):
+        self.existing = set()
+        self.exists_calls = 0
+
+    def exists(self, name):
+        self.exists_calls += 1
+        return name in self.existing
+
+    def create(self, name, **kwargs):
+        self.existing.add(name)
+
+    def get(self, name):
+        return f"collection:{name}"
+
+
+class StubClient:
+    def __init__(self):
+        self.collections = StubCollections()
+        self.connected = True
+        self.connects = 1
+
+    def is_connected(self):
+        return self.connected
+
+    def connect(self):
+        self.connected = True
+        self.connects += 1
+
+    def close(self):
+        self.connected = False
+
+
+def test_repositories_share_one_client_and_cached_schema(monkeypatch):
+    """
+    Given: A connection manager
+    When: Several asset and brand repositories are constructed
+    Then: One client is opened and each schema is checked once
+    """
+    # GIVEN
+    clients = []
+
+    def connect_to_local(**kwargs):
+        clients.append(StubClient())
+        return clients[-1]
+
+    monkeypatch.setattr(weaviate_connection.weaviate, "connect_to_local", connect_to_local)
+    manager = WeaviateConnectionManager()
+
+    # WHEN
+    for _ in range(3):
+        WeaviateAssetRepository(connection=manager)
+        WeaviateBrandRepository(connection=manager)
+
+    # THEN
+    assert len(clients) == 1
+    assert clients[0].collections.exists_calls == 2
+    assert clients[0].collections.existing == {"BrandAsset", "Brand"}
+
+
+def test_close_is_explicit_and_reconnects_same_client(monkeypatch):
+    """
+    Given: A repository borrowing the shared client
+    When: The manager is closed and the client is used again
+    Then: The same client object reconnects (held collection handles stay valid)
+    """
+    monkeypatch.setattr(weaviate_connection.weaviate, "connect_to_local", lambda **kwargs: StubClient())
+    manager = WeaviateConnectionManager()
+    repo = WeaviateBrandRepository(connection=manager)
+
+    manager.close()
+    assert not repo.client.is_connected()
+
+    assert manager.client is repo.client
+    assert repo.client.is_connected() and repo.client.connects == 2
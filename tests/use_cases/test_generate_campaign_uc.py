@@ -125,7 +125,7 @@ def test_generate_campaign_with_asset_reuse():
 
     # Mock asset repository that returns existing assets
     class FakeAssetRepo:
-        def find_existing(self, product_name, aspect_ratio, locale, limit=1):
+        def find_existing(self, product_name, aspect_ratio, locale, limit=1, brand_id=None):
             # Return existing asset for first combination
             if product_name == "Soap" and aspect_ratio == "1:1" and locale == "en-US":
                 return [
@@ -141,7 +141,7 @@ def test_generate_campaign_with_asset_reuse():
                         image_url="http://existing.com/image.png",
                         reused=True,
                         generated_at=datetime.now(),
-                        meta={},
+                        meta={"score": 0.9},
                     )
                 ]
             return []
@@ -192,5 +192,149 @@ def test_generate_campaign_with_asset_reuse():
     assert assets[0].asset_id == "existing-001"
 
 
+def test_generate_campaign_blocks_locales_with_rejected_copy():
+    """
+    Given: A content policy that rejects the Spanish slogan
+    When: Generate campaign is executed with the validator screening copy
+    Then: No Spanish image is generated or stored; English cells still are
+    """
+    # GIVEN
+    from app.use_cases.validate_campaign_uc import ValidateCampaignUC
+    from app.use_cases.validation.prohibited_words import ContentPolicy
+
+    class CountingAIAdapter(FakeAIAdapter):
+        def __init__(self):
+            super().__init__()
+            self.images_generated = 0
+
+        def generate_image(self, prompt, aspect_ratio, seed_image=None):
+            self.images_generated += 1
+            return super().generate_image(prompt, aspect_ratio, seed_image)
+
+    brief = CampaignBrief(
+        brief_id="test-004",
+        brand_id="test-brand",
+        campaign_slogan="Gift Wellness",
+        target_region="US",
+        target_audience="Test",
+        target_locales=["en-US", "es-US"],
+        products=[Product(name="Soap", palette_words=[])],
+        aspects=["1:1", "9:16"],
+        created_at=datetime.now(),
+    )
+
+    brand = BrandSummary(
+        brand_id="test-brand",
+        name="Test",
+        description="Test",
+        colors=["#000000"],
+        typography="Arial",
+        voice_tone="warm",
+        target_audiences=["All"],
+        target_regions=["US"],
+        products=["Soap"],
+        campaign_slogans=["Gift Wellness"],
+        logo_url=None,
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+
+    ai_adapter = CountingAIAdapter()
+    storage = FakeStorageAdapter()
+    use_case = GenerateCampaignUC(
+        ai_adapter=ai_adapter,
+        storage_adapter=storage,
+        copy_validator=ValidateCampaignUC(policy=ContentPolicy(words={"es": ("bienestar",)})),
+    )
+
+    # WHEN
+    assets = use_case.execute(brief, brand)
+
+    # THEN: Only the 2 English cells were generated
+    assert [a.locale for a in assets] == ["en-US", "en-US"]
+    assert ai_adapter.images_generated == 2
+    assert not any("/es-US/" in path for path in storage.list(""))
+    assert [i.message for i in use_case.blocked_locales["es-US"]] == ["Prohibited word detected: 'bienestar'"]
+
+
+
+def test_generate_campaign_indexes_a_thumbnail_of_the_final_image():
+    """
+    Given: An AI adapter whose overlay draws onto a real 512 px image
+    When: Generate campaign is executed with an asset repository
+    Then: The full-size overlaid PNG is stored, and the repository indexes
+          the 224 px thumbnail emitted by the overlay instead of that PNG
+    """
+    # GIVEN
+    from io import BytesIO
+
+    from PIL import Image
+
+    from app.adapters.ai.openai_image import OpenAIImageAdapter
+    from app.infrastructure.repositories.asset.in_memory import InMemoryAssetRepository
+
+    class OverlayAIAdapter(FakeAIAdapter):
+        def generate_image(self, prompt, aspect_ratio, seed_image=None):
+            out = BytesIO()
+            Image.new("RGB", (512, 512), "#4A6741").save(out, format="PNG")
+            return out.getvalue()
+
+        def overlay_text_to(self, image, text, aspect_ratio, out, thumbnail=None):
+            return OpenAIImageAdapter.overlay_text_to(self, image, text, aspect_ratio, out, thumbnail=thumbnail)
+
+        _draw_overlay = OpenAIImageAdapter._draw_overlay
+
+    class RecordingRepo(InMemoryAssetRepository):
+        def __init__(self):
+            super().__init__()
+            self.indexed = {}
+
+        def upsert_many(self, items):
+            items = list(items)
+            self.indexed.update({item.asset.asset_id: item.image_bytes for item in items})
+            return super().upsert_many(items)
+
+    brief = CampaignBrief(
+        brief_id="test-005",
+        brand_id="test-brand",
+        campaign_slogan="Pure Nature",
+        target_region="US",
+        target_audience="Test",
+        target_locales=["en-US"],
+        products=[Product(name="Soap", palette_words=[])],
+        aspects=["1:1"],
+        created_at=datetime.now(),
+    )
+
+    brand = BrandSummary(
+        brand_id="test-brand",
+        name="Test",
+        description="Test",
+        colors=["#000000"],
+        typography="Arial",
+        voice_tone="warm",
+        target_audiences=["All"],
+        target_regions=["US"],
+        products=["Soap"],
+        campaign_slogans=["Pure Nature"],
+        logo_url=None,
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+
+    storage = FakeStorageAdapter()
+    repo = RecordingRepo()
+    use_case = GenerateCampaignUC(ai_adapter=OverlayAIAdapter(), storage_adapter=storage, asset_repository=repo)
+
+    # WHEN
+    (asset,) = use_case.execute(brief, brand)
+
+    # THEN
+    with Image.open(BytesIO(storage.load(asset.meta["storage_path"]))) as stored:
+        assert (stored.format, stored.size) == ("PNG", (512, 512))
+    with Image.open(BytesIO(repo.indexed[asset.asset_id])) as indexed:
+        assert (indexed.format, indexed.size) == ("JPEG", (224, 224))
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,150 @@
+"""
+Use Case Tests: ReuseEngine
+
+Tier ordering, per-tier score cut-offs, forgetting and metrics over the in-memory asset repository.
+"""
+import dataclasses
+
+import pytest
+
+from app.infrastructure.repositories.asset.in_memory import InMemoryAssetRepository
+from app.use_cases.reuse_engine import DEFAULT_MIN_SCORES, ReuseEngine
+from tests.infrastructure.test_in_memory_asset_repository import make_asset
+
+
+class CountingRepository(InMemoryAssetRepository):
+    """In-memory repository that counts repository round trips."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = {"get_by_id": 0, "find_existing": 0}
+
+    def get_by_id(self, asset_id, brand_id=None):
+        self.calls["get_by_id"] += 1
+        return super().get_by_id(asset_id, brand_id=brand_id)
+
+    def find_existing(self, *args, **kwargs):
+        self.calls["find_existing"] += 1
+        return super().find_existing(*args, **kwargs)
+
+
+def cell(asset_id="new-id", product="Lavender Soap", aspect="1:1", locale="en-US"):
+    return dict(
+        asset_id=asset_id, brand_id="natural-suds-co",
+        product_name=product, aspect_ratio=aspect, locale=locale,
+    )
+
+
+def test_cheapest_tier_resolves_and_later_lookups_stay_local():
+    """
+    Given: A repository holding an asset for a cell, and a cold engine
+    When: The cell is looked up by a new asset_id twice, then by the stored asset_id
+    Then: The first lookup needs the vector tier, the repeat resolves locally,
+          and the exact id resolves without any repository call
+    """
+    # GIVEN
+    repo = CountingRepository()
+    repo.upsert(make_asset("stored-id"))
+    engine = ReuseEngine(repo, min_scores={})
+
+    # WHEN
+    first = engine.find(**cell())
+    second = engine.find(**cell())
+    calls_before_exact = dict(repo.calls)
+    third = engine.find(**cell(asset_id="stored-id"))
+
+    # THEN
+    assert (first.tier, second.tier, third.tier) == ("vector", "local", "exact")
+    assert first.asset.asset_id == second.asset.asset_id == third.asset.asset_id == "stored-id"
+    assert repo.calls == calls_before_exact
+    stats = engine.stats()
+    assert stats["decisions"] == 3
+    assert stats["reuse_rate"] == 1.0
+    assert stats["tiers"]["vector"]["hits"] == 1
+    assert stats["tiers"]["local"]["hits"] == 1
+
+
+def test_vector_hits_below_min_score_are_not_reused():
+    """
+    Given: A stored asset and an engine with an unreachable score cut-off
+    When: A different cell id looks for it
+    Then: Nothing is reused, and every enabled tier recorded a miss
+    """
+    repo = InMemoryAssetRepository()
+    repo.upsert(make_asset("stored-id"))
+    engine = ReuseEngine(repo, min_scores={"vector": 1.01})
+
+    decision = engine.find(**cell())
+
+    assert not decision.reused
+    assert {tier: s["lookups"] for tier, s in engine.stats()["tiers"].items()} == {
+        "exact": 1, "local": 1, "vector": 1,
+    }
+
+
+def test_recorded_assets_are_reused_per_brand_and_returned_as_copies():
+    """
+    Given: An engine without a repository that recorded a generated asset
+    When: The same cell is looked up, the result mutated, and another brand looks it up
+    Then: The owning brand reuses it locally, mutations do not leak, other brands miss
+    """
+    engine = ReuseEngine(tiers=["local"])
+    engine.record(make_asset("generated-id"))
+
+    decision = engine.find(**cell())
+    decision.asset.meta["reuse_tier"] = "local"
+    other = engine.find(**dict(cell(), brand_id="other-brand"))
+
+    assert decision.tier == "local"
+    assert "reuse_tier" not in engine.find(**cell()).asset.meta
+    assert not other.reused
+
+
+def test_unknown_tier_is_rejected():
+    with pytest.raises(ValueError):
+        ReuseEngine(tiers=["exact", "telepathy"])
+
+
+def test_negative_cosine_matches_pass_without_a_cut_off():
+    """
+    Given: An in-memory match with a negative cosine score
+    When: It is looked up with no cut-off, then with a vector-tier cut-off of 0
+    Then: It is reused only without the cut-off
+    """
+    repo = InMemoryAssetRepository()
+    repo.upsert(make_asset("stored-id"))
+    repo.find_existing = lambda **kwargs: [dataclasses.replace(make_asset("stored-id"), meta={"score": -0.2})]
+
+    assert ReuseEngine(repo, tiers=["vector"], min_scores={}).find(**cell()).score == -0.2
+    assert not ReuseEngine(repo, tiers=["vector"], min_scores={"vector": 0.0}).find(**cell()).reused
+
+
+def test_forgotten_assets_are_skipped_by_every_tier_until_recorded_again():
+    """
+    Given: An indexed asset that the engine has already reused
+    When: It is forgotten (failed validation), then regenerated and recorded
+    Then: No tier reuses it in between, and the recorded asset is reused again
+    """
+    repo = InMemoryAssetRepository()
+    repo.upsert(make_asset("stored-id"))
+    engine = ReuseEngine(repo)
+    assert engine.find(**cell(asset_id="stored-id")).reused
+
+    engine.forget("stored-id")
+
+    assert not engine.find(**cell(asset_id="stored-id")).reused
+    engine.record(make_asset("stored-id"))
+    assert engine.find(**cell(asset_id="stored-id")).tier == "exact"
+
+
+def test_default_engine_applies_the_vector_cut_off():
+    """
+    Given: A vector match scoring below the default vector-tier cut-off
+    When: It is looked up by an engine built without min_scores
+    Then: It is not reused
+    """
+    repo = InMemoryAssetRepository()
+    repo.find_existing = lambda **kwargs: [dataclasses.replace(make_asset("stored-id"), meta={"score": 0.5})]
+
+    assert ReuseEngine(repo, tiers=["vector"]).min_scores == DEFAULT_MIN_SCORES
+    assert not ReuseEngine(repo, tiers=["vector"]).find(**cell()).reused
@@ -0,0 +1,106 @@
+"""
+Use Case Tests: Text Contrast
+
+WCAG contrast and background busyness under the slogan's text box.
+"""
+from io import BytesIO
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from app.adapters.ai.openai_image import OpenAIImageAdapter
+from app.adapters.storage.fake import FakeStorageAdapter
+from app.use_cases.validate_campaign_uc import ValidateCampaignUC
+from app.use_cases.validation.contrast import measure_text_region
+from tests.use_cases.test_validate_campaign_uc import make_asset
+
+
+def png(img):
+    buf = BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def overlaid(storage, path, background):
+    """Run the real overlay on a background and store the result; returns the asset."""
+    out = BytesIO()
+    bbox = OpenAIImageAdapter(api_key="test").overlay_text_to(png(background), "Pure Nature", "1:1", out)
+    storage.save(path, out.getvalue())
+    asset = make_asset("Pure Nature", asset_id=path, storage_path=path)
+    asset.meta["text_bbox"] = list(bbox)
+    return asset
+
+
+def test_outlined_overlay_is_legible_on_flat_and_gradient_backgrounds():
+    """
+    Given: The standard outlined overlay on flat gray, white and gradient images
+    When: The campaign is validated
+    Then: The text box is recorded, contrast passes, and no busy-background warning is raised
+    """
+    # GIVEN
+    storage = FakeStorageAdapter()
+    gradient = np.tile(np.linspace(0, 255, 512, dtype=np.uint8)[None, :, None], (512, 1, 3))
+    assets = [
+        overlaid(storage, "gray.png", Image.new("RGB", (512, 512), (128, 128, 128))),
+        overlaid(storage, "white.png", Image.new("RGB", (512, 512), (250, 250, 250))),
+        overlaid(storage, "gradient.png", Image.fromarray(gradient)),
+    ]
+
+    # WHEN
+    results = ValidateCampaignUC(storage_adapter=storage).execute(assets)
+
+    # THEN
+    assert all("text_contrast" in r.checks_run and not r.issues for r in results)
+    assert all(a.meta["text_contrast"] >= 3.0 for a in assets)
+
+
+def test_low_contrast_text_fails_with_a_color_fix():
+    """
+    Given: White text without outline on a light background
+    When: The asset is validated
+    Then: It fails with the contrast ratio and a suggestion to switch to black text
+    """
+    storage = FakeStorageAdapter()
+    img = Image.new("RGB", (400, 100), (220, 220, 220))
+    draw = ImageDraw.Draw(img)
+    font = ImageFont.load_default(size=40)
+    draw.text((10, 20), "Pure Nature", font=font, fill="white")
+    storage.save("light.png", png(img))
+    asset = make_asset("Pure Nature", storage_path="light.png")
+    asset.meta["text_bbox"] = list(draw.textbbox((10, 20), "Pure Nature", font=font))
+
+    (result,) = ValidateCampaignUC(storage_adapter=storage).execute([asset])
+
+    assert not result.is_valid
+    (issue,) = result.issues
+    assert issue.message.startswith("Text contrast 1.")
+    assert issue.fix_suggestion == "Switch the text to black (#000000)"
+
+
+def test_busy_background_warns_with_a_backing_box_fix():
+    """
+    Given: The outlined overlay on random noise
+    When: The text region is measured and validated
+    Then: Busyness is high, and the warning suggests a backing box
+    """
+    storage = FakeStorageAdapter()
+    noise = np.random.default_rng(0).integers(0, 256, (512, 512, 3), dtype=np.uint8)
+    asset = overlaid(storage, "noise.png", Image.fromarray(noise))
+
+    (result,) = ValidateCampaignUC(storage_adapter=storage).execute([asset])
+
+    warnings = [i for i in result.issues if i.severity == "warning"]
+    assert [i.check_name for i in warnings] == ["text_contrast"]
+    assert "backing box" in warnings[0].fix_suggestion
+    assert asset.meta["text_background_std"] > 0.15
+
+
+def test_boxes_outside_the_image_are_skipped():
+    """
+    Given: A text box that lies outside the image
+    When: It is measured
+    Then: No measurement is returned
+    """
+    pixels = np.zeros((100, 100, 3), dtype=np.uint8)
+
+    assert measure_text_region(pixels, (120, 120, 200, 200)) is None
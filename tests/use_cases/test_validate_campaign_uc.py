@@ -0,0 +1,186 @@
+"""
+Use Case Tests: ValidateCampaignUC
+
+Prohibited-word policy: whole-word matching, per-locale lists, memoization.
+Brand color coverage: CIEDE2000 scoring, batching, image-hash cache.
+"""
+from datetime import datetime
+from io import BytesIO
+
+import numpy as np
+from PIL import Image
+
+from app.adapters.storage.fake import FakeStorageAdapter
+from app.entities.brand_summary import BrandSummary
+
+from app.entities.creative_asset import CreativeAsset
+from app.use_cases.validate_campaign_uc import ValidateCampaignUC
+from app.use_cases.validation.brand_colors import ciede2000
+from app.use_cases.validation.prohibited_words import ContentPolicy, matcher_for
+
+
+def make_asset(message, locale="en-US", asset_id="a1", storage_path=None):
+    return CreativeAsset(
+        asset_id=asset_id,
+        brief_id="brief-1",
+        brand_id="natural-suds-co",
+        product_name="Lavender Soap",
+        audience="Everyone",
+        locale=locale,
+        aspect_ratio="1:1",
+        message=message,
+        image_url="memory://a1.png",
+        reused=False,
+        generated_at=datetime.now(),
+        meta={"storage_path": storage_path} if storage_path else {},
+    )
+
+
+def make_brand(colors):
+    return BrandSummary(
+        brand_id="natural-suds-co",
+        name="Natural Suds Co",
+        description="Organic personal care",
+        colors=colors,
+        typography=None,
+        voice_tone="warm",
+        target_audiences=[],
+        target_regions=[],
+        products=[],
+        campaign_slogans=[],
+        logo_url=None,
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+
+
+def split_png(top, bottom, size=256, top_share=0.25):
+    """PNG with `top` color over the first `top_share` of rows and `bottom` below."""
+    img = Image.new("RGB", (size, size), bottom)
+    img.paste(top, (0, 0, size, int(size * top_share)))
+    buf = BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def test_prohibited_words_match_whole_words_only():
+    """
+    Given: The default policy
+    When: Copy contains "carefree" and, separately, "FREE!" and "Guaranteed"
+    Then: "carefree" passes; the standalone word and the prefix entry are flagged
+    """
+    use_case = ValidateCampaignUC()
+
+    clean, flagged = use_case.execute([
+        make_asset("A carefree moment"),
+        make_asset("FREE! Guaranteed softness", asset_id="a2"),
+    ])
+
+    assert clean.is_valid
+    assert not flagged.is_valid
+    assert [i.message for i in flagged.issues] == [
+        "Prohibited word detected: 'free'",
+        "Prohibited word detected: 'guarantee'",
+    ]
+
+
+def test_locale_word_lists_apply_only_to_their_locale():
+    """
+    Given: A policy with a Spanish-only word
+    When: The same copy is validated for es-US and en-US
+    Then: Only the Spanish asset fails
+    """
+    use_case = ValidateCampaignUC(policy=ContentPolicy(words={"*": ("miracle",), "es": ("gratis",)}))
+
+    es, en = use_case.execute([
+        make_asset("Regalo gratis", locale="es-US"),
+        make_asset("Regalo gratis", locale="en-US", asset_id="a2"),
+    ])
+
+    assert not es.is_valid
+    assert en.is_valid
+
+
+def test_duplicate_messages_are_scanned_once_per_policy_version(tmp_path):
+    """
+    Given: A policy loaded from a file, shared by two validators
+    When: The same message is validated for many assets
+    Then: The compiled matcher is shared and the message is scanned once
+    """
+    policy_file = tmp_path / "policy.yaml"
+    policy_file.write_text('words:\n  "*": ["zzz-unique-word"]\n')
+    policy = ContentPolicy.from_file(policy_file)
+
+    first, second = ValidateCampaignUC(policy=policy), ValidateCampaignUC(policy=ContentPolicy.from_file(policy_file))
+    first.execute([make_asset("Pure Nature", asset_id=f"a{i}") for i in range(50)])
+    second.execute([make_asset("Pure Nature")])
+
+    assert first.matcher is second.matcher is matcher_for(policy)
+    assert first.matcher.find.cache_info().misses == 1
+
+
+def test_ciede2000_matches_reference_pairs():
+    """
+    Given: Published CIEDE2000 test pairs (Sharma et al.)
+    When: The vectorized distance is computed for all pairs at once
+    Then: The diagonal matches the reference values
+    """
+    lab1 = np.array([[50.0, 2.6772, -79.7751], [50.0, 2.5, 0.0], [50.0, 0.0, 0.0]])
+    lab2 = np.array([[50.0, 0.0, -82.7485], [73.0, 25.0, -18.0], [50.0, -1.0, 2.0]])
+
+    distances = ciede2000(lab1, lab2)
+
+    assert distances.shape == (3, 3)
+    assert np.allclose(np.diag(distances), [2.0425, 27.1492, 2.3669], atol=1e-4)
+
+
+def test_brand_color_coverage_is_reported_per_asset():
+    """
+    Given: Two stored images: 75% brand brown, and fully off-brand blue
+    When: The campaign is validated with its brand
+    Then: Coverage is recorded on each asset; the off-brand one gets a warning but still passes
+    """
+    # GIVEN
+    storage = FakeStorageAdapter()
+    storage.save("on.png", split_png((255, 255, 255), (0x8B, 0x73, 0x55)))
+    storage.save("off.png", split_png((0, 0, 255), (0, 0, 200)))
+    on_brand = make_asset("Pure Nature", storage_path="on.png")
+    off_brand = make_asset("Pure Nature", asset_id="a2", storage_path="off.png")
+
+    # WHEN
+    on, off = ValidateCampaignUC(storage_adapter=storage).execute(
+        [on_brand, off_brand], brand=make_brand(["#8B7355", "#E6D5B8"])
+    )
+
+    # THEN
+    assert on_brand.meta["brand_color_coverage"] == 0.75
+    assert off_brand.meta["brand_color_coverage"] == 0.0
+    assert "brand_colors" in on.checks_run and not on.issues
+    assert off.is_valid
+    assert [i.severity for i in off.issues if i.check_name == "brand_colors"] == ["warning"]
+
+
+def test_brand_colors_are_scored_once_per_image_hash():
+    """
+    Given: One checker shared by validations, and an undecodable placeholder image
+    When: The same image content is validated repeatedly under different paths
+    Then: It is checked once, and the placeholder simply skips the check
+    """
+    storage = FakeStorageAdapter()
+    image = split_png((255, 255, 255), (0x8B, 0x73, 0x55))
+    for i in range(3):
+        storage.save(f"copy-{i}.png", image)
+    storage.save("placeholder.png", b"not an image")
+    use_case = ValidateCampaignUC(storage_adapter=storage)
+    brand = make_brand(["#8B7355"])
+
+    use_case.execute([make_asset("Hi", asset_id=f"a{i}", storage_path=f"copy-{i}.png") for i in range(3)], brand)
+    results = use_case.execute(
+        [make_asset("Hi", storage_path="copy-0.png"), make_asset("Hi", asset_id="p", storage_path="placeholder.png")],
+        brand,
+    )
+
+    assert use_case.engine.stats()["images_checked"] == 2
+    assert use_case.engine.stats()["cache_hits"] == 3  # Two copies in the first batch, one in the second
+    assert "brand_colors" in results[0].checks_run
+    assert results[1].checks_run == ["prohibited_words"] and results[1].is_valid
@@ -0,0 +1,212 @@
+"""
+Use Case Tests: ValidationEngine
+
+Pluggable checks: shared decode, process pool, fail-fast.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import pytest
+
+from app.adapters.storage.fake import FakeStorageAdapter
+from app.entities.validation_result import ValidationIssue
+from app.use_cases.validation import engine as engine_module
+from app.use_cases.validation.brand_colors import BrandColorsCheck
+from app.use_cases.validation.engine import IN_FLIGHT_PER_WORKER, ValidationEngine
+from app.use_cases.validation.prohibited_words import ContentPolicy, ProhibitedWordsCheck
+from tests.use_cases.test_validate_campaign_uc import make_asset, make_brand, split_png
+
+
+@dataclass(frozen=True)
+class DarkPixelsCheck:
+    """Test check: error when the image's mean brightness is below a threshold."""
+    threshold: float = 100.0
+    name: str = "dark_pixels"
+    inputs: tuple = ("image",)
+    cost: str = "cpu"
+
+    def cache_key(self, asset, brand):
+        return self.threshold
+
+    def run(self, ctx):
+        if ctx.pixels.mean() >= self.threshold:
+            return []
+        return [ValidationIssue(check_name=self.name, severity="error", message="Too dark", fix_suggestion=None)]
+
+
+@dataclass(frozen=True)
+class InlineDarkPixelsCheck(DarkPixelsCheck):
+    """Same check, declared cheap enough to stay in the calling process."""
+    name: str = "inline_dark_pixels"
+    cost: str = "inline"
+
+
+@pytest.fixture
+def campaign():
+    storage = FakeStorageAdapter()
+    assets = []
+    for i in range(12):
+        color = (0x8B, 0x73, 0x55) if i % 2 else (10, 10, 10)
+        storage.save(f"img-{i}.png", split_png((255, 255, 255), color, size=64 + i))
+        assets.append(make_asset("Pure Nature", asset_id=f"a{i}", storage_path=f"img-{i}.png"))
+    return storage, assets
+
+
+def test_image_checks_share_one_decode_per_asset(campaign, monkeypatch):
+    """
+    Given: Two image checks and a campaign of 12 distinct images
+    When: The engine validates them in-process
+    Then: Each image is decoded exactly once, and both checks ran on it
+    """
+    # GIVEN
+    storage, assets = campaign
+    opened = []
+    real_open = engine_module.Image.open
+    monkeypatch.setattr(engine_module.Image, "open", lambda fp: opened.append(1) or real_open(fp))
+    engine = ValidationEngine([BrandColorsCheck(), DarkPixelsCheck()], storage_adapter=storage)
+
+    # WHEN
+    results = engine.run(assets, brand=make_brand(["#8B7355"]))
+
+    # THEN
+    assert len(opened) == 12
+    assert all(r.checks_run == ["brand_colors", "dark_pixels"] for r in results)
+    assert [r.is_valid for r in results] == [i % 2 == 1 for i in range(12)]
+
+
+def test_process_pool_matches_inline_results(campaign):
+    """
+    Given: The same campaign validated inline and with a 2-process pool
+    When: Both engines run
+    Then: Results and coverage metadata are identical, and the pool was used
+    """
+    storage, assets = campaign
+    checks = [ProhibitedWordsCheck(ContentPolicy()), BrandColorsCheck(), DarkPixelsCheck()]
+    brand = make_brand(["#8B7355"])
+
+    inline = ValidationEngine(checks, storage_adapter=storage).run(assets, brand)
+    inline_meta = [dict(a.meta) for a in assets]
+    pooled_engine = ValidationEngine(checks, storage_adapter=storage, workers=2, parallel_min_assets=1)
+    try:
+        pooled = pooled_engine.run(assets, brand)
+    finally:
+        pooled_engine.close()
+
+    assert pooled == inline
+    assert [dict(a.meta) for a in assets] == inline_meta
+    assert pooled_engine.stats()["parallel_batches"] == 1
+
+
+def test_fail_fast_skips_image_work_after_a_copy_error(campaign, monkeypatch):
+    """
+    Given: Fail-fast enabled and copy containing a prohibited word
+    When: The engine validates the asset
+    Then: The image is never loaded, and only the copy check is reported as run
+    """
+    storage, assets = campaign
+    asset = make_asset("Free Gift", storage_path="img-0.png")
+    monkeypatch.setattr(storage, "load", lambda path: pytest.fail("image loaded after a blocking error"))
+    engine = ValidationEngine(
+        [ProhibitedWordsCheck(ContentPolicy()), DarkPixelsCheck()], storage_adapter=storage, fail_fast=True
+    )
+
+    (result,) = engine.run([asset])
+
+    assert result.checks_run == ["prohibited_words"]
+    assert not result.is_valid
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    """Thread pool that records the most tasks outstanding at once."""
+
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.outstanding = 0
+        self.max_outstanding = 0
+        self._count_lock = threading.Lock()
+
+    def submit(self, fn, *args, **kwargs):
+        with self._count_lock:
+            self.outstanding += 1
+            self.max_outstanding = max(self.max_outstanding, self.outstanding)
+        future = super().submit(fn, *args, **kwargs)
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future):
+        with self._count_lock:
+            self.outstanding -= 1
+
+
+def test_images_stream_to_the_pool_with_bounded_work_in_flight(campaign):
+    """
+    Given: A campaign of 12 distinct images and a 2-worker engine
+    When: It is validated through the pool
+    Then: Results match inline validation, and never more than 2 images per worker were in flight
+    """
+    storage, assets = campaign
+    checks = [BrandColorsCheck(), DarkPixelsCheck()]
+    executor = RecordingExecutor()
+    engine = ValidationEngine(checks, storage_adapter=storage, workers=2, parallel_min_assets=1, executor=executor)
+
+    try:
+        pooled = engine.run(assets)
+    finally:
+        executor.shutdown()
+
+    assert pooled == ValidationEngine(checks, storage_adapter=storage).run(assets)
+    assert 0 < executor.max_outstanding <= 2 * IN_FLIGHT_PER_WORKER
+
+
+def test_only_cpu_checks_are_sent_to_the_pool(campaign):
+    """
+    Given: An inline image check and a cpu image check, and a 2-worker engine
+    When: The campaign is validated through the pool
+    Then: Only the cpu check is submitted, and results match in-process validation
+    """
+    # GIVEN
+    storage, assets = campaign
+    checks = [DarkPixelsCheck(), InlineDarkPixelsCheck()]
+    executor = RecordingExecutor()
+    submitted = []
+    real_submit = executor.submit
+    executor.submit = lambda fn, task: submitted.append([c.name for c in task.checks]) or real_submit(fn, task)
+    engine = ValidationEngine(checks, storage_adapter=storage, workers=2, parallel_min_assets=1, executor=executor)
+
+    # WHEN
+    try:
+        pooled = engine.run(assets)
+    finally:
+        executor.shutdown()
+
+    # THEN
+    assert submitted == [["dark_pixels"]] * len(assets)
+    assert pooled == ValidationEngine(checks, storage_adapter=storage).run(assets)
+    assert all(r.checks_run == ["inline_dark_pixels", "dark_pixels"] for r in pooled)
+
+
+def test_cpu_checks_must_take_the_image():
+    """
+    Given: A cpu-cost check that only reads the copy
+    When: An engine is built with it
+    Then: It is rejected, since only image work is sent to the pool
+    """
+    text_only = DarkPixelsCheck(inputs=("text",))
+
+    with pytest.raises(ValueError, match="dark_pixels"):
+        ValidationEngine([text_only])
+
+
+def test_counts_are_per_check_not_per_issue():
+    """
+    Given: A message with two prohibited words
+    When: It is validated
+    Then: One check failed and none passed (the count never goes negative)
+    """
+    engine = ValidationEngine([ProhibitedWordsCheck(ContentPolicy(words={"*": ("free", "gift")}))])
+
+    (result,) = engine.run([make_asset("Free Gift")])
+
+    assert len(result.issues) == 2
+    assert (result.passed_count, result.failed_count) == (0, 1)
@@ -0,0 +1,153 @@
+"""
+Benchmark BrandAsset Vector Index Settings
+
+Measures recall@k vs query latency (and estimated memory) for HNSW / quantizer
+settings on a synthetic, clustered corpus, to size the index before it holds
+millions of assets.
+
+For each quantizer a throwaway collection is created (vectors supplied directly,
+no vectorizer), filled, and queried at several `ef` values. Recall is measured
+against exact NumPy brute-force neighbours.
+
+Run after starting Weaviate:
+    make up
+    python tools/benchmark_vector_index.py --objects 100000 --quantizers none pq bq --ef 64 128 256
+"""
+import argparse
+import time
+
+import numpy as np
+from weaviate.classes.config import Configure, DataType, Property, Reconfigure
+from weaviate.classes.query import MetadataQuery
+
+from app.infrastructure.repositories.asset.index_config import VectorIndexSettings, hnsw_config
+from app.infrastructure.weaviate_connection import WeaviateConnectionManager
+
+
+COLLECTION_PREFIX = "BenchmarkBrandAsset"
+GRAPH_BYTES_PER_LINK = 8  # Two layers of uint64 neighbour ids, amortized
+
+
+def make_corpus(objects: int, queries: int, dim: int, clusters: int, seed: int):
+    """Clustered unit vectors (assets of one product sit close together) plus held-out queries."""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dim)).astype(np.float32)
+    assign = rng.integers(0, clusters, size=objects + queries)
+    data = centers[assign] + 0.35 * rng.standard_normal((objects + queries, dim)).astype(np.float32)
+    data /= np.linalg.norm(data, axis=1, keepdims=True)
+    return data[:objects], data[objects:]
+
+
+def exact_neighbours(corpus: np.ndarray, queries: np.ndarray, k: int, chunk: int = 256) -> np.ndarray:
+    """Ground-truth top-k ids by cosine similarity (chunked brute force)."""
+    result = np.empty((len(queries), k), dtype=np.int64)
+    for start in range(0, len(queries), chunk):
+        scores = queries[start:start + chunk] @ corpus.T
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        result[start:start + chunk] = top
+    return result
+
+
+def estimated_bytes_per_vector(dim: int, max_connections: int, quantizer: str, pq_segments: int) -> int:
+    """In-memory footprint per object (compressed vector + HNSW links)."""
+    vector = {
+        "none": 4 * dim,
+        "pq": pq_segments or dim // 4,
+        "bq": dim // 8,
+        "sq": dim,
+    }[quantizer]
+    return vector + 2 * max_connections * GRAPH_BYTES_PER_LINK
+
+
+def run_quantizer(client, args, quantizer: str, corpus: np.ndarray, queries: np.ndarray, truth: np.ndarray) -> None:
+    name = f"{COLLECTION_PREFIX}_{quantizer}"
+    if client.collections.exists(name):
+        client.collections.delete(name)
+
+    index = VectorIndexSettings(
+        ef_construction=args.ef_construction,
+        max_connections=args.max_connections,
+        quantizer=quantizer,
+        pq_segments=args.pq_segments or None,
+        training_limit=min(args.objects, 100_000) if quantizer in ("pq", "sq") else None,
+    )
+    collection = client.collections.create(
+        name=name,
+        vectorizer_config=Configure.Vectorizer.none(),
+        vector_index_config=hnsw_config(index),
+        properties=[Property(name="i", data_type=DataType.INT)],
+    )
+
+    try:
+        start = time.perf_counter()
+        with collection.batch.fixed_size(batch_size=1000, concurrent_requests=4) as batch:
+            for i, vector in enumerate(corpus):
+                batch.add_object(properties={"i": i}, vector=vector.tolist())
+        build_s = time.perf_counter() - start
+        failed = len(collection.batch.failed_objects)
+
+        per_vector = estimated_bytes_per_vector(args.dim, args.max_connections, quantizer, args.pq_segments)
+        print(f"\n[{quantizer}] indexed {args.objects - failed:,} objects in {build_s:.1f}s "
+              f"({failed} failed); ~{per_vector} B/vector in memory, "
+              f"~{per_vector * args.project / 2**30:.1f} GiB at {args.project:,} objects")
+
+        for ef in args.ef:
+            collection.config.update(vector_index_config=Reconfigure.VectorIndex.hnsw(ef=ef))
+            latencies = []
+            hits = 0
+            for q, expected in zip(queries, truth):
+                t0 = time.perf_counter()
+                result = collection.query.near_vector(
+                    near_vector=q.tolist(),
+                    limit=args.k,
+                    return_properties=["i"],
+                    return_metadata=MetadataQuery(distance=True),
+                )
+                latencies.append(time.perf_counter() - t0)
+                found = {obj.properties["i"] for obj in result.objects}
+                hits += len(found.intersection(expected.tolist()))
+
+            ms = np.array(latencies) * 1000
+            print(f"  ef={ef:<5} recall@{args.k}={hits / truth.size:.3f}  "
+                  f"p50={np.percentile(ms, 50):.2f}ms  p95={np.percentile(ms, 95):.2f}ms")
+    finally:
+        if not args.keep:
+            client.collections.delete(name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--objects", type=int, default=50_000, help="Corpus size")
+    parser.add_argument("--queries", type=int, default=200, help="Held-out query vectors")
+    parser.add_argument("--dim", type=int, default=512, help="Vector dimensions (CLIP ViT-B/32 = 512)")
+    parser.add_argument("--clusters", type=int, default=500, help="Synthetic product clusters")
+    parser.add_argument("--k", type=int, default=10, help="Neighbours per query")
+    parser.add_argument("--quantizers", nargs="+", default=["none", "pq", "bq", "sq"], choices=["none", "pq", "bq", "sq"])
+    parser.add_argument("--ef", nargs="+", type=int, default=[32, 64, 128, 256], help="Query-time ef values")
+    parser.add_argument("--ef-construction", type=int, default=128)
+    parser.add_argument("--max-connections", type=int, default=32)
+    parser.add_argument("--pq-segments", type=int, default=0, help="PQ segments (0 = dim / 4)")
+    parser.add_argument("--project", type=int, default=5_000_000, help="Corpus size for the memory projection")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--keep", action="store_true", help="Keep benchmark collections")
+    args = parser.parse_args()
+
+    print(f"Generating {args.objects:,} x {args.dim} corpus and exact top-{args.k} ground truth...")
+    corpus, queries = make_corpus(args.objects, args.queries, args.dim, args.clusters, args.seed)
+    truth = exact_neighbours(corpus, queries, args.k)
+
+    connection = WeaviateConnectionManager.instance()
+    try:
+        for quantizer in args.quantizers:
+            run_quantizer(connection.client, args, quantizer, corpus, queries, truth)
+    finally:
+        connection.close()
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        print("\nMake sure Weaviate is running: make up")
+        exit(1)